@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The configuration files of the devices backed up by ne_config backup_all.
+
+The files are kept in the backup directory, their contents once below it,
+named by their sha256, and the state of every device in an index:
+
+    <directory>/.ne_store/objects/<sha256>    the contents of the files, read-only, shared by the devices
+    <directory>/.ne_store/<device>.json       { file name: { 'size', 'mtime', 'sha256' } }
+    <directory>/<file name>                   the file, a copy of its content
+
+A file whose remote size and mtime are the ones of the index, and whose copy
+still has the sha256 of the index ( it may have been edited ), is not fetched
+again. Everything is written to a temporary file first and renamed, so an
+interrupted backup leaves the previous files and index as they were. The
+objects no index refers to any more are removed.
+"""
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+
+from ansible.module_utils.network.ne.common_module.local_store import safe_name, read_json, write_json, locked
+
+STORE_DIR = '.ne_store'
+
+
+def file_sha256(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+class BackupStore(object):
+
+    def __init__(self, directory, device):
+        self.directory = directory
+        self.store = os.path.join(directory, STORE_DIR)
+        self.index_path = os.path.join(self.store, safe_name(device) + '.json')
+        self.index = read_json(self.index_path, {})
+        for path in (os.path.join(self.store, 'objects'), os.path.join(self.store, 'tmp')):
+            if not os.path.isdir(path):
+                os.makedirs(path)
+
+    def object_path(self, sha256):
+        return os.path.join(self.store, 'objects', sha256)
+
+    def unchanged(self, remote_file):
+        """
+        :param remote_file: { 'name', 'size', 'mtime' } of the remote file
+        :return: whether the backup of the file is up to date
+        """
+        entry = self.index.get(remote_file['name'])
+        if not entry or entry['size'] != remote_file['size'] or entry['mtime'] != remote_file['mtime']:
+            return False
+        path = os.path.join(self.directory, remote_file['name'])
+        return os.path.isfile(self.object_path(entry['sha256'])) and os.path.isfile(path) \
+            and os.path.getsize(path) == entry['size'] and file_sha256(path) == entry['sha256']
+
+    def temp_path(self, name):
+        """A new temporary file for the content of the file, to be passed to add()"""
+        fd, path = tempfile.mkstemp(dir=os.path.join(self.store, 'tmp'), prefix=safe_name(name) + '.')
+        os.close(fd)
+        return path
+
+    def add(self, remote_file, temp_path):
+        """Move the fetched content into the store and replace the file in the backup directory"""
+        sha256 = file_sha256(temp_path)
+        object_path = self.object_path(sha256)
+        if os.path.isfile(object_path) and file_sha256(object_path) == sha256:
+            os.remove(temp_path)
+        else:
+            os.chmod(temp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.rename(temp_path, object_path)
+        path = os.path.join(self.directory, remote_file['name'])
+        # a copy, editing the file in the backup directory leaves the object as it is
+        copy_path = self.temp_path(remote_file['name'])
+        shutil.copyfile(object_path, copy_path)
+        os.rename(copy_path, path)
+        self.index[remote_file['name']] = {'size': remote_file['size'], 'mtime': remote_file['mtime'],
+                                           'sha256': sha256}
+
+    def save(self):
+        write_json(self.index_path, self.index)
+
+    def commit(self, fetched):
+        """
+        Add the fetched files, save the index and remove the objects no index refers to, under the
+        lock of the store: the objects added by a concurrent backup are not referred to before its save.
+        :param fetched: [ (remote file, temp path) ]
+        """
+        with locked(os.path.join(self.store, 'store')):
+            for remote_file, temp_path in fetched:
+                self.add(remote_file, temp_path)
+            self.save()
+            self.prune()
+
+    def prune(self):
+        """Remove the objects which no index of the store refers to"""
+        referenced = set()
+        for name in os.listdir(self.store):
+            if name.endswith('.json'):
+                index = read_json(os.path.join(self.store, name), {})
+                if isinstance(index, dict):
+                    referenced.update(entry.get('sha256') for entry in index.values() if isinstance(entry, dict))
+        objects = os.path.join(self.store, 'objects')
+        for name in os.listdir(objects):
+            if name not in referenced:
+                os.remove(os.path.join(objects, name))
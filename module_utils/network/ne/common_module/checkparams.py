@@ -3,12 +3,263 @@
 import re
 import logging
 
+# Compiled validators, one per leaf_info (i.e. one per module)
+_VALIDATORS = {}
+# Compiled yang patterns, None if the pattern can not be compiled
+_PATTERNS = {}
+
+# Unicode categories of yang (XSD) patterns which python re does not support
+_PATTERN_CATEGORIES = ((r'\p{N}', r'\d'), (r'\p{L}', r'\w'))
+
+# Operation types whose params are filters, key and mandatory leaves may be omitted
+_FILTER_OPERATIONS = frozenset(['get', 'get-config'])
+# Edit operations which write whole nodes, the others may leave their mandatory leaves out
+_MANDATORY_OPERATIONS = frozenset(['create', 'replace'])
+
+# A step of an operation_specs path: name[key='value']...
+_STEP_RE = re.compile(r'^(?:[\w.-]+:)?([\w.-]+)((?:\[[^\]]*\])*)$')
+_PATH_STEPS_RE = re.compile(r'(?:[^/\[]|\[[^\]]*\])+')
+_PREDICATES_RE = re.compile(r'\[[^\]]*\]')
+_PREDICATE_RE = re.compile(r'\[\s*(?:[\w.-]+:)?([\w.-]+)\s*=\s*([\'"])(.*?)\2\s*\]')
+
+
+def compile_pattern(pattern):
+    """Compile the yang pattern once, yang patterns are implicitly anchored"""
+    if pattern not in _PATTERNS:
+        py_pattern = pattern
+        for category, replacement in _PATTERN_CATEGORIES:
+            py_pattern = py_pattern.replace(category, replacement)
+        try:
+            _PATTERNS[pattern] = re.compile(r'(?:%s)\Z' % py_pattern)
+        except re.error:
+            logging.warning('The pattern %s is not supported and will not be checked.' % pattern)
+            _PATTERNS[pattern] = None
+    return _PATTERNS[pattern]
+
+
+def leaf_value(params):
+    """Get the value of the leaf, get operations wrap the value with get_value"""
+    if isinstance(params, dict):
+        if 'get_value' in params:
+            return params['get_value']
+        return params.get('value')
+    return params
+
+
+def is_leaf(info):
+    """The containers and lists have the children infos, the leaf infos have none"""
+    return not any(isinstance(value, dict) for value in info.values())
+
+
+class LeafCheck(object):
+    """The restrictions of one leaf, compiled from its leaf info"""
+
+    def __init__(self, path, info):
+        self.path = path
+        # the leaf path leading the messages, empty for check_int and check_string
+        self.prefix = path + ': ' if path else ''
+        self.type = info.get('type')
+        self.range = [tuple(item) for item in info.get('range') or []]
+        self.length = [tuple(item) for item in info.get('length') or []]
+        self.pattern = list(info.get('pattern') or [])
+        self.choices = [str(choice) for choice in info.get('choices') or []]
+        self.key = bool(info.get('key'))
+        self.mandatory = bool(info.get('mandatory') or info.get('required'))
+        self._patterns = None
+
+    @property
+    def patterns(self):
+        """The compiled patterns, compiled when the leaf is first given"""
+        if self._patterns is None:
+            self._patterns = [regex for regex in map(compile_pattern, self.pattern) if regex is not None]
+        return self._patterns
+
+    def to_table(self):
+        """The restrictions as a compact leaf info, LeafCheck(path, table) restores the check"""
+        table = {}
+        for name, value in (('type', self.type), ('range', self.range), ('length', self.length),
+                            ('pattern', [pattern for pattern in self.pattern if compile_pattern(pattern)]),
+                            ('choices', self.choices), ('key', self.key), ('mandatory', self.mandatory)):
+            if value:
+                table[name] = value
+        return table
+
+    def check(self, value, errors):
+        """Append the violations of the value to errors"""
+        if value is None or isinstance(value, bool):
+            return
+        if self.range:
+            self.check_range(value, errors)
+        if isinstance(value, str):
+            if self.length:
+                self.check_length(value, errors)
+            if any(not regex.match(value) for regex in self.patterns):
+                errors.append('Error: %sthe input %s format is incorrect.' % (self.prefix, value))
+        if self.choices and str(value) not in self.choices:
+            errors.append('Error: %s%s is not in the choices %s.' % (self.prefix, value, self.choices))
+
+    def check_range(self, value, errors):
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            errors.append('Error: %s%s is not an integer.' % (self.prefix, value))
+            return
+        for low, high in self.range:
+            if int(low) <= number <= int(high):
+                return
+        errors.append('Error: %s%s not in the range %s.' % (
+            self.prefix, value, ' | '.join('%s..%s' % item for item in self.range)))
+
+    def check_length(self, value, errors):
+        for low, high in self.length:
+            if int(low) <= len(value) <= int(high):
+                return
+        errors.append('Error: %sthe length of %s not in the range %s.' % (
+            self.prefix, value, ' | '.join('%s..%s' % item for item in self.length)))
+
+
+class ParamsValidator(object):
+    """The restrictions of a container or list entry, compiled from leaf_info"""
+
+    def __init__(self, leaf_info, path=''):
+        self.path = path
+        self.leaves = []
+        self.children = []
+        for name, info in leaf_info.items():
+            if not isinstance(info, dict):
+                continue
+            if is_leaf(info):
+                self.leaves.append((name, LeafCheck(path + '/' + name, info)))
+            else:
+                self.children.append((name, ParamsValidator(info, path + '/' + name)))
+
+    def to_table(self):
+        """The json serializable tables of the validator, precomputed into the schema artifacts"""
+        return {
+            'leaves': [[name, leaf.to_table()] for name, leaf in self.leaves],
+            'children': [[name, child.to_table()] for name, child in self.children],
+        }
+
+    @classmethod
+    def from_table(cls, table, path=''):
+        """Restore the validator from to_table(), without walking leaf_info again"""
+        validator = cls.__new__(cls)
+        validator.path = path
+        validator.leaves = [(name, LeafCheck(path + '/' + name, info)) for name, info in table['leaves']]
+        validator.children = [(name, cls.from_table(child, path + '/' + name)) for name, child in table['children']]
+        return validator
+
+    def validate(self, params, errors, check_mandatory=True, check_keys=True, operation_paths=(), entry=False):
+        """Walk the params once, list entries included, and collect every violation
+
+        :param check_mandatory: whether the mandatory leaves of the node and below are required
+        :param check_keys: whether the keys of the list entries are required
+        :param operation_paths: the ( remaining steps, operation ) of the operation_specs paths reaching the node
+        :param entry: whether the params are an item of a list, the entry itself or a dict
+                      wrapping it under the name of the entry ( [ { 'entry-name': { ... } } ] )
+        """
+        if isinstance(params, list):
+            for item in params:
+                self.validate(item, errors, check_mandatory, check_keys, operation_paths, True)
+            return errors
+        if not isinstance(params, dict):
+            return errors
+        operation_paths = [(steps, operation) for steps, operation in operation_paths
+                           if match_predicates(steps[0][1], params)]
+        for steps, operation in operation_paths:
+            if len(steps) == 1:
+                check_mandatory = operation in _MANDATORY_OPERATIONS
+        for name, leaf in self.leaves:
+            value = leaf_value(params.get(name))
+            if value is None:
+                if check_keys and entry and leaf.key:
+                    errors.append('Error: %s: the key is missing.' % leaf.path)
+                elif check_mandatory and leaf.mandatory:
+                    errors.append('Error: %s: the mandatory leaf is missing.' % leaf.path)
+                continue
+            leaf.check(value, errors)
+        # the wrapper of an entry has no leaves, the entry is its child
+        child_entry = entry and not self.leaves
+        for name, child in self.children:
+            if params.get(name) is not None:
+                child.validate(params[name], errors, check_mandatory, check_keys,
+                               [(steps[1:], operation) for steps, operation in operation_paths
+                                if len(steps) > 1 and steps[1][0] == name], child_entry)
+        return errors
+
+
+def parse_operation_path(path, root_tag='config'):
+    """
+    :param path: the xpath of an operation_specs entry, e.g. /config/interfaces/interface[name='GE1/0/1']
+    :return: the steps [ (name, { key: value }) ] from the root node, None for the xpaths beyond
+             child steps and key equality predicates
+    """
+    path = path.strip()
+    if '//' in _PREDICATES_RE.sub('', path):
+        return None
+    names = _PATH_STEPS_RE.findall(path)
+    if names and names[0] == root_tag:
+        names = names[1:]
+    steps = []
+    for name in names:
+        match = _STEP_RE.match(name)
+        if not match:
+            return None
+        predicates = match.group(2)
+        keys = dict((key, value) for key, _, value in _PREDICATE_RE.findall(predicates))
+        if _PREDICATE_RE.sub('', predicates):
+            return None
+        steps.append((match.group(1), keys))
+    return steps or None
+
+
+def match_predicates(keys, params):
+    return all(str(leaf_value(params.get(key))) == value for key, value in keys.items())
+
+
+def compile_leaf_info(leaf_info, table=None):
+    """Compile the validator of the module once per process, from the precomputed table if any"""
+    cached = _VALIDATORS.get(id(leaf_info))
+    if cached is None or cached[0] is not leaf_info:
+        validator = ParamsValidator.from_table(table) if table is not None else ParamsValidator(leaf_info)
+        cached = (leaf_info, validator)
+        _VALIDATORS[id(leaf_info)] = cached
+    return cached[1]
+
+
+def fail_on_errors(errors, module):
+    """Report all the violations at once"""
+    if errors:
+        for error in errors:
+            logging.error(error)
+        module.fail_json(msg=' '.join(errors), errors=errors)
+
 
 def check_params(leaf_info, params, module):
-    """Check all input params"""
-    # Other parameters to be added to the synchronization to add
-    # check
-    return
+    """Check all input params.
+
+    Filters ( get, get-config ) need neither keys nor mandatory leaves. A config
+    edit merges by default, so it needs the keys of its list entries and the
+    mandatory leaves of the nodes operation_specs creates or replaces only ( not
+    of the ones it merges, deletes or removes ). The inputs of an rpc need all
+    of them.
+    """
+    validator = compile_leaf_info(leaf_info)
+    operation_type = params.get('operation_type')
+    check_keys = operation_type not in _FILTER_OPERATIONS
+    check_mandatory = check_keys and operation_type != 'config'
+    operation_paths = []
+    if operation_type == 'config':
+        for spec in params.get('operation_specs') or []:
+            steps = parse_operation_path(spec.get('path') or '')
+            if steps:
+                operation_paths.append((steps, spec.get('operation')))
+    errors = []
+    for name, child in validator.children:
+        if params.get(name) is not None:
+            child.validate(params[name], errors, check_mandatory, check_keys,
+                           [(steps, operation) for steps, operation in operation_paths if steps[0][0] == name])
+    fail_on_errors(errors, module)
 
 
 def check_int(v_range, params, module):
@@ -19,14 +270,9 @@ def check_int(v_range, params, module):
     :param module:
     :return:
     '''
-    if params and isinstance(params, dict):
-        params = params["value"]
-    if not params:
-        return
-    for long in v_range:
-        if int(params) < int(long[0]) or int(params) > int(long[1]):
-            logging.error('Error: %s not in the range from %s to %s.' % (params, long[0], long[1]))
-            module.fail_json(msg='Error: %s not in the range from %s to %s.' % (params, long[0], long[1]))
+    errors = []
+    LeafCheck('', {'range': v_range}).check(leaf_value(params), errors)
+    fail_on_errors(errors, module)
 
 
 def check_string(length, pattern, params, module):
@@ -38,17 +284,6 @@ def check_string(length, pattern, params, module):
     :param module:
     :return:
     '''
-    if params and isinstance(params, dict):
-        params = params["value"]
-    if not params:
-        return
-    for long_str in length:
-        if len(params) > long_str[1] or len(params.replace(' ', '')) < long_str[0]:
-            logging.error('Error:%s is not in the range from %d to %d.' % (params, long_str[0], long_str[1]))
-            module.fail_json(
-                msg='Error:%s is not in the range from %d to %d.' % (params, long_str[0], long_str[1]))
-    if pattern:
-        for sub_re in pattern:
-            if not re.match(sub_re, params):
-                logging.error('Error:The input %s format is incorrect' % params)
-                module.fail_json(msg='Error:The input %s format is incorrect' % params)
+    errors = []
+    LeafCheck('', {'length': length, 'pattern': pattern}).check(leaf_value(params), errors)
+    fail_on_errors(errors, module)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Device configurations cached by the cliconf and netconf plugins.
+
+The plugins live in the persistent connection process of the device, which
+outlives the tasks, so a configuration fetched by a task is reused by the next
+tasks of the play. The configurations are keyed by the filter of the fetch (the
+host is the one of the connection), reused for the ttl the reader asks for, and
+all dropped as soon as the connection sends anything which may change the
+configuration.
+"""
+import json
+import time
+
+
+class ConfigCache(object):
+    """{ json of the filter: (fetch time, configuration) }"""
+
+    def __init__(self):
+        self._configs = {}
+
+    @staticmethod
+    def key(*filter_args):
+        return json.dumps(filter_args, sort_keys=True)
+
+    def get(self, key, ttl):
+        """:return: the configuration fetched less than ttl seconds ago, None if there is none"""
+        cached = self._configs.get(key)
+        if not ttl or cached is None or time.time() - cached[0] > ttl:
+            return None
+        return cached[1]
+
+    def put(self, key, config):
+        self._configs[key] = (time.time(), config)
+
+    def invalidate(self):
+        self._configs.clear()
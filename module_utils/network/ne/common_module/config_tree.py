@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The cli configuration ( display current-configuration ) parsed into its sections.
+
+A section is a line and the lines indented below it, the "#" lines only
+separate the sections:
+
+    #
+    aaa
+     local-user admin password irreversible-cipher ...
+     domain default
+      authentication-scheme default
+    #
+    ip vpn-instance vpn1
+     ipv4-family
+    #
+
+The top sections are indexed by the words of their line, so the section and
+contain searches of ne_config are answered from one fetch of the configuration.
+"""
+import re
+
+
+class ConfigSection(object):
+    """A line of the configuration and the sections indented below it"""
+
+    __slots__ = ('line', 'children')
+
+    def __init__(self, line):
+        self.line = line
+        self.children = []
+
+    def write(self, lines):
+        """Append the lines of the section to lines"""
+        lines.append(self.line)
+        for child in self.children:
+            child.write(lines)
+
+
+class ConfigTree(object):
+    """
+    lines:    the lines of the configuration, without the separators
+    sections: the top sections, in the configuration order
+    index:    { word of a top line ( lower case ): [ top sections ] }
+    """
+
+    def __init__(self, text):
+        self.lines = []
+        self.sections = []
+        self.index = {}
+        # the open sections, ( indent, section ) from the top one
+        stack = []
+        for line in text.splitlines():
+            line = line.rstrip()
+            stripped = line.lstrip()
+            if not stripped or stripped == '#':
+                continue
+            self.lines.append(line)
+            indent = len(line) - len(stripped)
+            section = ConfigSection(line)
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            if stack:
+                stack[-1][1].children.append(section)
+            else:
+                self.sections.append(section)
+                for word in set(stripped.lower().split()):
+                    self.index.setdefault(word, []).append(section)
+            stack.append((indent, section))
+
+    def find_sections(self, name):
+        """
+        :param name: the words of the section, e.g. 'aaa', 'bgp', 'interface GigabitEthernet0/1/0'
+        :return: the top sections starting with the words, or if there are none, the top
+                 sections holding them ( 'vpn-instance' finds 'ip vpn-instance vpn1' )
+        """
+        words = name.lower().split()
+        if not words:
+            return []
+        starting = []
+        holding = []
+        for section in self.index.get(words[0], []):
+            line_words = section.line.lower().split()
+            if line_words[:len(words)] == words:
+                starting.append(section)
+            elif any(line_words[i:i + len(words)] == words for i in range(len(line_words))):
+                holding.append(section)
+        return starting or holding
+
+    def section(self, name):
+        """The text of the sections, like display current-configuration configuration <name>"""
+        blocks = []
+        for section in self.find_sections(name):
+            lines = []
+            section.write(lines)
+            blocks.append('\n'.join(lines))
+        if not blocks:
+            return ''
+        return '#\n' + '\n#\n'.join(blocks) + '\n#\nreturn'
+
+    def contain(self, pattern):
+        """The lines matching the regular expression ( the text itself if it is not one ),
+        like display current-configuration | include <pattern>"""
+        try:
+            regex = re.compile(pattern)
+        except re.error:
+            regex = re.compile(re.escape(pattern))
+        return '\n'.join(line for line in self.lines if regex.search(line))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.network.ne.ne import get_plugin_connection, get_nc_config, to_text
+from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase
+from ansible.module_utils.network.ne.common_module.schema import compile_key_list
+from ansible.module_utils.network.ne.common_module.xml_fragments import merge_fragments
+
+try:
+    from .mediator import call_mediator, datastore
+    HAS_MEDIATOR = True
+except ImportError:
+    HAS_MEDIATOR = False
+
+
+class EditBatch(object):
+    """Apply the edits staged by ConfigBase.stage_edit on one device.
+
+    The staged configs are merged, translated and sent as one edit-config, the
+    end state of every module is read back with one merged get and split out
+    per module with its xmlns info list.
+    """
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+        self.conn = get_plugin_connection(module)
+        self.entries = []
+        self.bases = []
+
+    def load(self):
+        try:
+            self.entries = self.conn.get_edit_batch(self.name)
+        except ConnectionError as exc:
+            self.module.fail_json(msg=to_text(exc))
+        for entry in self.entries:
+            base = ConfigBase({}, {}, entry['namespaces'], entry['business_tag'], entry['xml_head'],
+                              entry['xml_tail'], entry['key_list'], module=self.module)
+            base.existing = entry['existing']
+            base.proposed = entry['proposed']
+            self.bases.append(base)
+        return self.entries
+
+    def discard(self):
+        try:
+            return self.conn.discard_edit_batch(self.name)
+        except ConnectionError as exc:
+            self.module.fail_json(msg=to_text(exc))
+
+    def merge(self, field):
+        list_keys = {}
+        for entry in self.entries:
+            list_keys.update(compile_key_list(entry['key_list']).list_keys)
+        try:
+            return merge_fragments([entry[field] for entry in self.entries], list_keys)
+        except ValueError as exc:
+            self.module.fail_json(msg='The staged edits of %s conflict: %s' % (self.name, exc))
+
+    def edit(self):
+        """Send the merged config as one edit-config, or the staged configs one by one
+        when they are not merged, which only takes one commit with the candidate datastore"""
+        if self.module.params.get('merge', True):
+            xml_strs = [self.merge('config')]
+        else:
+            xml_strs = [entry['config'] for entry in self.entries]
+        if HAS_MEDIATOR:
+            xml_strs = [call_mediator('netconf', 'edit-config', self.module.params, xml_str)
+                        .replace('True', 'true').replace('False', 'false') for xml_str in xml_strs]
+        replies = self.bases[0].send_edits(xml_strs)
+        if HAS_MEDIATOR:
+            datastore.update_redis_for_mediator(self.module.params, 'controller')
+            datastore.update_redis_for_mediator(self.module.params, 'device')
+        for recv_xml in replies:
+            if HAS_MEDIATOR:
+                recv_xml = call_mediator('netconf', 'rpc-reply', self.module.params, recv_xml)
+            self.bases[0].check_response(recv_xml)
+
+    def read_end_state(self):
+        """Read the end state of all the modules with one get"""
+        get_str = self.merge('filter')
+        if HAS_MEDIATOR:
+            get_str = call_mediator('netconf', 'get', self.module.params, get_str, do_log=False)
+        con_obj = get_nc_config(self.module, get_str)
+        if HAS_MEDIATOR:
+            con_obj = call_mediator('netconf', 'rpc-reply', self.module.params, con_obj, do_log=False)
+        for base in self.bases:
+            base.end_state = base.parse_reply(con_obj)
+            base.get_update_cmd()
+
+    def results(self):
+        results = []
+        for entry, base in zip(self.entries, self.bases):
+            results.append({
+                'module': entry['module'],
+                'changed': base.changed,
+                'proposed': base.proposed,
+                'existing': base.existing,
+                'end_state': base.end_state,
+                'updates': base.updates_cmd if base.changed else list(),
+            })
+        return results
+
+    def preview(self):
+        """
+        The result of apply in check mode: the staged configs are merged, to report their
+        conflicts, but nothing is sent to the device. The batch is dropped as by apply.
+        :return: the result of ne_edit_batch, the end state of every module is its existing state
+        """
+        if not self.load():
+            return {'changed': False, 'edits': 0, 'results': []}
+        try:
+            if self.module.params.get('merge', True):
+                self.merge('config')
+        finally:
+            self.discard()
+        results = [{'module': entry['module'], 'changed': True, 'proposed': entry['proposed'],
+                    'existing': entry['existing'], 'end_state': entry['existing'], 'updates': []}
+                   for entry in self.entries]
+        return {'changed': True, 'edits': len(results), 'results': results}
+
+    def apply(self):
+        """
+        :return: the result of ne_edit_batch, with the result of every staged module
+        """
+        if self.module.check_mode:
+            return self.preview()
+        if not self.load():
+            return {'changed': False, 'edits': 0, 'results': []}
+        try:
+            self.edit()
+        finally:
+            # the device rolls back a failed edit, the batch is not kept for a retry
+            self.discard()
+        self.read_end_state()
+        results = self.results()
+        return {'changed': any(result['changed'] for result in results), 'edits': len(results),
+                'results': results}
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The files uploaded to the devices by ne_config transfer, kept as block hashes.
+
+After an upload, the remote size and mtime of the file and the sha1 of every
+block of the uploaded content are recorded per device and remote path:
+
+    { 'remote': { 'size': 1048576, 'mtime': 1700000000 }, 'block_size': 65536, 'blocks': [ sha1 ] }
+
+While the remote size and mtime are still the recorded ones, the content of
+the remote file is known without reading it back: an identical local file is
+not uploaded, and a changed one only needs its changed blocks written.
+"""
+import hashlib
+
+from ansible.module_utils.network.ne.common_module.local_store import state_path, safe_name, read_json, write_json
+
+BLOCK_SIZE = 64 * 1024
+
+
+def block_hashes(path, block_size=BLOCK_SIZE):
+    """The sha1 of every block of the file"""
+    hashes = []
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            hashes.append(hashlib.sha1(block).hexdigest())
+    return hashes
+
+
+def changed_blocks(old_hashes, new_hashes):
+    """The indexes of the blocks of the new content which differ from the old content"""
+    return [index for index, block in enumerate(new_hashes)
+            if index >= len(old_hashes) or old_hashes[index] != block]
+
+
+def record_path(device, remote_path):
+    return state_path('transfers', safe_name(device), safe_name(remote_path.strip('/')) + '.json')
+
+
+def read_record(device, remote_path, remote):
+    """
+    :param remote: the current { 'size', 'mtime' } of the remote file, None if it does not exist
+    :return: the block hashes of the remote file, None if it changed since it was recorded
+    """
+    record = read_json(record_path(device, remote_path))
+    if not isinstance(record, dict) or not remote or record.get('block_size') != BLOCK_SIZE \
+            or record.get('remote') != remote:
+        return None
+    return record['blocks']
+
+
+def write_record(device, remote_path, remote, blocks):
+    write_json(record_path(device, remote_path), {'remote': remote, 'block_size': BLOCK_SIZE, 'blocks': blocks})
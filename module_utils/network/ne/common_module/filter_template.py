@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Get filters compiled into templates, keyed by the shape of the params.
+
+Tasks polling the same nodes every minute send filters which only differ by
+their leaf values. The filter of a params shape is built once, with markers in
+place of the leaf values, and split at the markers; later filters of the same
+shape only join the parts with the escaped values:
+
+    { 'name': 'A', 'prefix': { 'get_value': None } }
+        ---> shape ( ('s', 'name'), ('d', 'prefix', False, False, ()) ), values [ 'A' ]
+        ---> [ '<filter ...><name>', '</name><prefix/></filter>' ]
+
+The templates are kept per process and in a file per module below the state
+directory, as every task is a new process. The tasks adding a template to the
+file hold its lock, so the templates added by concurrent tasks are all kept.
+"""
+import hashlib
+import json
+import re
+from xml.sax.saxutils import escape
+
+from ansible.module_utils.network.ne.common_module.local_store import state_path, safe_name, read_json, write_json, \
+    locked
+
+# Templates per process, { (module name, digest): FilterTemplate }
+_FILTER_TEMPLATES = {}
+# The digests of the schema fields of the modules, { id(namespaces): (namespaces, digest) }
+_SCHEMA_DIGESTS = {}
+# The templates kept in the file of a module, the least recently built are dropped first
+MAX_STORED_TEMPLATES = 256
+
+_MARKER = '{{ne-filter-value:%d}}'
+_MARKERS = re.compile(r'\{\{ne-filter-value:(\d+)\}\}')
+
+
+class FilterShape(object):
+    """Walk the get params like GetBase.to_xml, collecting their shape and leaf values"""
+
+    def __init__(self):
+        self.values = []
+
+    def value(self, text):
+        self.values.append(text)
+        return _MARKER % (len(self.values) - 1)
+
+    def walk(self, params):
+        """
+        :param params: the get params of a node
+        :return: (the shape of the params, the params with markers in place of the leaf values)
+        """
+        shape = []
+        marked = {}
+        for tag, value in params.items():
+            if tag in ('get_all', 'get_value') or value is None:
+                continue
+            if isinstance(value, str):
+                shape.append(('s', tag))
+                marked[tag] = self.value(value)
+            elif isinstance(value, list):
+                items = [self.walk(item) for item in value]
+                shape.append(('l', tag, tuple(item_shape for item_shape, _ in items)))
+                marked[tag] = [item_marked for _, item_marked in items]
+            elif isinstance(value, dict):
+                text = value.get('get_value')
+                if isinstance(text, bool):
+                    text = str(text).lower()
+                has_text = bool(text or text == 0)
+                get_all = bool(value.get('get_all'))
+                children_shape, children_marked = ((), {}) if get_all else self.walk(value)
+                shape.append(('d', tag, has_text, get_all, children_shape))
+                children_marked['get_value'] = self.value(str(text)) if has_text else None
+                children_marked['get_all'] = get_all
+                marked[tag] = children_marked
+        return tuple(shape), marked
+
+
+class FilterTemplate(object):
+    """A filter split at the leaf values"""
+
+    def __init__(self, parts, order):
+        self.parts = parts
+        # the index of the value after every part but the last one
+        self.order = order
+
+    @classmethod
+    def compile(cls, filter_str):
+        """:param filter_str: the filter built from the marked params"""
+        pieces = _MARKERS.split(filter_str)
+        return cls(pieces[0::2], [int(index) for index in pieces[1::2]])
+
+    def render(self, values):
+        result = [self.parts[0]]
+        for index, part in zip(self.order, self.parts[1:]):
+            result.append(escape(values[index]))
+            result.append(part)
+        return ''.join(result)
+
+    def to_table(self):
+        return [self.parts, self.order]
+
+
+def schema_digest(namespaces, *fields):
+    """The digest of the schema fields of a module, computed once per process"""
+    cached = _SCHEMA_DIGESTS.get(id(namespaces))
+    if cached is None or cached[0] is not namespaces:
+        digest = hashlib.sha1(json.dumps([namespaces] + list(fields), sort_keys=True).encode('utf-8')).hexdigest()
+        cached = (namespaces, digest)
+        _SCHEMA_DIGESTS[id(namespaces)] = cached
+    return cached[1]
+
+
+def read_stored(path):
+    stored = read_json(path, {})
+    return stored if isinstance(stored, dict) else {}
+
+
+def store_template(path, digest, template):
+    """Add the template to the file, re-read under its lock to keep the templates added meanwhile"""
+    with locked(path):
+        stored = read_stored(path)
+        stored[digest] = {'template': template.to_table(),
+                          'serial': max([entry.get('serial', 0) for entry in stored.values()] + [0]) + 1}
+        for old in sorted(stored, key=lambda key: stored[key].get('serial', 0))[:-MAX_STORED_TEMPLATES]:
+            del stored[old]
+        write_json(path, stored)
+
+
+def filter_template(module_name, schema_key, shape, build):
+    """
+    :param module_name: the name of the module, the templates are stored per module
+    :param schema_key: the schema_digest of the module, templates of other schema versions are not used
+    :param shape: the FilterShape of the params
+    :param build: builds the filter of the marked params, when the template is not known yet
+    :return: the FilterTemplate of the shape
+    """
+    digest = hashlib.sha1(json.dumps([schema_key, shape]).encode('utf-8')).hexdigest()
+    template = _FILTER_TEMPLATES.get((module_name, digest))
+    if template is not None:
+        return template
+    path = state_path('filter_templates', safe_name(module_name) + '.json')
+    table = read_stored(path).get(digest)
+    if table is not None:
+        template = FilterTemplate(*table['template'])
+    else:
+        template = FilterTemplate.compile(build())
+        try:
+            store_template(path, digest, template)
+        except (IOError, OSError):
+            # the template is still used in this process
+            pass
+    _FILTER_TEMPLATES[(module_name, digest)] = template
+    return template
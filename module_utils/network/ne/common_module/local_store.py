@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Files kept on the control node from one task to the next, every task being a new process.
+
+They are stored below ~/.ansible/ne, or the directory given by the NE_STATE_DIR
+environment variable, and always written atomically, so concurrent tasks (forks)
+read either the old or the new content of a file. The tasks updating a file
+shared by several of them hold its lock from the read to the write.
+"""
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+STATE_DIR_ENV = 'NE_STATE_DIR'
+DEFAULT_STATE_DIR = '~/.ansible/ne'
+
+
+def state_path(*parts):
+    """
+    :param parts: the path below the state directory, e.g. ('filter_templates', 'ietf_srv6.json')
+    :return: the absolute path
+    """
+    base = os.environ.get(STATE_DIR_ENV) or os.path.expanduser(DEFAULT_STATE_DIR)
+    return os.path.join(base, *parts)
+
+
+def safe_name(name):
+    """A file name for a module name, a host or a filter digest"""
+    return re.sub(r'[^\w.-]', '_', str(name))
+
+
+def read_json(path, default=None):
+    """The json content of the file, default if it does not exist or is damaged"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return default
+
+
+def make_dirs(directory):
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # created by a concurrent task
+            if not os.path.isdir(directory):
+                raise
+
+
+@contextmanager
+def locked(path):
+    """
+    Hold the exclusive lock of the file, on <path>.lock, for a read-modify-write of it.
+    Without fcntl the file is not locked, the concurrent updates then keep the last write.
+    """
+    make_dirs(os.path.dirname(path))
+    if not HAS_FCNTL:
+        yield
+        return
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_atomic(path, data):
+    """
+    Write the bytes into a temporary file next to the path, then rename it to the path.
+    :param data: bytes or text, text is encoded as utf-8
+    """
+    directory = os.path.dirname(path)
+    make_dirs(directory)
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json(path, content):
+    write_atomic(path, json.dumps(content, sort_keys=True))
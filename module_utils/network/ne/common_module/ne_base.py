@@ -4,6 +4,7 @@ import re
 import os
 import sys
 import copy
+import time
 import logging
 import json
 from collections import OrderedDict
@@ -11,12 +12,27 @@ import hashlib
 import xmltodict
 from lxml import etree
 from xml.dom.minidom import parseString
+from xml.sax.saxutils import escape
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection, ConnectionError
 from ansible.module_utils.network.ne.ne import get_nc_config, ne_argument_spec, get_nc_connection, to_text, to_string, execute_nc_action_yang
+from ansible.module_utils.network.ne.ne import execute_nc_pipeline
+from ansible.module_utils.network.ne.ne import candidate_transaction, edit_candidate, get_plugin_connection, has_capability, with_defaults_modes, \
+    has_yang_module, get_nc_data, NMDA_NAMESPACE, get_device_id, get_nc_parallel
 from ansible.module_utils.network.ne.common_module.checkparams import check_params
 from ansible.module_utils.network.ne.common_module import xmltodict
 from ansible.module_utils.network.ne.common_module.xml_build_with_xmlns import xml_parser_join_xmlns
+from ansible.module_utils.network.ne.common_module.xml_parse_with_xmlns import xml_parser_strip_xmlns
+from ansible.module_utils.network.ne.common_module.schema import compile_key_list, compile_child_order
+from ansible.module_utils.network.ne.common_module.xpath_filter import XPATH_CAPABILITY, qualify_xpath, \
+    xpath_filter_str, filter_reply
+from ansible.module_utils.network.ne.common_module.filter_template import FilterShape, filter_template, \
+    schema_digest
+from ansible.module_utils.network.ne.common_module.projection import project, spill_result
+from ansible.module_utils.network.ne.common_module.snapshot import poll_delta
+from ansible.module_utils.network.ne.common_module.xml_fragments import split_edit, split_filter, merge_fragments, \
+    minimize_edit, override_lists, \
+    select_list_keys
 
 try:
     from ncclient.xml_ import to_xml
@@ -36,18 +52,76 @@ try:
 except ImportError:
     HAS_MEDIATOR = False
 
+# The rpc-error of a reply, whatever its prefix and indentation
+RPC_ERROR = re.compile(r'<(?:[\w.-]+:)?rpc-error[\s/>]')
+
 params_default_list = {'host', 'port', 'username', 'password', 'ssh_keyfile',
                        'timeout', 'transport', 'operation_specs',
-                       'provider', 'operation_type'}
+                       'provider', 'operation_type', 'edit_batch', 'datastore', 'confirm_timeout',
+                       'persist', 'persist_id',
+                       'max_edit_size', 'chunk_retries', 'resume_from_chunk', 'edit_mode',
+                       'reconcile', 'filter_collapse', 'xpath_filter',
+                       'with_defaults', 'max_depth', 'projection', 'max_result_size',
+                       'poll', 'get_parallelism', 'get_sessions',
+                       'rpc_inputs', 'rpc_window'}
+
+# Operation type, shared by all the generated modules
+operation_spec = {'operation_type': {'type': 'str', 'required': True, 'choices': ['config', 'get', 'get-config', 'rpc']},
+                  'operation_specs': {
+                      'elements': 'dict', 'type': 'list', 'options': {
+                          'path': {
+                              'type': 'str'}, 'operation': {
+                              'choices': ['merge', 'replace', 'create', 'delete', 'remove'], 'default': 'merge'}}},
+                  # Stage the config in the named batch of the device, ne_edit_batch applies the batch
+                  'edit_batch': {'type': 'str'},
+                  # Edit the candidate and commit it, confirmed commit if confirm_timeout (seconds) is set
+                  'datastore': {'choices': ['running', 'candidate'], 'default': 'running'},
+                  'confirm_timeout': {'type': 'int'},
+                  # The token making the confirmed commit persistent, the token of the one this commit confirms
+                  'persist': {'type': 'str'},
+                  'persist_id': {'type': 'str'},
+                  # Split the edits bigger than max_edit_size (bytes) into chunks at list entry boundaries
+                  'max_edit_size': {'type': 'int'},
+                  'chunk_retries': {'type': 'int', 'default': 0},
+                  'resume_from_chunk': {'type': 'int', 'default': 0},
+                  # minimal: only send the leaves and list entries which differ from the existing config
+                  'edit_mode': {'choices': ['full', 'minimal'], 'default': 'full'},
+                  # overridden: the existing entries of the lists given which are not proposed are deleted
+                  'reconcile': {'choices': ['merged', 'overridden'], 'default': 'merged'},
+                  # fetch a container or list entry whole when this many of its leaves are given
+                  'filter_collapse': {'type': 'int'},
+                  # get and get-config: an XPath with the node names of the module, filtered locally without :xpath
+                  'xpath_filter': {'type': 'str'},
+                  # get and get-config: the with-defaults mode (RFC 6243) and the depth of the nodes returned,
+                  # sent if the server supports them, otherwise the depth is cut while parsing
+                  'with_defaults': {'choices': ['report-all', 'trim', 'explicit']},
+                  'max_depth': {'type': 'int'},
+                  # get and get-config: return the nodes or the number of nodes at the paths only
+                  'projection': {'type': 'dict', 'options': {
+                      'paths': {'type': 'list', 'elements': 'str', 'required': True},
+                      'count': {'type': 'bool', 'default': False}}},
+                  # get and get-config: a bigger result (json bytes) is written into a gzip file, its path is returned
+                  'max_result_size': {'type': 'int'},
+                  # get and get-config: return the list entries added, removed or changed since the previous poll
+                  'poll': {'type': 'str'},
+                  # get and get-config: split the filter into up to get_parallelism independent subtrees requested
+                  # concurrently, pipelined on the session of the connection or over get_sessions sessions
+                  'get_parallelism': {'type': 'int', 'default': 1},
+                  'get_sessions': {'type': 'int', 'default': 1},
+                  # rpc: the inputs of several rpcs, shaped like the module params, pipelined with at most
+                  # rpc_window of them waiting for their replies
+                  'rpc_inputs': {'type': 'list', 'elements': 'dict'},
+                  'rpc_window': {'type': 'int', 'default': 8}}
 
 
 class ConfigBase(object):
     """Create a ConfigBase class object"""
 
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         self.argument_spec, self.leaf_info, self.namespaces, self.business_tag, \
         self.xml_head, self.xml_tail, self.key_list = args
-        self.module = None
+        # The AnsibleModule already built by run_module, if any
+        self.module = kwargs.get('module')
 
         # config result state
         self.changed = False
@@ -61,9 +135,10 @@ class ConfigBase(object):
 
     def init_module(self):
         """ init module """
-        self.module = AnsibleModule(
-            argument_spec=self.argument_spec,
-            supports_check_mode=True)
+        if self.module is None:
+            self.module = AnsibleModule(
+                argument_spec=self.argument_spec,
+                supports_check_mode=True)
         return self.module
 
     def get_operation_type(self):
@@ -74,11 +149,15 @@ class ConfigBase(object):
     # config_set Echo check function
     def check_response(self, xml_str):
         """Check if response message is already succeed."""
-        if "<ok/>" not in xml_str:
-            self.module.fail_json(msg=xml_str)
-        elif " <rpc-error>" in xml_str:
+        if self.response_error(xml_str):
             self.module.fail_json(msg=xml_str)
 
+    def response_error(self, xml_str):
+        """The failed response message, None if it succeeded."""
+        if "<ok/>" not in xml_str or RPC_ERROR.search(xml_str):
+            return xml_str
+        return None
+
     def get_body_xml(self, oper):
         """Config_set construct the body part of the message."""
         params_copy = copy.deepcopy(self.module.params)
@@ -88,8 +167,13 @@ class ConfigBase(object):
         if oper == 'config':
             new_params = {'root': business_params}
         else:
-            # Remove the non-key node, otherwise the get message is incorrect.
-            new_business_params = self.remove_not_key(business_params, self.key_list, "")
+            # Only select what is given, the keys are content match nodes.
+            key_paths = compile_key_list(self.key_list).key_paths
+            new_business_params = OrderedDict()
+            for business, value in business_params.items():
+                selected = self.select_filter({business: value}, key_paths, "")
+                # nothing given below a business node selects it whole
+                new_business_params[business] = selected[business] if selected else None
             new_params = {'root': new_business_params}
         body_xml = parseString(self.params_to_xml(oper, new_params)).toprettyxml()
         body_xml_list = re.compile(r"<root>(.*?)</root>", re.S).findall(body_xml)
@@ -98,29 +182,37 @@ class ConfigBase(object):
         body_xml_str = body_xml_list[0]
         return body_xml_str
 
-    def remove_not_key(self, dic, paths, spath):
-        """Remove non-key nodes."""
-        for k in list(dic.keys()):
-            spath = spath + "/" + k
-            if isinstance(dic[k], dict):
-                dic[k].update(
-                    self.remove_not_key(dic[k], paths, spath))
-            elif isinstance(dic[k], list):
-                temp_list = []
-                for item in dic[k]:
-                    temp_list.append(
-                        self.remove_not_key(item, paths, spath))
-                dic.update({k: temp_list})
+    def select_filter(self, dic, key_paths, spath):
+        """
+        Keep the containers, the list keys and the leaves given, the leaves become selection nodes.
+        A node selecting filter_collapse leaves or more only keeps its keys and is fetched whole.
+        :return: the filter params, None if nothing is given below the node
+        """
+        selected = OrderedDict()
+        leaves = 0
+        for key, value in dic.items():
+            path = spath + "/" + key
+            if isinstance(value, dict):
+                child = self.select_filter(value, key_paths, path)
+                if child is not None:
+                    selected[key] = child
+            elif isinstance(value, list):
+                # the items of a list node are {entry name: entry}, their paths are below the list node
+                items = [self.select_filter(item, key_paths, path) for item in value if isinstance(item, dict)]
+                items = [item for item in items if item is not None]
+                if items:
+                    selected[key] = items
+            elif value is None:
+                continue
+            elif path in key_paths:
+                selected[key] = value
             else:
-                if spath in paths:
-                    pass
-                else:
-                    if dic[k] is None:
-                        del dic[k]
-                    else:
-                        dic[k] = None
-            spath = spath[:-(len(spath.split("/")[-1]) + 1)]
-        return dic
+                selected[key] = None
+                leaves += 1
+        collapse = self.module.params.get('filter_collapse')
+        if collapse and leaves >= collapse:
+            return OrderedDict((key, value) for key, value in selected.items() if spath + "/" + key in key_paths)
+        return selected or None
 
     def str_to_xml(self, cfg_str):
         """Convert the spliced string to xml."""
@@ -130,8 +222,27 @@ class ConfigBase(object):
         root = etree.fromstring(update_xml)
         if self.module.params.get('operation_specs', None):
             update_xml = self.create_operation_xml(self.module.params, root)
+        if self.module.params.get('reconcile') == 'overridden':
+            update_xml = self.overridden_edit_xml(update_xml)
+        if self.module.params.get('edit_mode') == 'minimal':
+            update_xml = self.minimal_edit_xml(update_xml)
+            if update_xml is None:
+                return None
         return self.create_operation_namespace(update_xml)
 
+    def overridden_edit_xml(self, update_xml):
+        """Add the deletes of the existing list entries which are not proposed."""
+        root = etree.fromstring(update_xml)
+        self.results['deleted_entries'] = override_lists(root, self.existing, compile_key_list(self.key_list).list_keys)
+        return etree.tostring(root, encoding='unicode')
+
+    def minimal_edit_xml(self, update_xml):
+        """Keep the changes against the existing config only, None if nothing changes."""
+        root = etree.fromstring(update_xml)
+        if not minimize_edit(root, self.existing, compile_key_list(self.key_list).list_keys):
+            return None
+        return etree.tostring(root, encoding='unicode')
+
     def create_operation_xml(self, node_params, root):
         """Create operation xml"""
         # Add a user-defined operation
@@ -176,29 +287,126 @@ class ConfigBase(object):
         """The final config_set message is sent to the controlled machine."""
         cfg_str = self.config_str()
         xml_str = self.str_to_xml(cfg_str)
+        if xml_str is None:
+            # edit_mode minimal and the existing config is already the proposed one
+            return None
         ietf_xml_json = self.load_json(xml_str)
         self.ietf_routing = self.json_to_xml(ietf_xml_json)
+        max_edit_size = self.module.params.get('max_edit_size')
+        if max_edit_size:
+            list_keys = compile_key_list(self.key_list).list_keys
+            return self.send_chunks(split_edit(xml_str, list_keys, max_edit_size))
+
+        xml_cfg_str = self.translate_edit(xml_str)
+        self.translate_ietf = xml_cfg_str
+        recv_xml = self.translate_reply(self.send_edits([xml_cfg_str])[-1])
+        self.check_response(recv_xml)
+        return recv_xml
+
+    def translate_edit(self, xml_str):
+        """Translate the edit-config config by the mediator, if any."""
         if HAS_MEDIATOR:
             # xml_cfg_str = translate_edit_config_content(xml_str)
             xml_cfg_str = call_mediator('netconf', 'edit-config', self.module.params, xml_str)
-            xml_cfg_str = xml_cfg_str.replace('True', 'true').replace('False', 'false')  # ???
-        else:
-            xml_cfg_str = xml_str
-
-        self.translate_ietf = xml_cfg_str
-        recv_xml = self.set_nc_config_without_default_operation(self.module, xml_cfg_str)
+            return xml_cfg_str.replace('True', 'true').replace('False', 'false')  # ???
+        return xml_str
 
+    def translate_reply(self, recv_xml):
+        """Translate the edit-config reply by the mediator, if any."""
         if HAS_MEDIATOR:
             # NOTE: update datastore
             datastore.update_redis_for_mediator(self.module.params, 'controller')
             datastore.update_redis_for_mediator(self.module.params, 'device')
-
-        if HAS_MEDIATOR:
             recv_xml = call_mediator('netconf', 'rpc-reply', self.module.params, recv_xml)
+        return recv_xml
 
-        self.check_response(recv_xml)
+    def send_chunks(self, chunks):
+        """Send the chunks of an oversized edit back to back over the same session.
+
+        A failed chunk is retried chunk_retries times, then the module fails with
+        the failed chunk, from which resume_from_chunk resumes with the same
+        params (the split is deterministic). The metrics of every chunk are
+        returned in edit_chunks.
+
+        With the candidate datastore all the chunks go into one locked candidate
+        and are committed once: a failed chunk discards the chunks before it too,
+        so nothing is applied and there is nothing to resume from.
+        """
+        params = self.module.params
+        metrics = self.results.setdefault('edit_chunks', [])
+        if params.get('datastore') != 'candidate':
+            def edit(xml_str):
+                return self.edit_datastore([xml_str])[-1]
+            recv_xml = None
+            for index, chunk in enumerate(chunks):
+                if index < params.get('resume_from_chunk', 0):
+                    metrics.append({'chunk': index, 'size': len(chunk), 'skipped': True})
+                    continue
+                recv_xml, error = self.send_chunk(edit, index, chunk, metrics)
+                if error is not None:
+                    self.module.fail_json(msg='The edit chunk %d of %d failed, resume_from_chunk: %d resumes from it. %s'
+                                              % (index, len(chunks), index, error),
+                                          failed_chunk=index, edit_chunks=metrics)
+            return recv_xml
+        if params.get('resume_from_chunk', 0):
+            self.module.fail_json(msg='resume_from_chunk does not apply to the candidate datastore, '
+                                      'whose failed edits commit none of their chunks.')
+        recv_xml = failed = None
+        try:
+            with candidate_transaction(self.module, params.get('confirm_timeout'), persist=params.get('persist'),
+                                       persist_id=params.get('persist_id')) as edit:
+                for index, chunk in enumerate(chunks):
+                    recv_xml, error = self.send_chunk(edit, index, chunk, metrics)
+                    if error is not None:
+                        failed = index
+                        # discards the chunks sent into the candidate
+                        raise ConnectionError(error)
+        except ConnectionError as exc:
+            if failed is None:
+                self.module.fail_json(msg='The commit of the %d edit chunks failed, none is applied. %s'
+                                          % (len(chunks), to_text(exc)), edit_chunks=metrics)
+            self.module.fail_json(msg='The edit chunk %d of %d failed, the candidate is discarded and none is applied. %s'
+                                      % (failed, len(chunks), to_text(exc)),
+                                  failed_chunk=failed, edit_chunks=metrics)
         return recv_xml
 
+    def send_chunk(self, edit, index, chunk, metrics):
+        """Send the chunk with edit, retried chunk_retries times.
+
+        :return: (the reply, the error of the last attempt, None if it succeeded)
+        """
+        recv_xml = error = None
+        for attempt in range(1, self.module.params.get('chunk_retries', 0) + 2):
+            start = time.time()
+            try:
+                recv_xml = self.translate_reply(edit(self.translate_edit(chunk)))
+                error = self.response_error(recv_xml)
+            except ConnectionError as exc:
+                error = to_text(exc)
+            metrics.append({'chunk': index, 'size': len(chunk), 'attempt': attempt,
+                            'seconds': round(time.time() - start, 3), 'error': error})
+            if error is None:
+                break
+        return recv_xml, error
+
+    def send_edits(self, xml_strs):
+        """Send the edit-configs to the datastore chosen by the params, return the replies."""
+        try:
+            return self.edit_datastore(xml_strs)
+        except ConnectionError as exc:
+            self.module.fail_json(msg=to_text(exc))
+
+    def edit_datastore(self, xml_strs):
+        """Send the edit-configs, raise ConnectionError if one fails."""
+        if self.module.params.get('datastore') == 'candidate':
+            # one lock and one commit for all the edits
+            return edit_candidate(self.module, xml_strs, self.module.params.get('confirm_timeout'),
+                                  persist=self.module.params.get('persist'),
+                                  persist_id=self.module.params.get('persist_id'))
+        conn = get_nc_connection(self.module)
+        return [to_string(to_xml(conn.edit_config(target='running', config=xml_str, error_option='rollback-on-error')))
+                for xml_str in xml_strs]
+
     # ietf config message not need the param:<default-operation>
     # Duplicate the fun:set_nc_config
     def set_nc_config_without_default_operation(self, module, xml_str):
@@ -270,11 +478,20 @@ class ConfigBase(object):
         xml_str = parseString(get_xml_str).toprettyxml()
         return xml_str
 
-    def netconf_get_config(self):
-        """The final Config_get message is sent to the controlled machine."""
+    def get_filter_str(self):
+        """The config_get filter with xmlns, before the translation."""
         xml_str = self.get_xml_str()
+        if self.module.params.get('reconcile') == 'overridden':
+            # the keys of all the existing entries of the lists given, to find the ones to delete
+            root = etree.fromstring(xml_str)
+            select_list_keys(root, compile_key_list(self.key_list).list_keys)
+            xml_str = etree.tostring(root, encoding='unicode')
         update_xml_result = xml_parser_join_xmlns(xml_str, self.namespaces, 'filter')
-        get_str = update_xml_result.replace('<?xml version="1.0" ?>', '')
+        return update_xml_result.replace('<?xml version="1.0" ?>', '')
+
+    def netconf_get_config(self):
+        """The final Config_get message is sent to the controlled machine."""
+        get_str = self.get_filter_str()
         if HAS_MEDIATOR:
             # translate_xml_str = translate_query_filter_content(get_str)
             translate_xml_str = call_mediator('netconf', 'get', self.module.params, get_str, do_log=False)
@@ -285,7 +502,6 @@ class ConfigBase(object):
     # The config_get packet is sent to return the current configuration parameters of the device.
     def get_info_process(self, xml_str):
         """Get current dldp existed configuration"""
-        conf = dict()
         # Send a Get message
         # Parsing 1: delete the useless string, pay attention to the replacement according to the business
         con_obj = get_nc_config(self.module, xml_str)
@@ -294,17 +510,18 @@ class ConfigBase(object):
             device_config = con_obj
             con_obj = call_mediator('netconf', 'rpc-reply', self.module.params, con_obj, do_log=False)
             controller_config = con_obj
+        return self.parse_reply(con_obj)
 
+    def parse_reply(self, con_obj):
+        """Get the configuration of the module from the translated reply"""
+        conf = dict()
         # Parsing 2: No data detection
         if "<data/>" in con_obj:
             return conf
 
-        # Parsing 3: Extract all nodes in the root directory
-        new_con_obj_temp = con_obj.replace('\r', '').replace('\n', ''). \
-            replace('<?xml version=\"1.0\" encoding=\"UTF-8\"?>', "")
-        new_con_obj = re.sub(r'\sxmlns(:.*?)=".*?"|\sxmlns=".*?"', "", new_con_obj_temp)
-        xml_to_dict = xmltodict.parse(new_con_obj)
-        conf = xml_to_dict["data"]
+        # Parsing 3: Extract all nodes in the root directory, the nodes not in the module are pruned
+        xml_to_dict = xml_parser_strip_xmlns(con_obj, self.namespaces)
+        conf = xml_to_dict["data"] or conf
         return conf
 
     def convert_to_set(self, d, xpath=''):
@@ -392,6 +609,43 @@ class ConfigBase(object):
         self.updates_cmd.append(
             self.compare_two_dict(self.existing, self.end_state))
 
+    def stage_edit(self):
+        """Stage the config in the edit batch of the device instead of sending it.
+
+        The batch lives in the persistent netconf connection of the device, so
+        the configs staged by several tasks are applied by ne_edit_batch as one
+        edit-config. The schema fields needed to split the results are staged with it.
+        """
+        config = self.str_to_xml(self.config_str())
+        if config is None:
+            # edit_mode minimal and nothing to change, nothing is staged
+            self.results['changed'] = False
+            self.results['proposed'] = self.proposed
+            self.results['existing'] = self.existing
+            self.module.exit_json(**self.results)
+        entry = {
+            'module': self.module._name,
+            'config': config,
+            'filter': self.get_filter_str(),
+            'namespaces': self.namespaces,
+            'business_tag': self.business_tag,
+            'xml_head': self.xml_head,
+            'xml_tail': self.xml_tail,
+            'key_list': self.key_list,
+            'existing': self.existing,
+            'proposed': self.proposed,
+        }
+        conn = get_plugin_connection(self.module)
+        try:
+            staged = conn.stage_edit(self.module.params['edit_batch'], entry)
+        except ConnectionError as exc:
+            self.module.fail_json(msg=to_text(exc))
+        self.results['changed'] = False
+        self.results['staged'] = {'edit_batch': self.module.params['edit_batch'], 'edits': staged}
+        self.results['proposed'] = self.proposed
+        self.results['existing'] = self.existing
+        self.module.exit_json(**self.results)
+
     # Data returned to the user
     def show_result(self):
         """Show result"""
@@ -419,6 +673,9 @@ class ConfigBase(object):
         # return results
         self.get_proposed()
         self.get_existing()
+        if self.module.params.get('edit_batch'):
+            self.stage_edit()
+            return
         self.get_end_state()
         self.get_update_cmd()
         self.show_result()
@@ -426,27 +683,35 @@ class ConfigBase(object):
 class GetBase(object):
     """Create a GetBase class object"""
 
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         self.argument_spec, self.leaf_info, self.namespaces, self.business_tag, self.xml_head, self.xml_tail,\
         self.key_list = args
-        self.module = None
+        # The AnsibleModule already built by run_module, if any
+        self.module = kwargs.get('module')
 
         # filter result state
         self.changed = False
         self.proposed = dict()
         self.results = dict()
         self.end_state = dict()
+        # (select, nsmap) of the xpath_filter applied to the reply locally
+        self.local_xpath = None
+        # the with-defaults mode and max depth sent to the server, the max depth cut while parsing
+        self.with_defaults = None
+        self.server_depth = None
+        self.local_depth = None
 
     def init_module(self):
         """ init module """
-        self.module = AnsibleModule(
-            argument_spec=self.argument_spec,
-            supports_check_mode=True)
+        if self.module is None:
+            self.module = AnsibleModule(
+                argument_spec=self.argument_spec,
+                supports_check_mode=True)
         return self.module
 
-    def get_body_xml(self):
+    def get_body_xml(self, params=None):
         """Construct the body part of the message."""
-        new_params = {'root': self.module.params}
+        new_params = {'root': self.module.params if params is None else params}
         body_xml_temp = parseString(self.params_to_xml(new_params)).toprettyxml()
         body_xml = body_xml_temp.replace('<?xml version="1.0" ?>', '')
         body_xml_list = re.compile(r"<root>(.*?)</root>", re.S).findall(body_xml)
@@ -455,11 +720,11 @@ class GetBase(object):
         body_xml_str = body_xml_list[0]
         return body_xml_str
 
-    def get_config_str(self):
+    def get_config_str(self, params=None):
         """Filter_get message stitching."""
         get_cfg_str = ''
         get_cfg_str += self.xml_head
-        get_cfg_str += self.get_body_xml()
+        get_cfg_str += self.get_body_xml(params)
         get_cfg_str += self.xml_tail
         return get_cfg_str
 
@@ -541,9 +806,9 @@ class GetBase(object):
             else:
                 continue
 
-    def get_xml_str(self):
+    def get_xml_str(self, params=None):
         """Get the xml which is get message."""
-        get_cfg_str = self.get_config_str()
+        get_cfg_str = self.get_config_str(params)
         cfg_str_to_doc = parseString(get_cfg_str).toxml()
         xml_list = [line.strip() for line in cfg_str_to_doc.split("\n") if line]
         update_xml = parseString(''.join(xml_list)).toprettyxml()
@@ -553,8 +818,27 @@ class GetBase(object):
 
     def netconf_get_config(self):
         """The final Filter_get message is sent to the controlled machine."""
-        xml_str = self.get_xml_str()
-        get_str = xml_parser_join_xmlns(xml_str, self.namespaces, "filter")
+        xpath = self.module.params.get('xpath_filter')
+        if xpath:
+            try:
+                select, nsmap = qualify_xpath(xpath, self.namespaces)
+            except ValueError as exc:
+                self.module.fail_json(msg=to_text(exc))
+            # the mediator only translates subtree filters
+            if not HAS_MEDIATOR and has_capability(self.module, XPATH_CAPABILITY):
+                self.results['xpath_filter'] = 'device'
+                return self.get_info_process(xpath_filter_str(select, nsmap))
+            self.results['xpath_filter'] = 'local'
+            self.local_xpath = (select, nsmap)
+        get_str = self.get_filter_str()
+        # get-data is not split
+        if self.module.params.get('get_parallelism', 1) > 1 and not self.server_depth:
+            parts = split_filter(get_str, self.module.params['get_parallelism'],
+                                 compile_key_list(self.key_list).list_keys)
+            if len(parts) > 1:
+                result = self.get_parallel_process(parts)
+                if result is not None:
+                    return result
         if HAS_MEDIATOR:
             # translate_cfg_get = translate_query_filter_content(get_str)
             translate_cfg_get = call_mediator(
@@ -564,12 +848,42 @@ class GetBase(object):
             translate_cfg_get = get_str
         return self.get_info_process(translate_cfg_get)
 
+    def get_filter_str(self):
+        """The filter with xmlns, rendered from the template compiled for the shape of the params."""
+        walker = FilterShape()
+        shape, marked = walker.walk(self.get_instance_xml_root(self.module.params))
+        schema_key = schema_digest(self.namespaces, self.xml_head, self.xml_tail)
+        template = filter_template(self.module._name, schema_key, shape, lambda: xml_parser_join_xmlns(
+            self.get_xml_str(marked), self.namespaces, "filter"))
+        return template.render(walker.values)
+
+    def negotiate_retrieval(self):
+        """Send with_defaults and max_depth if the server supports them, otherwise
+        with_defaults is left to the basic mode of the server and the depth is cut while parsing."""
+        params = self.module.params
+        if params.get('with_defaults'):
+            if params['with_defaults'] in with_defaults_modes(self.module):
+                self.with_defaults = params['with_defaults']
+            else:
+                self.module.warn('The device does not support with-defaults %s, its basic mode is used.'
+                                 % params['with_defaults'])
+        if params.get('max_depth'):
+            if has_yang_module(self.module, NMDA_NAMESPACE):
+                self.server_depth = params['max_depth']
+            else:
+                self.local_depth = params['max_depth']
+        self.results['with_defaults'] = self.with_defaults
+        self.results['max_depth'] = 'device' if self.server_depth else 'local' if self.local_depth else None
+
     def get_config(self, module, xml_str, *args, **kwargs):
         """ get_config """
         conn = get_nc_connection(module)
         if xml_str is not None:
             try:
-                response = conn.get_config(source='running', filter=xml_str)
+                if self.with_defaults:
+                    response = conn.get_config(source='running', filter=xml_str, with_defaults=self.with_defaults)
+                else:
+                    response = conn.get_config(source='running', filter=xml_str)
             except ConnectionError as exc:
                 module.fail_json(msg=to_text(exc))
             finally:
@@ -581,11 +895,13 @@ class GetBase(object):
     # The get message is sent, and the current configuration parameters of the device are returned.
     def get_info_process(self, xml_str):
         """Get current dldp existed configuration"""
-        conf = dict()
         # Send a get message
         # Parsing 1: delete the useless string, pay attention to the replacement according to the business
-        if self.module.params["operation_type"] == "get":
-            con_obj = get_nc_config(self.module, xml_str)
+        if self.server_depth:
+            datastore = 'operational' if self.module.params["operation_type"] == "get" else 'running'
+            con_obj = get_nc_data(self.module, xml_str, datastore, self.server_depth, self.with_defaults)
+        elif self.module.params["operation_type"] == "get":
+            con_obj = get_nc_config(self.module, xml_str, self.with_defaults)
         else:  # ["operation_type"] == "get-config"
             con_obj = self.get_config(self.module, xml_str)
 
@@ -600,14 +916,36 @@ class GetBase(object):
             # datastore.update_redis_for_mediator(self.module.params, 'controller')
             # datastore.update_redis_for_mediator(self.module.params, 'device')
 
+        return self.parse_reply(con_obj)
+
+    def get_parallel_process(self, parts):
+        """Send the parts of the filter concurrently and merge the replies, None if they do not merge."""
+        params = self.module.params
+        if HAS_MEDIATOR:
+            parts = [call_mediator('netconf', params["operation_type"], params, part) for part in parts]
+        source = 'running' if params["operation_type"] == "get-config" else None
+        replies = get_nc_parallel(self.module, parts, params['get_sessions'], source, self.with_defaults)
+        if HAS_MEDIATOR:
+            replies = [call_mediator('netconf', 'rpc-reply', params, reply) for reply in replies]
+        try:
+            merged = merge_fragments(replies, compile_key_list(self.key_list).list_keys)
+        except ValueError as exc:
+            # e.g. list entries without their keys in the reply, the filter is sent whole
+            self.module.warn('The replies of the split filter do not merge, it is sent as one get: %s' % exc)
+            return None
+        self.results['get_parts'] = len(parts)
+        return self.parse_reply(merged)
+
+    def parse_reply(self, con_obj):
+        """Get the result from the translated reply"""
+        conf = dict()
+        if self.local_xpath is not None:
+            con_obj = filter_reply(con_obj, *self.local_xpath)
         #  Parsing 2: No data detection
         if "<data/>" in con_obj:
             return conf
-        # Parsing 3: Extracting the echoed message
-        new_con_obj_temp = con_obj.replace('\r', '').replace('\n', ''). \
-            replace('<?xml version=\"1.0\" encoding=\"UTF-8\"?>', "")
-        new_con_obj = re.sub(r'\sxmlns(:.*?)=".*?"|\sxmlns=".*?"', "", new_con_obj_temp)
-        xml_to_dict = xmltodict.parse(new_con_obj)
+        # Parsing 3: Extracting the echoed message, the nodes not in the module and below local_depth are pruned
+        xml_to_dict = xml_parser_strip_xmlns(con_obj, self.namespaces, max_depth=self.local_depth)
         conf = {"result": xml_to_dict}
         return conf
 
@@ -625,6 +963,29 @@ class GetBase(object):
         '''
         self.end_state = self.netconf_get_config()
 
+    def poll_result(self):
+        """Replace the result with the list entries changed since the previous poll of the same name."""
+        data = self.end_state['result'].get('data') if self.end_state else None
+        self.end_state = {'delta': poll_delta(data, compile_key_list(self.key_list).list_keys,
+                                              get_device_id(self.module), self.module._name,
+                                              self.module.params['poll'])}
+
+    def shape_result(self):
+        """Project the result, then spill it to a file if it is bigger than max_result_size."""
+        params = self.module.params
+        projection = params.get('projection')
+        if projection and self.end_state and 'result' in self.end_state:
+            try:
+                self.end_state = {'result': project(self.end_state['result'].get('data') or {},
+                                                    projection['paths'], projection['count'])}
+            except ValueError as exc:
+                self.module.fail_json(msg=to_text(exc))
+        if params.get('max_result_size'):
+            spilled = spill_result(self.end_state, params['max_result_size'], get_device_id(self.module),
+                                   self.module._name)
+            if spilled is not None:
+                self.end_state = spilled
+
     # Data returned to the user
     def show_result(self):
         """Show result"""
@@ -639,26 +1000,36 @@ class GetBase(object):
         # module input info
         self.init_module()
         check_params(self.leaf_info, self.module.params, self.module)
+        if self.module.params.get('poll') and self.module.params.get('projection'):
+            # the delta of a poll is made of list entries, not of the nodes at the projection paths
+            self.module.fail_json(msg='poll and projection are mutually exclusive, '
+                                      'a poll returns the changed list entries instead of the result.')
 
         # return results
         self.get_proposed()
+        self.negotiate_retrieval()
         self.get_end_state()
+        if self.module.params.get('poll'):
+            self.poll_result()
+        self.shape_result()
         self.show_result()
 
 class InputBase(object):
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         self.argument_spec, self.leaf_info, self.namespaces, self.business_tag, \
         self.xml_head, self.xml_tail, self.key_list = args
-        self.module = None
+        # The AnsibleModule already built by run_module, if any
+        self.module = kwargs.get('module')
 
         # config result state
         self.results = dict()
 
     def init_module(self):
         """ init module """
-        self.module = AnsibleModule(
-            argument_spec=self.argument_spec,
-            supports_check_mode=True)
+        if self.module is None:
+            self.module = AnsibleModule(
+                argument_spec=self.argument_spec,
+                supports_check_mode=True)
         return self.module
 
     def get_operation_type(self):
@@ -666,96 +1037,91 @@ class InputBase(object):
         self.init_module()
         return self.module.params
 
-    def xml_tag(self, key, value):
-        """Generate xml format for each line"""
-        xml_str = ("<%s>{value}</%s>" % (key, key)) \
-            .format(key=key, value=value if value is not None else '')
-        return xml_str
-
-    def to_xml(self, params):
-        """Deep traversal of the dictionary and remove the default value."""
-        xml_list = []
-        for key, value in params.items():
+    def write_xml(self, child_order, params, path, chunks):
+        """
+        Append the xml of the params to chunks in one pass, the nodes in schema order.
+        :param child_order: the ChildOrder of the module
+        :param path: the module path of the params, the items of a list are written into one list node
+        """
+        for key in child_order.order(path, params):
+            value = params[key]
+            if value is None:
+                continue
+            child_path = path + "/" + key
+            chunks.append("<%s>" % key)
             if isinstance(value, dict):
-                xml_value = self.to_xml(value)
-                xml_str = self.xml_tag(key, xml_value)
+                self.write_xml(child_order, value, child_path, chunks)
             elif isinstance(value, list):
-                xml_value = ""
                 for item in value:
-                    xml_value = xml_value + self.to_xml(item)
-                xml_str = self.xml_tag(key, xml_value)
-            else:  # The type of value might be None/int/str/bool
-                if value is None:
-                    continue
-                if type(value) == bool:
-                    value = str(value).lower()
-                xml_str = self.xml_tag(key, value)
-            xml_list.append(xml_str)
-        return ''.join(xml_list)
-
-    def dict_order(self, business_params, leaf_info):
-        temp_ordered_dict = OrderedDict()
-        key_list = list(leaf_info.keys())
-        for key in key_list:
-            if isinstance(business_params, dict) and key in business_params.keys():
-                temp_ordered_dict[key] = leaf_info[key]
-
-        for key, value in business_params.items():
-            if isinstance(value, dict):
-                temp_ordered_dict[key] = self.dict_order(business_params[key], leaf_info[key])
-            elif isinstance(value, list):
-                temp_list = []
-                for instance_dict in value:
-                    temp_list.append(self.dict_order(instance_dict, leaf_info[key]))
-                temp_ordered_dict[key] = temp_list
-            else:
-                temp_ordered_dict[key] = value
-        return temp_ordered_dict
+                    self.write_xml(child_order, item, child_path, chunks)
+            else:  # The type of value might be int/str/bool
+                chunks.append(escape(str(value).lower() if isinstance(value, bool) else str(value)))
+            chunks.append("</%s>" % key)
 
-    def get_body_xml(self):
+    def get_body_xml(self, params=None):
         """Config_set construct the body part of the message."""
-        params_copy = copy.deepcopy(self.module.params)
-        business_params = {}
-        for business in self.business_tag:
-            business_params[business] = params_copy[business]
-        new_params = OrderedDict()
-        new_params["root"] = self.dict_order(business_params, self.leaf_info)
-        body_xml = parseString(self.to_xml(new_params)).toprettyxml()
-        body_xml_list = re.compile(r"<root>(.*?)</root>", re.S).findall(body_xml)
-        if not body_xml_list:
-            return
-        body_xml_str = body_xml_list[0]
-        return body_xml_str
+        params = self.module.params if params is None else params
+        business_params = dict((business, params.get(business)) for business in self.business_tag)
+        chunks = []
+        self.write_xml(compile_child_order(self.leaf_info), business_params, "", chunks)
+        return ''.join(chunks) or None
 
     # config_set Echo check function
     def check_response(self, xml_str):
         """Check if response message is already succeed."""
         conf = dict()
-        if " <rpc-error>" not in xml_str:
-            new_con_obj_temp = xml_str.replace('\r', '').replace('\n', ''). \
-                replace('<?xml version=\"1.0\" encoding=\"UTF-8\"?>', "")
-            new_con_obj = re.sub(r'\sxmlns(:.*?)=".*?"|\sxmlns=".*?"', "", new_con_obj_temp)
-            xml_to_dict = xmltodict.parse(new_con_obj)
+        if not RPC_ERROR.search(xml_str):
+            # The rpc output is not in the xmlns info list, only the xmlns are removed
+            xml_to_dict = xml_parser_strip_xmlns(xml_str)
             conf = {"result": xml_to_dict}
         return conf
 
-    def netconf_set_config(self, cfg_str):
-        """The final config_set message is sent to the controlled machine."""
+    def rpc_str(self, cfg_str):
+        """The rpc with xmlns."""
         cfg_str = "<rpc>" + cfg_str + "</rpc>"
         xml_str_with_xmlns = xml_parser_join_xmlns(cfg_str, self.namespaces, "rpc")
-        send_xml_str = xml_str_with_xmlns.replace('<rpc>', "").replace('</rpc>', "")
+        return xml_str_with_xmlns.replace('<rpc>', "").replace('</rpc>', "")
+
+    def netconf_set_config(self, cfg_str):
+        """The final config_set message is sent to the controlled machine."""
+        send_xml_str = self.rpc_str(cfg_str)
         # Send a Get message
         # Parsing 1: delete the useless string, pay attention to the replacement according to the business
         con_obj = execute_nc_action_yang(self.module, send_xml_str)
         conf = self.check_response(con_obj)
         return conf
 
+    def pipeline_result(self):
+        """Send the rpcs of rpc_inputs pipelined, their results are returned in the order of the inputs."""
+        inputs = self.module.params['rpc_inputs']
+        for index, item in enumerate(inputs):
+            unknown = [name for name in item if name not in self.business_tag]
+            if unknown:
+                self.module.fail_json(msg='rpc_inputs[%d]: unknown nodes %s, expected %s'
+                                          % (index, ', '.join(unknown), ', '.join(self.business_tag)))
+            check_params(self.leaf_info, item, self.module)
+        replies = execute_nc_pipeline(self.module, [self.rpc_str(self.get_body_xml(item)) for item in inputs],
+                                      self.module.params['rpc_window'])
+        self.results['outputs'] = []
+        for item, reply in zip(inputs, replies):
+            if reply['ok']:
+                result = {'input': item, 'output': self.check_response(reply['xml']), 'failed': False}
+            else:
+                result = {'input': item, 'output': {}, 'failed': True, 'error': reply['xml']}
+            self.results['outputs'].append(result)
+        self.results['failed_inputs'] = [index for index, reply in enumerate(replies) if not reply['ok']]
+        if self.results['failed_inputs']:
+            self.module.fail_json(msg='%d of the %d rpcs failed' % (len(self.results['failed_inputs']), len(inputs)),
+                                  **self.results)
+        self.module.exit_json(**self.results)
+
     # Data returned to the user
     def show_result(self):
         """Show result"""
+        if self.module.params.get('rpc_inputs'):
+            self.pipeline_result()
         cfg_str = self.get_body_xml()
-        xml_str = parseString(cfg_str).toprettyxml()
-        self.results['send_xml'] = xmltodict.parse(xml_str)
+        self.results['send_xml'] = xmltodict.parse(cfg_str)
         self.results['output'] = self.netconf_set_config(cfg_str)
         self.module.exit_json(**self.results)
 
@@ -767,3 +1133,26 @@ class InputBase(object):
         # return results
         self.show_result()
 
+
+# The base class which handles each operation type, the others are handled by InputBase
+OPERATION_BASES = {'config': ConfigBase, 'get': GetBase, 'get-config': GetBase}
+
+
+def run_module(args, user_check=None):
+    """
+    Module bootstrap: validate the argument_spec once and hand the AnsibleModule
+    to the base class of the operation type.
+    :param args: (argument_spec, leaf_info, namespaces, business_tag, xml_head, xml_tail, key_list)
+    :param user_check: the UserCheck class of the module, its methods startswith "check_" are called
+    :return:
+    """
+    argument_spec, leaf_info = args[0], args[1]
+    argument_spec.update(ne_argument_spec)
+    argument_spec.update(operation_spec)
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    if user_check is not None:
+        for check_func in [name for name in dir(user_check) if name.startswith("check_")]:
+            if not getattr(user_check(module.params, leaf_info), check_func)():
+                module.fail_json(msg='UserCheck.' + check_func + '()')
+    base_class = OPERATION_BASES.get(module.params['operation_type'], InputBase)
+    base_class(*args, module=module).run()
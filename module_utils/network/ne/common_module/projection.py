@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Projection and size limit of the get results, before they are returned to the controller.
+
+A projection path selects nodes of the reply data by their module path, the
+list entries can be sliced by their keys (shell patterns) or by their position:
+
+    /interfaces/interface[name=GigabitEthernet0/1/*]/statistics
+    /routing/srv6/locators/locator[0:10]
+    /network-instances/network-instance[name=vpn1,type=l3vpn]/vpn-targets
+"""
+import fnmatch
+import gzip
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+
+from ansible.module_utils.network.ne.common_module.local_store import state_path, safe_name, write_atomic
+from ansible.module_utils.network.ne.common_module.xml_fragments import leaf_text
+
+_SLICE = re.compile(r'^\s*(-?\d*)\s*:\s*(-?\d*)\s*$')
+
+
+def split_path(path):
+    """'/a/b[name=x/y]/c' ---> [ 'a', 'b[name=x/y]', 'c' ], the / in the predicates do not split"""
+    steps = []
+    depth = 0
+    current = []
+    for char in path.strip():
+        if char == '/' and not depth:
+            if current:
+                steps.append(''.join(current))
+            current = []
+            continue
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        current.append(char)
+    if depth:
+        raise ValueError('Unbalanced [] in the projection path %s' % path)
+    if current:
+        steps.append(''.join(current))
+    return steps
+
+
+def parse_step(step):
+    """
+    :return: (name, predicate), the predicate is None, a slice or [ (key, pattern) ]
+    """
+    name, bracket, rest = step.partition('[')
+    if not bracket:
+        return name, None
+    if not rest.endswith(']'):
+        raise ValueError('Invalid projection step %s' % step)
+    predicate = rest[:-1]
+    match = _SLICE.match(predicate)
+    if match:
+        start, stop = match.groups()
+        return name, slice(int(start) if start else None, int(stop) if stop else None)
+    keys = []
+    for item in predicate.split(','):
+        key, equal, pattern = item.partition('=')
+        if not equal:
+            raise ValueError('Invalid projection predicate %s, key=value or start:stop is expected' % predicate)
+        keys.append((key.strip(), pattern.strip().strip('"\'')))
+    return name, keys
+
+
+def select(data, path):
+    """
+    :param data: the reply data, xmltodict result without xmlns
+    :return: the list of the nodes selected by the path
+    """
+    nodes = [data]
+    for step in split_path(path):
+        name, predicate = parse_step(step)
+        selected = []
+        for node in nodes:
+            value = node.get(name) if isinstance(node, dict) else None
+            if value is None:
+                continue
+            items = value if isinstance(value, list) else [value]
+            if isinstance(predicate, slice):
+                items = items[predicate]
+            elif predicate:
+                items = [item for item in items if isinstance(item, dict) and all(
+                    leaf_text(item.get(key)) is not None and fnmatch.fnmatchcase(leaf_text(item.get(key)), pattern)
+                    for key, pattern in predicate)]
+            selected.extend(items)
+        nodes = selected
+    return nodes
+
+
+def project(data, paths, count=False):
+    """
+    :param paths: the projection paths
+    :param count: return the number of the nodes selected instead of the nodes
+    :return: { path: [ node ] or number of nodes }
+    :raise ValueError: if a path is invalid
+    """
+    result = OrderedDict()
+    for path in paths:
+        nodes = select(data, path)
+        result[path] = len(nodes) if count else nodes
+    return result
+
+
+def spill_result(result, max_size, host, module_name):
+    """
+    Keep the result if its json is not bigger than max_size, otherwise write it
+    into a gzip file on the control node.
+    :return: None if the result is kept, otherwise { 'spilled': path, 'size': json size }
+    """
+    serialized = json.dumps(result)
+    if len(serialized) <= max_size:
+        return None
+    path = state_path('results', safe_name(host), '%s-%s-%d.json.gz'
+                      % (safe_name(module_name), time.strftime('%Y%m%d-%H%M%S'), os.getpid()))
+    write_atomic(path, gzip.compress(serialized.encode('utf-8')))
+    return {'spilled': path, 'size': len(serialized)}
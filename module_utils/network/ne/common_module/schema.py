@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import json
+import zlib
+import base64
+import hashlib
+from collections import OrderedDict
+
+from ansible.module_utils.network.ne.common_module.checkparams import ParamsValidator, compile_leaf_info, is_leaf
+from ansible.module_utils.network.ne.common_module.xml_build_with_xmlns import NamespaceIndex, compile_namespaces
+
+# The format of the schema artifacts this loader writes
+SCHEMA_FORMAT = 2
+# The formats it reads, format 1 artifacts have no precomputed indexes
+SUPPORTED_FORMATS = (1, 2)
+
+# The schema fields, in the order the base classes take them as args
+SCHEMA_FIELDS = ('argument_spec', 'leaf_info', 'namespaces', 'business_tag', 'xml_head', 'xml_tail', 'key_list')
+
+# Loaded schemas, one per artifact
+_SCHEMAS = {}
+# Compiled key indexes, one per key_list (i.e. one per module)
+_KEY_INDEXES = {}
+# Compiled child orders, one per leaf_info (i.e. one per module)
+_CHILD_ORDERS = {}
+
+
+class KeyIndex(object):
+    """Compiled view of the key_list of a module.
+
+    key_paths: set( '/node1/list1/entry1/key1' )
+    list_keys: { '/node1/list1/entry1': [ 'key1', 'key2' ] }   ( keys in key_list order )
+    """
+
+    def __init__(self, key_list):
+        self.key_paths = frozenset(key_list)
+        self.list_keys = OrderedDict()
+        for key_path in key_list:
+            entry_path, key_name = key_path.rsplit("/", 1)
+            self.list_keys.setdefault(entry_path, []).append(key_name)
+
+    def to_table(self):
+        """The json serializable tables of the index, precomputed into the schema artifacts"""
+        return {'key_paths': sorted(self.key_paths), 'list_keys': self.list_keys}
+
+    @classmethod
+    def from_table(cls, table):
+        """Restore the index from to_table()"""
+        index = cls.__new__(cls)
+        index.key_paths = frozenset(table['key_paths'])
+        index.list_keys = OrderedDict(table['list_keys'])
+        return index
+
+
+def compile_key_list(key_list, table=None):
+    """Compile the key index of the module once per process, from the precomputed table if any"""
+    cached = _KEY_INDEXES.get(id(key_list))
+    if cached is None or cached[0] is not key_list:
+        cached = (key_list, KeyIndex.from_table(table) if table is not None else KeyIndex(key_list))
+        _KEY_INDEXES[id(key_list)] = cached
+    return cached[1]
+
+
+class ChildOrder(object):
+    """Compiled schema order of the children of the containers and lists of leaf_info.
+
+    ranks: { '/node1/list1/entry1': { 'key1': 0, 'leaf2': 1, 'container3': 2 } }   ( '' for the top nodes )
+    """
+
+    def __init__(self, leaf_info):
+        self.ranks = {}
+        nodes = [('', leaf_info)]
+        while nodes:
+            path, info = nodes.pop()
+            if not isinstance(info, dict) or is_leaf(info):
+                continue
+            self.ranks[path] = dict((name, rank) for rank, name in enumerate(info))
+            nodes.extend((path + '/' + name, child) for name, child in info.items())
+
+    def order(self, path, names):
+        """The names of the children of the node in schema order, the names unknown to the schema last"""
+        ranks = self.ranks.get(path, {})
+        return sorted(names, key=lambda name: ranks.get(name, len(ranks)))
+
+    def to_table(self):
+        """The json serializable tables of the index, precomputed into the schema artifacts"""
+        return dict((path, sorted(ranks, key=ranks.get)) for path, ranks in self.ranks.items())
+
+    @classmethod
+    def from_table(cls, table):
+        """Restore the index from to_table()"""
+        index = cls.__new__(cls)
+        index.ranks = dict((path, dict((name, rank) for rank, name in enumerate(names)))
+                           for path, names in table.items())
+        return index
+
+
+def compile_child_order(leaf_info, table=None):
+    """Compile the child order of the module once per process, from the precomputed table if any"""
+    cached = _CHILD_ORDERS.get(id(leaf_info))
+    if cached is None or cached[0] is not leaf_info:
+        cached = (leaf_info, ChildOrder.from_table(table) if table is not None else ChildOrder(leaf_info))
+        _CHILD_ORDERS[id(leaf_info)] = cached
+    return cached[1]
+
+
+class Schema(object):
+    """The schema of a generated module, decoded from its artifact.
+
+    The indexes are shared with the base classes, which look them up by the
+    schema fields they get as args. They are restored from the tables
+    precomputed into the artifact, or compiled on first use without them.
+    """
+
+    def __init__(self, name, data):
+        self.name = name
+        for field in SCHEMA_FIELDS:
+            setattr(self, field, data[field])
+        indexes = data.get('indexes')
+        if indexes:
+            compile_key_list(self.key_list, indexes['key_index'])
+            compile_namespaces(self.namespaces, indexes['namespace_index'])
+            compile_leaf_info(self.leaf_info, indexes['validator'])
+            # artifacts precomputed before the child order compile it on first use
+            if 'child_order' in indexes:
+                compile_child_order(self.leaf_info, indexes['child_order'])
+
+    def args(self):
+        """The args of ConfigBase, GetBase and InputBase"""
+        return tuple(getattr(self, field) for field in SCHEMA_FIELDS)
+
+    @property
+    def key_index(self):
+        return compile_key_list(self.key_list)
+
+    @property
+    def namespace_index(self):
+        return compile_namespaces(self.namespaces)
+
+    @property
+    def validator(self):
+        return compile_leaf_info(self.leaf_info)
+
+    @property
+    def child_order(self):
+        return compile_child_order(self.leaf_info)
+
+
+def compile_indexes(data):
+    """
+    :param data: dict of the schema fields
+    :return: the tables of the indexes, precomputed at build time into the artifacts
+    """
+    return OrderedDict([
+        ('key_index', KeyIndex(data['key_list']).to_table()),
+        ('namespace_index', NamespaceIndex(data['namespaces']).to_table()),
+        ('validator', ParamsValidator(data['leaf_info']).to_table()),
+        ('child_order', ChildOrder(data['leaf_info']).to_table()),
+    ])
+
+
+def encode_schema(data):
+    """
+    :param data: dict of the schema fields
+    :return: the compact text stored in the artifact (json, zlib, base64)
+    """
+    json_str = json.dumps(data, separators=(',', ':'))
+    return base64.b64encode(zlib.compress(json_str.encode('utf-8'), 9)).decode('ascii')
+
+
+def decode_schema(text):
+    """
+    :param text: the compact text stored in the artifact
+    :return: dict of the schema fields, the dicts are OrderedDict
+    """
+    json_str = zlib.decompress(base64.b64decode(text)).decode('utf-8')
+    return json.loads(json_str, object_pairs_hook=OrderedDict)
+
+
+def load_schema(artifact):
+    """
+    :param artifact: the schema artifact module, from module_utils/network/ne/schemas
+    :return: the Schema, decoded once per process
+    """
+    schema = _SCHEMAS.get(artifact.SCHEMA_NAME)
+    if schema is None:
+        if artifact.SCHEMA_FORMAT not in SUPPORTED_FORMATS:
+            raise ValueError('Schema %s has format %s, format %s is expected, please regenerate it.'
+                             % (artifact.SCHEMA_NAME, artifact.SCHEMA_FORMAT, SCHEMA_FORMAT))
+        schema = Schema(artifact.SCHEMA_NAME, decode_schema(artifact.SCHEMA_DATA))
+        _SCHEMAS[artifact.SCHEMA_NAME] = schema
+    return schema
+
+
+def dump_schema(name, data, line_length=76):
+    """
+    :param name: the schema name, the artifact module name
+    :param data: dict of the schema fields, the indexes are precomputed into the artifact
+    :return: the python source of the artifact module
+    """
+    data = OrderedDict((field, data[field]) for field in SCHEMA_FIELDS)
+    data['indexes'] = compile_indexes(data)
+    text = encode_schema(data)
+    lines = ["    '%s'" % text[i:i + line_length] for i in range(0, len(text), line_length)]
+    return '\n'.join([
+        '# -*- coding: utf-8 -*-',
+        '# Schema artifact of the %s module, generated by tools/schema. Do not edit.' % name,
+        '',
+        'SCHEMA_FORMAT = %d' % SCHEMA_FORMAT,
+        "SCHEMA_NAME = '%s'" % name,
+        "SCHEMA_DIGEST = '%s'" % hashlib.sha1(text.encode('ascii')).hexdigest(),
+        'SCHEMA_DATA = (',
+    ] + lines + [')', ''])
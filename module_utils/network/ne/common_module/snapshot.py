@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Snapshots of the get results, to return the list entries changed since the previous poll.
+
+The reply data is flattened into its list entries (key_list), every entry
+without the entries of its own lists. The snapshot file of the device only
+keeps a digest per entry:
+
+    { '["/interfaces/interface", [["name", "GE0/1/1"]]]': 'sha1 of the entry' }
+
+the nodes outside of all lists are kept as the entry '["", []]'.
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+from ansible.module_utils.network.ne.common_module.local_store import state_path, safe_name, read_json, write_json
+from ansible.module_utils.network.ne.common_module.xml_fragments import leaf_text
+
+# 2: the keys of the entries are stripped like the keys of the edits
+SNAPSHOT_FORMAT = 2
+
+
+class EntryIndex(object):
+    """Flatten the reply data into { entry id: (list path, keys, content) }"""
+
+    def __init__(self, list_keys):
+        self.list_keys = list_keys
+        self.entries = OrderedDict()
+
+    def flatten(self, node, path='', keys=()):
+        """
+        :return: the content of the node without its list entries, which are collected in entries
+        """
+        content = OrderedDict()
+        for name, value in node.items():
+            child_path = path + '/' + name
+            if child_path in self.list_keys:
+                for item in value if isinstance(value, list) else [value]:
+                    if not isinstance(item, dict):
+                        continue
+                    item_keys = keys + tuple((key, leaf_text(item.get(key))) for key in self.list_keys[child_path])
+                    entry_id = json.dumps([child_path, [list(key) for key in item_keys]])
+                    # the entry goes before the entries of its lists
+                    self.entries[entry_id] = None
+                    self.entries[entry_id] = (child_path, item_keys, self.flatten(item, child_path, item_keys))
+            elif isinstance(value, dict):
+                child = self.flatten(value, child_path, keys)
+                if child:
+                    content[name] = child
+            else:
+                content[name] = value
+        return content
+
+    @classmethod
+    def build(cls, data, list_keys):
+        index = cls(list_keys)
+        root = index.flatten(data or {})
+        if root:
+            index.entries[json.dumps(['', []])] = ('', (), root)
+        return index.entries
+
+
+def digest(content):
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def entry_result(entry_id, entries=None):
+    """The path, keys and, if the entries are given, content of the entry"""
+    if entries is not None:
+        path, keys, content = entries[entry_id]
+        return {'path': path, 'keys': OrderedDict(keys), 'entry': content}
+    path, keys = json.loads(entry_id)
+    return {'path': path, 'keys': OrderedDict(tuple(key) for key in keys)}
+
+
+def poll_delta(data, list_keys, device, module_name, poll):
+    """
+    Compare the reply data with the snapshot of the previous poll and replace the snapshot.
+    :param poll: the name of the poll, the snapshots of the polls of a module are independent
+    :return: { 'baseline': True on the first poll, 'added': [], 'removed': [], 'changed': [] }
+    """
+    path = state_path('snapshots', safe_name(device), '%s-%s.json' % (safe_name(module_name), safe_name(poll)))
+    previous = read_json(path)
+    if not isinstance(previous, dict) or previous.get('format') != SNAPSHOT_FORMAT:
+        previous = None
+    entries = EntryIndex.build(data, list_keys)
+    digests = OrderedDict((entry_id, digest(content)) for entry_id, (_, _, content) in entries.items())
+    old_digests = previous['entries'] if previous else {}
+    delta = {
+        'baseline': previous is None,
+        'added': [entry_result(entry_id, entries) for entry_id in digests if entry_id not in old_digests],
+        'changed': [entry_result(entry_id, entries) for entry_id, value in digests.items()
+                    if entry_id in old_digests and old_digests[entry_id] != value],
+        'removed': [entry_result(entry_id) for entry_id in old_digests if entry_id not in digests],
+    }
+    write_json(path, {'format': SNAPSHOT_FORMAT, 'time': time.time(), 'entries': digests})
+    return delta
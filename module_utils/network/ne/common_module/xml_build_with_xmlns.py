@@ -9,101 +9,162 @@ except ImportError:
 import logging
 import sys
 
+# Compiled indexes, one per xmlns info list (i.e. one per module).
+_NAMESPACE_INDEXES = {}
 
-# Collation: Sort by the length of xpathNode.
-def order_by_xpath(elem):
-    for key in elem:
-        xpath_result = key.split("/")
-    return len(xpath_result)
 
 # remove the prefix from XPATH
-# fun called before: [ { '/node1/prefix2:node2/prefix3:node3':[ text3,xmlns3 ] },... ]
-# fun called after: [ { '/node1/node2/node3':[ text3,xmlns3,'/node1/prefix2:node2/prefix3:node3' ] },... ]
-def xmlns_info_remove_prefix(xmlns_info_list):
+# '/node1/prefix2:node2/prefix3:node3' ---> '/node1/node2/node3'
+def xpath_remove_prefix(xpath):
     """
-    :param xmlns_info_list: the xmlns info list
+    :param xpath: the xpath which may contain prefixes
+    :return: the xpath without prefix
     """
-    new_xmlns_info_list = []
-    for item in xmlns_info_list:
-        new_dict = {}
-        for xapth_key in item:
-            xapth_key_list = xapth_key.split("/")[1:]
-            new_xapth_key = ''
-            for each_node in xapth_key_list:
-                new_xapth_key = new_xapth_key + "/" + each_node.split(":")[-1]
-            temp_list = item[xapth_key]
-            temp_list.append(xapth_key)
-        new_dict[new_xapth_key] = temp_list
-        new_xmlns_info_list.append(new_dict)
-    return new_xmlns_info_list
+    return ''.join('/' + node.split(":")[-1] for node in xpath.split("/")[1:])
 
-# Recursive function,to generate xml with xmlns.
-def get_all_xpath_from_new_xmlns_info(new_xmlns_info_list):
+
+# '@xmlns="XXX"@xmlns:prefix="YYY"' ---> [ ('xmlns','XXX'),('xmlns:prefix','YYY') ]
+def parse_xmlns_attributes(xmlns):
+    """
+    :param xmlns: the xmlns string from the xmlns info list
+    :return: the list of (attribute, value)
+    """
+    attributes = []
+    for item in xmlns.split("@")[1:]:
+        xmlns_key, xmlns_value = item.split("=", 1)
+        attributes.append((xmlns_key, xmlns_value.strip().strip('"')))
+    return attributes
+
+
+class NamespaceIndex(object):
+    """Compiled view of the xmlns info list generated by "_full.xml".
+
+    nodes:    { '/node1/node2': ( 'prefix2:node2', [ ('xmlns:prefix2', 'XXX') ] ) }   ( key without prefix )
+    children: { '/node1': { ( 'XXX', 'node2' ): '/node1/node2' } }
+    """
+
+    def __init__(self, xmlns_info_list):
+        self.nodes = {}
+        self.children = {}
+        self.local_children = {}
+        self.uris = set()
+        scopes = {'': {}}
+        entries = []
+        for item in xmlns_info_list:
+            for xpath_key in item:
+                entries.append((xpath_key, item[xpath_key][1]))
+        # parents first, so that the namespace scope of each parent is known
+        entries.sort(key=lambda entry: entry[0].count("/"))
+        for xpath_key, xmlns in entries:
+            path = xpath_remove_prefix(xpath_key)
+            parent, local_name = path.rsplit("/", 1)
+            original_tag_name = xpath_key.split("/")[-1]
+            attributes = parse_xmlns_attributes(xmlns) if xmlns else []
+            scope = dict(scopes.get(parent, {}))
+            for xmlns_key, xmlns_value in attributes:
+                scope[xmlns_key.partition(":")[2]] = xmlns_value
+            scopes[path] = scope
+            prefix = original_tag_name.split(":")[0] if ":" in original_tag_name else ''
+            uri = scope.get(prefix)
+            if uri:
+                self.uris.add(uri)
+            self.nodes[path] = (original_tag_name, attributes)
+            self.children.setdefault(parent, {})[(uri, local_name)] = path
+            self.local_children.setdefault(parent, {})[local_name] = path
+
+    def resolve(self, parent, uri, local_name):
+        """
+        :param parent: the module path of the parent node ( without prefix )
+        :param uri: the namespace of the reply node, None if not namespaced
+        :param local_name: the tag of the reply node without prefix
+        :return: the module path of the node, None if the node is unknown
+        """
+        if uri is None:
+            return self.local_children.get(parent, {}).get(local_name)
+        return self.children.get(parent, {}).get((uri, local_name))
+
+    def uri(self, path):
+        """
+        :param path: the module path of a node ( without prefix )
+        :return: the namespace of the node, None if the node is unknown or not namespaced
+        """
+        uris = getattr(self, '_uris', None)
+        if uris is None:
+            uris = self._uris = dict((child_path, uri) for children in self.children.values()
+                                     for (uri, local_name), child_path in children.items())
+        return uris.get(path)
+
+    def to_table(self):
+        """The json serializable tables of the index, precomputed into the schema artifacts"""
+        return {
+            'nodes': dict((path, [tag, [list(item) for item in attributes]])
+                          for path, (tag, attributes) in self.nodes.items()),
+            'children': dict((parent, [[uri, local_name, path] for (uri, local_name), path in children.items()])
+                             for parent, children in self.children.items()),
+            'local_children': self.local_children,
+            'uris': sorted(self.uris),
+        }
+
+    @classmethod
+    def from_table(cls, table):
+        """Restore the index from to_table(), without walking the xmlns info list again"""
+        index = cls.__new__(cls)
+        index.nodes = dict((path, (tag, [tuple(item) for item in attributes]))
+                           for path, (tag, attributes) in table['nodes'].items())
+        index.children = dict((parent, dict(((uri, local_name), path) for uri, local_name, path in children))
+                              for parent, children in table['children'].items())
+        index.local_children = dict(table['local_children'])
+        index.uris = set(table['uris'])
+        return index
+
+
+def compile_namespaces(xmlns_info_list, table=None):
     """
-    :param new_xmlns_info_list:  The xmlns info list generated by "_full.xml".Have been sorted and the key without prefix.
-    :return xpath_list: [ '/node1','/node1/node2','/node1/node2/node3',... ]     ( without prefix )
+    :param xmlns_info_list: the xmlns info list of a module
+    :param table: the precomputed NamespaceIndex.to_table() of the list, if any
+    :return: the NamespaceIndex, compiled once per process
     """
-    xpath_list = []
-    for item in new_xmlns_info_list:
-        for xapth_key in item:
-            xpath_list.append(xapth_key)
-    return xpath_list
+    cached = _NAMESPACE_INDEXES.get(id(xmlns_info_list))
+    if cached is None or cached[0] is not xmlns_info_list:
+        index = NamespaceIndex.from_table(table) if table is not None else NamespaceIndex(xmlns_info_list)
+        cached = (xmlns_info_list, index)
+        _NAMESPACE_INDEXES[id(xmlns_info_list)] = cached
+    return cached[1]
+
 
 # Recursive function,to generate xml with xmlns.
-def create_xml_with_xmlns(root, new_xmlns_info_list, all_xpath_without_prefix, dest_xpath, current_element):
+def create_xml_with_xmlns(root, namespace_index, dest_xpath, current_element):
     """
     :param root: The xml root which need to be rebuild.( always come from instance xml )
-    :param new_xmlns_info_list: The xmlns info list generated by "_full.xml".Have been sorted and the key without prefix.
-    :param all_xpath_without_prefix: get all xpath key from new_xmlns_info_list.Type: list
+    :param namespace_index: The NamespaceIndex compiled from "_full.xml".
     :param dest_xpath: record the path of rebuild
     :param current_element: the current generate element root
     """
-    if root.getchildren():
-        # traversing the xml root which need to be rebuild.( always come from instance xml )
-        for child_of_root in root.getchildren():
-            dest_xpath = dest_xpath + "/" + child_of_root.tag
-
-            # get value from instance xml
-            instance_value = child_of_root.text
-            instance_attributes = child_of_root.attrib  # instance_attributes: operation="XXX"
-
-            # instance node'xpath must exist in "_full.xml"
-            if dest_xpath in all_xpath_without_prefix:
-                original_tag_name = ""
-                xmlns = ""
-                value = ""
-
-                # find the same xpath from new_xmlns_info_list,get the original_tag_name
-                for new_xmlns_info_list_item in new_xmlns_info_list:
-                    for xapth_key in new_xmlns_info_list_item:
-                        if xapth_key == dest_xpath:
-                            tag_name_before = new_xmlns_info_list_item[xapth_key][2]
-                            original_tag_name = tag_name_before.split("/")[-1]
-                            value = instance_value
-                            xmlns = new_xmlns_info_list_item[xapth_key][1]
-
-                #  use the original_tag_name to rebuild sub element node.
-                sub_element = ET.SubElement(current_element, original_tag_name)
-                # set the element's value,the value come from instance xml
-                if value != '':
-                    sub_element.text = value
-                # set the element's attributes,the attributes come from instance xml.Like: operation="XXX"
-                if instance_attributes:
-                    for instance_attribute in instance_attributes:
-                        sub_element.set(instance_attribute, instance_attributes[instance_attribute])
-                #  set the element's attributes,the attributes come from "_full.xml".Like: xmlns="XXX"
-                if xmlns:
-                    xmlns_list = xmlns.split("@")
-                    for xmlns in xmlns_list[1:]:
-                        xmlns_temp = xmlns.split("=")
-                        xmlns_key = xmlns_temp[0]
-                        xmlns_value = xmlns_temp[1].strip('"')
-                        sub_element.set(xmlns_key, xmlns_value)
-                # recursive
-                create_xml_with_xmlns(child_of_root, new_xmlns_info_list, all_xpath_without_prefix, dest_xpath, sub_element)
-            else:
-                logging.info(dest_xpath+":This xpath not in the full.xml,please check.")
-            dest_xpath = dest_xpath[:-(len(child_of_root.tag)+1)]
+    # traversing the xml root which need to be rebuild.( always come from instance xml )
+    for child_of_root in list(root):
+        child_xpath = dest_xpath + "/" + child_of_root.tag
+
+        # instance node'xpath must exist in "_full.xml"
+        node = namespace_index.nodes.get(child_xpath)
+        if node is None:
+            logging.info(child_xpath + ":This xpath not in the full.xml,please check.")
+            continue
+        original_tag_name, xmlns_attributes = node
+
+        #  use the original_tag_name to rebuild sub element node.
+        sub_element = ET.SubElement(current_element, original_tag_name)
+        # set the element's value,the value come from instance xml
+        if child_of_root.text != '':
+            sub_element.text = child_of_root.text
+        # set the element's attributes,the attributes come from instance xml.Like: operation="XXX"
+        for instance_attribute, value in child_of_root.attrib.items():
+            sub_element.set(instance_attribute, value)
+        #  set the element's attributes,the attributes come from "_full.xml".Like: xmlns="XXX"
+        for xmlns_key, xmlns_value in xmlns_attributes:
+            sub_element.set(xmlns_key, xmlns_value)
+        # recursive
+        create_xml_with_xmlns(child_of_root, namespace_index, child_xpath, sub_element)
+
 
 # join xmlns into fil_content
 def xml_parser_join_xmlns(xml_content, xmlns_info_list, filter_or_config_type):
@@ -113,10 +174,7 @@ def xml_parser_join_xmlns(xml_content, xmlns_info_list, filter_or_config_type):
     :param filter_or_config_type: to distinguish filter or config message
     :return:xml_str: xml str which contain the xmlns
     """
-    xmlns_info_list.sort(key=order_by_xpath)
-    new_xmlns_info_list = xmlns_info_remove_prefix(xmlns_info_list)
-    all_xpath_without_prefix = get_all_xpath_from_new_xmlns_info(new_xmlns_info_list)
-
+    namespace_index = compile_namespaces(xmlns_info_list)
     original_root = ET.fromstring(xml_content)
     dest_xpath = ""
 
@@ -128,9 +186,9 @@ def xml_parser_join_xmlns(xml_content, xmlns_info_list, filter_or_config_type):
         generate_root.set("xmlns:nc", "urn:ietf:params:xml:ns:netconf:base:1.0")
     elif filter_or_config_type == 'rpc':
         generate_root = ET.Element('rpc')
-    create_xml_with_xmlns(original_root, new_xmlns_info_list, all_xpath_without_prefix, dest_xpath, generate_root)
+    create_xml_with_xmlns(original_root, namespace_index, dest_xpath, generate_root)
     if sys.version < "3":
         xml_str = ET.tostring(generate_root, method='xml')
     else:
         xml_str = ET.tostring(generate_root, method='xml', encoding="utf-8").decode('utf-8')
-    return xml_str
\ No newline at end of file
+    return xml_str
@@ -0,0 +1,456 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import copy
+from collections import OrderedDict
+
+from lxml import etree
+
+NETCONF_NAMESPACE = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+OPERATION_ATTRIBUTE = '{%s}operation' % NETCONF_NAMESPACE
+
+_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+
+def local_name(element):
+    return etree.QName(element).localname
+
+
+class FragmentMerger(object):
+    """Merge the <config> or <filter> fragments of several modules into one.
+
+    Nodes are matched by namespace and name, list entries also by their keys,
+    so the modules sharing a top node (e.g. /routing) send it only once. Nodes
+    with different nc:operation are never merged.
+    """
+
+    def __init__(self, list_keys):
+        """
+        :param list_keys: { '/node1/list1/entry1': [ 'key1' ] } of all the merged modules
+        """
+        self.list_keys = list_keys
+        self.root = None
+
+    def identity(self, element, path):
+        keys = self.list_keys.get(path)
+        if not keys:
+            return element.tag
+        values = dict((local_name(child), (child.text or '').strip()) for child in element
+                      if isinstance(child.tag, str))
+        return element.tag, tuple(values.get(key) for key in keys)
+
+    def add(self, xml_str):
+        fragment = etree.fromstring(xml_str.encode('utf-8'), _PARSER)
+        if self.root is None:
+            self.root = fragment
+        else:
+            self.merge_children(self.root, fragment, '')
+
+    def merge_children(self, target, source, path):
+        index = {}
+        for child in target:
+            if isinstance(child.tag, str):
+                index.setdefault(self.identity(child, path + '/' + local_name(child)), child)
+        for child in list(source):
+            if not isinstance(child.tag, str):
+                continue
+            child_path = path + '/' + local_name(child)
+            identity = self.identity(child, child_path)
+            match = index.get(identity)
+            if match is None or match.get(OPERATION_ATTRIBUTE) != child.get(OPERATION_ATTRIBUTE):
+                target.append(child)
+                index.setdefault(identity, child)
+            elif len(match) or len(child):
+                self.merge_children(match, child, child_path)
+            elif (match.text or '').strip() != (child.text or '').strip():
+                raise ValueError('%s is set to both %s and %s' % (child_path, match.text, child.text))
+
+    def tostring(self):
+        return etree.tostring(self.root, encoding='unicode')
+
+
+def merge_fragments(fragments, list_keys):
+    """
+    :param fragments: the <config> or <filter> xml strs, with xmlns
+    :param list_keys: the list keys of all the merged modules
+    :return: the merged xml str
+    """
+    merger = FragmentMerger(list_keys)
+    for fragment in fragments:
+        merger.add(fragment)
+    return merger.tostring()
+
+
+def split_filter(xml_str, parts, list_keys):
+    """
+    Split a <filter> into up to parts filters selecting independent subtrees.
+    The filter is split below its first node holding more than one subtree, when
+    they are the top containers or sibling list entries only, never inside one
+    entry. The keys of the entries and the content match nodes on the way down
+    to it are kept in every part, so the replies merge back by key.
+    :param list_keys: the list keys of the module
+    :return: the <filter> xml strs, only xml_str if it can not be split
+    """
+    root = etree.fromstring(xml_str.encode('utf-8'), _PARSER)
+    node_path = []
+    node = root
+    path = ''
+    while True:
+        keys = list_keys.get(path, [])
+        subtrees = [index for index, child in enumerate(node) if isinstance(child.tag, str)
+                    and local_name(child) not in keys and (len(child) or not (child.text or '').strip())]
+        if len(subtrees) != 1 or not len(node[subtrees[0]]):
+            break
+        node_path.append(subtrees[0])
+        node = node[subtrees[0]]
+        path += '/' + local_name(node)
+    if parts < 2 or len(subtrees) < 2:
+        return [xml_str]
+    if node_path and not all(path + '/' + local_name(node[index]) in list_keys for index in subtrees):
+        return [xml_str]
+    count = min(parts, len(subtrees))
+    groups = [subtrees[i * len(subtrees) // count:(i + 1) * len(subtrees) // count] for i in range(count)]
+    filters = []
+    for group in groups:
+        clone = copy.deepcopy(root)
+        node = clone
+        for index in node_path:
+            node = node[index]
+        children = list(node)
+        for index in subtrees:
+            if index not in group:
+                node.remove(children[index])
+        filters.append(etree.tostring(clone, encoding='unicode'))
+    return filters
+
+
+class EditSplitter(object):
+    """Split an oversized <config> into chunks of bounded size, at list entry boundaries.
+
+    The list entries found by the key index are the units of the split, sent
+    with a skeleton of their ancestors (the ancestor list entries with their
+    keys). An entry bigger than the limit is split again: its own leaves and
+    containers first, then its nested entries, so parents always go before
+    their dependents. Nodes with a nc:operation are never split.
+    """
+
+    def __init__(self, list_keys, max_size):
+        self.list_keys = list_keys
+        self.max_size = max_size
+
+    @staticmethod
+    def size(element):
+        return len(etree.tostring(element))
+
+    def is_entry(self, path):
+        return path in self.list_keys
+
+    def without_entries(self, element, path, entries, chain):
+        """
+        Copy the element without the list entries below it, the removed entries are
+        appended to entries as (entry, entry path, the elements between element and entry).
+        :return: the copy, None if only the skeleton of the removed entries is left
+        """
+        clone = etree.Element(element.tag, attrib=element.attrib, nsmap=element.nsmap)
+        clone.text = element.text
+        removed = False
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+            child_path = path + '/' + local_name(child)
+            if child.get(OPERATION_ATTRIBUTE) is not None and not self.is_entry(child_path):
+                clone.append(copy.deepcopy(child))
+                continue
+            if self.is_entry(child_path):
+                entries.append((child, child_path, chain + [element]))
+                removed = True
+                continue
+            child_clone = self.without_entries(child, child_path, entries, chain + [element])
+            if child_clone is not None:
+                clone.append(child_clone)
+            else:
+                removed = True
+        if removed and not len(clone):
+            return None
+        return clone
+
+    def skeleton(self, ancestors, path):
+        """
+        :param ancestors: the elements from the root down to the parent of the unit
+        :return: (root copy, parent copy), the list entries keep their keys
+        """
+        root = parent = None
+        for element in ancestors:
+            clone = etree.Element(element.tag, attrib=element.attrib, nsmap=element.nsmap)
+            if root is None:
+                root = clone
+            else:
+                path += '/' + local_name(element)
+                parent.append(clone)
+                for key in self.list_keys.get(path, []):
+                    for child in element:
+                        if isinstance(child.tag, str) and local_name(child) == key:
+                            clone.append(copy.deepcopy(child))
+            parent = clone
+        return root, parent
+
+    def collect(self, element, path, ancestors, units):
+        """Append the units of the element, (ancestors, fragment), parents first"""
+        entries = []
+        if element.get(OPERATION_ATTRIBUTE) is None:
+            own = self.without_entries(element, path, entries, [])
+        else:
+            own = copy.deepcopy(element)
+        if own is not None and (len(own) or (own.text or '').strip() or ancestors):
+            units.append((ancestors, own))
+        for entry, entry_path, chain in entries:
+            entry_ancestors = ancestors + chain
+            if self.size(entry) <= self.max_size or entry.get(OPERATION_ATTRIBUTE) is not None:
+                units.append((entry_ancestors, copy.deepcopy(entry)))
+            else:
+                self.collect(entry, entry_path, entry_ancestors, units)
+
+    def unit_xml(self, ancestors, fragment):
+        if not ancestors:
+            return etree.tostring(fragment, encoding='unicode')
+        root, parent = self.skeleton(ancestors, '')
+        parent.append(fragment)
+        return etree.tostring(root, encoding='unicode')
+
+    def split(self, xml_str):
+        """
+        :param xml_str: the <config> with xmlns
+        :return: the chunks, <config> xml strs of at most max_size each unless a single unit is bigger
+        """
+        if len(xml_str.encode('utf-8')) <= self.max_size:
+            return [xml_str]
+        root = etree.fromstring(xml_str.encode('utf-8'), _PARSER)
+        units = []
+        self.collect(root, '', [], units)
+        chunks = []
+        merger = None
+        chunk_size = 0
+        for ancestors, fragment in units:
+            unit = self.unit_xml(ancestors, fragment)
+            if merger is not None and chunk_size + len(unit) > self.max_size:
+                chunks.append(merger.tostring())
+                merger = None
+            if merger is None:
+                merger = FragmentMerger(self.list_keys)
+                chunk_size = 0
+            merger.add(unit)
+            chunk_size += len(unit)
+        if merger is not None:
+            chunks.append(merger.tostring())
+        return chunks
+
+
+def split_edit(xml_str, list_keys, max_size):
+    """
+    :param xml_str: the <config> with xmlns
+    :param list_keys: the list keys of the module
+    :param max_size: the maximum size of a chunk in bytes
+    :return: the <config> chunks, in the order they have to be sent
+    """
+    return EditSplitter(list_keys, max_size).split(xml_str)
+
+
+def leaf_text(value):
+    """The text of a leaf in the xmltodict result, None if it is not a leaf.
+    The list keys of the edits, reconciles, projections and poll snapshots all come from it."""
+    if isinstance(value, dict):
+        value = value.get('#text')
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    return str(value).strip()
+
+
+class EditMinimizer(object):
+    """Reduce a <config> to the changes against the existing configuration.
+
+    Only the changed leaves and list entries are kept, with their ancestors
+    and the keys of the ancestor entries. The operations are inferred:
+        new list entry                          ---> create
+        leaf set to "" which exists             ---> delete
+        changed leaf                            ---> merge (the default operation)
+    The nodes which already have an operation (operation_specs) are kept as they are.
+    """
+
+    def __init__(self, list_keys, operation_attribute='operation'):
+        """
+        :param list_keys: the list keys of the module
+        :param operation_attribute: the name of the operation attribute in the config
+        """
+        self.list_keys = list_keys
+        self.operation_attribute = operation_attribute
+
+    def find_entry(self, existing, entry, keys):
+        """The existing entry with the keys of the entry, None if it does not exist"""
+        values = dict((local_name(child), (child.text or '').strip()) for child in entry
+                      if isinstance(child.tag, str) and local_name(child) in keys)
+        candidates = existing if isinstance(existing, list) else [existing]
+        for candidate in candidates:
+            if isinstance(candidate, dict) and \
+                    all(leaf_text(candidate.get(key)) == values.get(key) for key in keys):
+                return candidate
+        return None
+
+    def minimize(self, element, existing, path=''):
+        """
+        Remove the unchanged nodes below the element.
+        :param existing: the existing configuration of the element, xmltodict result
+        :return: whether something is left to send
+        """
+        keys = self.list_keys.get(path, [])
+        changed = False
+        for child in list(element):
+            if not isinstance(child.tag, str):
+                continue
+            name = local_name(child)
+            child_path = path + '/' + name
+            existing_child = existing.get(name) if isinstance(existing, dict) else None
+            if name in keys:
+                continue
+            if child.get(self.operation_attribute) is not None:
+                changed = True
+            elif child_path in self.list_keys:
+                existing_entry = self.find_entry(existing_child, child, self.list_keys[child_path])
+                if existing_entry is None:
+                    child.set(self.operation_attribute, 'create')
+                    changed = True
+                elif self.minimize(child, existing_entry, child_path):
+                    changed = True
+                else:
+                    element.remove(child)
+            elif len(child):
+                if self.minimize(child, existing_child if isinstance(existing_child, dict) else {}, child_path):
+                    changed = True
+                else:
+                    element.remove(child)
+            else:
+                text = (child.text or '').strip()
+                old_text = leaf_text(existing_child)
+                if text == '' and old_text:
+                    child.set(self.operation_attribute, 'delete')
+                    changed = True
+                elif text == '' or text == old_text:
+                    # an empty node clears nothing the device does not have
+                    element.remove(child)
+                else:
+                    changed = True
+        return changed
+
+
+def minimize_edit(root, existing, list_keys, operation_attribute='operation'):
+    """
+    :param root: the <config> element, without xmlns, changed in place
+    :param existing: the existing configuration, the xmltodict result of the reply data
+    :param list_keys: the list keys of the module
+    :return: whether something is left to send
+    """
+    return EditMinimizer(list_keys, operation_attribute).minimize(root, existing or {})
+
+
+class ListReconciler(object):
+    """Override the lists of a <config>: the existing entries which are not proposed are deleted.
+
+    Only the lists given in the config are overridden, in the proposed entries too.
+    The existing entries of every list are indexed by their keys once, so the
+    proposed entries are matched and the entries to delete are found in time
+    linear in the size of the lists.
+    """
+
+    def __init__(self, list_keys, operation_attribute='operation'):
+        self.list_keys = list_keys
+        self.operation_attribute = operation_attribute
+
+    @staticmethod
+    def entry_key(entry, keys):
+        values = dict((local_name(child), (child.text or '').strip()) for child in entry
+                      if isinstance(child.tag, str) and local_name(child) in keys)
+        return tuple(values.get(key) for key in keys)
+
+    @staticmethod
+    def index_entries(existing, keys):
+        """The existing entries by their keys, in the existing order"""
+        index = OrderedDict()
+        for entry in existing if isinstance(existing, list) else [existing]:
+            if isinstance(entry, dict):
+                index.setdefault(tuple(leaf_text(entry.get(key)) for key in keys), entry)
+        return index
+
+    def group_entries(self, element, path):
+        """The list entries below the element by their name, and the other nodes"""
+        entries = OrderedDict()
+        nodes = []
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+            child_path = path + '/' + local_name(child)
+            if child_path in self.list_keys:
+                entries.setdefault(local_name(child), []).append(child)
+            else:
+                nodes.append((child, child_path))
+        return entries, nodes
+
+    def delete_entry(self, entry, keys, key):
+        node = entry.makeelement(entry.tag, {self.operation_attribute: 'delete'})
+        for name, value in zip(keys, key):
+            etree.SubElement(node, name).text = value
+        return node
+
+    def override(self, element, existing, path=''):
+        """
+        Add the deletes of the existing entries which are not proposed, before the proposed ones.
+        :param existing: the existing configuration of the element, xmltodict result
+        :return: the number of the entries deleted
+        """
+        deleted = 0
+        entries, nodes = self.group_entries(element, path)
+        for child, child_path in nodes:
+            if len(child) and child.get(self.operation_attribute) is None:
+                existing_child = existing.get(local_name(child)) if isinstance(existing, dict) else None
+                deleted += self.override(child, existing_child, child_path)
+        for name, proposed in entries.items():
+            child_path = path + '/' + name
+            keys = self.list_keys[child_path]
+            index = self.index_entries(existing.get(name) if isinstance(existing, dict) else None, keys)
+            for entry in proposed:
+                existing_entry = index.pop(self.entry_key(entry, keys), None)
+                # replace, create and delete already decide the content of the entry
+                if existing_entry is not None and entry.get(self.operation_attribute) is None:
+                    deleted += self.override(entry, existing_entry, child_path)
+            for key in index:
+                if None not in key:
+                    proposed[0].addprevious(self.delete_entry(proposed[0], keys, key))
+                    deleted += 1
+        return deleted
+
+    def select_keys(self, element, path=''):
+        """Add the selection of the keys of all the entries of the lists given in a filter"""
+        entries, nodes = self.group_entries(element, path)
+        for child, child_path in nodes:
+            self.select_keys(child, child_path)
+        for name, proposed in entries.items():
+            child_path = path + '/' + name
+            selection = proposed[0].makeelement(proposed[0].tag)
+            for key in self.list_keys[child_path]:
+                etree.SubElement(selection, key)
+            proposed[0].addprevious(selection)
+            for entry in proposed:
+                self.select_keys(entry, child_path)
+
+
+def override_lists(root, existing, list_keys, operation_attribute='operation'):
+    """
+    :param root: the <config> element, without xmlns, changed in place
+    :param existing: the existing configuration, the xmltodict result of the reply data
+    :return: the number of the entries deleted
+    """
+    return ListReconciler(list_keys, operation_attribute).override(root, existing or {})
+
+
+def select_list_keys(root, list_keys):
+    """
+    :param root: the <filter> element, without xmlns, changed in place
+    """
+    ListReconciler(list_keys).select_keys(root)
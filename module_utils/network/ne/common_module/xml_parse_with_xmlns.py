@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8
+from xml.parsers import expat
+
+from ansible.module_utils.network.ne.common_module import xmltodict
+from ansible.module_utils.network.ne.common_module.xml_build_with_xmlns import compile_namespaces
+
+# expat reports namespaced names as "uri<separator>local_name"
+NAMESPACE_SEPARATOR = ' '
+
+
+def split_expanded_name(full_name):
+    """
+    :param full_name: the name reported by expat
+    :return: (uri, local_name), uri is None if the node is not namespaced
+    """
+    uri, separator, local_name = full_name.rpartition(NAMESPACE_SEPARATOR)
+    if not separator:
+        return None, full_name
+    return uri, local_name
+
+
+class ReplyHandler(xmltodict._DictSAXHandler):
+    """Build the reply dict, mapping namespaced nodes back to module paths.
+
+    Nodes which are not in the module's xmlns info list are pruned as soon as
+    they start, so neither they nor their subtree ever enter the result dict.
+    """
+
+    def __init__(self, namespace_index=None, max_depth=None, **kwargs):
+        super(ReplyHandler, self).__init__(**kwargs)
+        self.namespace_index = namespace_index
+        self.max_depth = max_depth
+        self.module_path = []
+        self.skip_depth = 0
+
+    def startElement(self, full_name, attrs):
+        if self.skip_depth:
+            self.skip_depth += 1
+            return
+        uri, local_name = split_expanded_name(full_name)
+        # the root node (<data>, <rpc-reply>) is always kept
+        if self.module_path:
+            if self.max_depth is not None and len(self.module_path) > self.max_depth:
+                self.skip_depth = 1
+                return
+            if self.namespace_index is not None:
+                path = self.namespace_index.resolve(self.module_path[-1], uri, local_name)
+                if path is None:
+                    self.skip_depth = 1
+                    return
+            else:
+                path = self.module_path[-1] + "/" + local_name
+        else:
+            path = ''
+        self.module_path.append(path)
+        attributes = self.dict_constructor()
+        for key, value in zip(attrs[0::2], attrs[1::2]):
+            attributes[split_expanded_name(key)[1]] = value
+        super(ReplyHandler, self).startElement(local_name, attributes)
+
+    def endElement(self, full_name):
+        if self.skip_depth:
+            self.skip_depth -= 1
+            return
+        self.module_path.pop()
+        super(ReplyHandler, self).endElement(split_expanded_name(full_name)[1])
+
+    def characters(self, data):
+        if self.skip_depth:
+            return
+        super(ReplyHandler, self).characters(data)
+
+
+# parse the reply into dict, the xmlns are removed during the parsing
+def xml_parser_strip_xmlns(xml_content, xmlns_info_list=None, max_depth=None):
+    """
+    :param xml_content: the reply xml str
+    :param xmlns_info_list: xmlns info list generated by "_full.xml", the nodes
+                            not in the list are pruned. None to keep every node.
+    :param max_depth: the depth below the root node from which nodes are pruned
+    :return: the reply dict, without xmlns
+    """
+    namespace_index = compile_namespaces(xmlns_info_list) if xmlns_info_list is not None else None
+    handler = ReplyHandler(namespace_index=namespace_index, max_depth=max_depth)
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode('utf-8')
+    parser = expat.ParserCreate(None, NAMESPACE_SEPARATOR)
+    parser.ordered_attributes = True
+    parser.StartElementHandler = handler.startElement
+    parser.EndElementHandler = handler.endElement
+    parser.CharacterDataHandler = handler.characters
+    parser.buffer_text = True
+    # entities are not expanded
+    parser.DefaultHandler = lambda x: None
+    parser.ExternalEntityRefHandler = lambda *x: 1
+    parser.Parse(xml_content, True)
+    return handler.item
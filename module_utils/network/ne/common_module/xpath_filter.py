@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+XPath filters (RFC 6241 :xpath) written with the node names of the module.
+
+    /routing/srv6/locators/locator[starts-with(name, 'A')]
+        ---> select="/n0:routing/n1:srv6/n1:locators/n1:locator[starts-with(n1:name, 'A')]"
+             xmlns:n0="urn:ietf:params:xml:ns:yang:ietf-routing" xmlns:n1="..."
+
+The names are qualified with the namespaces of the module's xmlns info list.
+When the device does not advertise :xpath, the same expression filters the
+reply of the subtree filter locally.
+"""
+import re
+import copy
+
+from lxml import etree
+
+from ansible.module_utils.network.ne.common_module.xml_build_with_xmlns import compile_namespaces
+
+XPATH_CAPABILITY = ':xpath'
+
+_TOKENS = re.compile(r"""\s*(?:
+    (?P<literal>"[^"]*"|'[^']*')
+  | (?P<number>\d+(?:\.\d*)?|\.\d+)
+  | (?P<operator>\.\.|::|//|!=|<=|>=|[/\[\]()@,|=<>*+.$-])
+  | (?P<name>[A-Za-z_][\w.-]*(?::[A-Za-z_][\w.-]*)?)
+)""", re.X)
+# the tokens after which a name is an operator name (and, or, div, mod) instead of a node name
+_OPERAND_ENDS = ('literal', 'number', 'name', ')', ']', '.', '..', '*')
+# the tokens after which a new relative location path starts
+_PATH_STARTS = ('[', '(', ',', '|', '=', '!=', '<', '<=', '>', '>=', '+', '-', 'multiply', 'and', 'or', None)
+# the operators written with spaces around them when they follow an operand, '-' would
+# otherwise join the names and numbers around it into one name: as - 1 is not as-1
+_BINARY_OPERATORS = ('|', '=', '!=', '<', '<=', '>', '>=', '+', '-', '*')
+
+
+class XPathRewriter(object):
+    """Qualify the node names of an XPath expression with the namespaces of the module"""
+
+    def __init__(self, namespace_index):
+        self.namespace_index = namespace_index
+        self.prefixes = {}
+
+    def prefix(self, uri):
+        if uri not in self.prefixes:
+            self.prefixes[uri] = 'n%d' % len(self.prefixes)
+        return self.prefixes[uri]
+
+    def descendant(self, base, name):
+        """The path of the first node named name below base, for //name"""
+        for path in sorted(self.namespace_index.nodes):
+            if path.startswith(base + '/') and path.endswith('/' + name):
+                return path
+        return None
+
+    def tokenize(self, xpath):
+        pos = 0
+        xpath = xpath.strip()
+        while pos < len(xpath):
+            match = _TOKENS.match(xpath, pos)
+            if match is None or match.end() == pos:
+                raise ValueError('Invalid XPath at %d: %s' % (pos, xpath))
+            pos = match.end()
+            kind = match.lastgroup
+            yield kind, match.group(kind)
+
+    def rewrite(self, xpath):
+        """
+        :param xpath: the XPath expression with the node names of the module
+        :return: the qualified expression
+        :raise ValueError: if the expression is invalid or names an unknown node
+        """
+        tokens = list(self.tokenize(xpath))
+        result = []
+        # the paths of the context nodes of the open predicates, '' is the root
+        contexts = ['']
+        base = ''
+        previous = None
+        for index, (kind, value) in enumerate(tokens):
+            following = tokens[index + 1][1] if index + 1 < len(tokens) else None
+            after_operand = previous in _OPERAND_ENDS
+            if previous is None or previous in _PATH_STARTS:
+                # a new relative location path starts from the context node
+                base = contexts[-1]
+            if kind == 'name' and after_operand:
+                # and, or, div, mod
+                result.append(' %s ' % value)
+                previous = value
+            elif kind == 'operator':
+                if value == '[':
+                    contexts.append(base)
+                elif value == ']':
+                    base = contexts.pop()
+                elif value in ('/', '//') and (previous is None or previous in _PATH_STARTS):
+                    base = ''
+                elif value == '..':
+                    base = base.rsplit('/', 1)[0]
+                elif value == '*' and not after_operand:
+                    raise ValueError('Wildcard node tests are not supported in the XPath %s' % xpath)
+                if after_operand and value in _BINARY_OPERATORS:
+                    result.append(' %s ' % value)
+                    # the operand after a multiplication starts a new path, like after the other operators
+                    previous = 'multiply' if value == '*' else value
+                else:
+                    result.append(value)
+                    previous = value
+            elif kind == 'name' and following not in ('(', '::') and previous not in ('@', '$'):
+                local_name = value.split(':')[-1]
+                path = self.descendant(base, local_name) if previous == '//' else base + '/' + local_name
+                if path is None or path not in self.namespace_index.nodes:
+                    raise ValueError('Unknown node %s in the XPath %s' % (value, xpath))
+                uri = self.namespace_index.uri(path)
+                result.append('%s:%s' % (self.prefix(uri), local_name) if uri else local_name)
+                base = path
+                previous = 'name'
+            else:
+                # literals, numbers, functions, axes, attributes and variables
+                result.append(value)
+                previous = kind if kind in ('literal', 'number') else value
+                if kind == 'name' and following not in ('(', '::'):
+                    previous = 'name'
+        if len(contexts) != 1:
+            raise ValueError('Unbalanced predicates in the XPath %s' % xpath)
+        return ''.join(result)
+
+    @property
+    def nsmap(self):
+        return dict((prefix, uri) for uri, prefix in self.prefixes.items())
+
+
+def qualify_xpath(xpath, xmlns_info_list):
+    """
+    :param xpath: the XPath expression with the node names of the module
+    :param xmlns_info_list: the xmlns info list of the module
+    :return: (the qualified expression, { prefix: namespace })
+    :raise ValueError: if the expression is invalid or names an unknown node
+    """
+    rewriter = XPathRewriter(compile_namespaces(xmlns_info_list))
+    select = rewriter.rewrite(xpath)
+    return select, rewriter.nsmap
+
+
+def xpath_filter_str(select, nsmap):
+    """The <filter type="xpath"> of the qualified expression"""
+    element = etree.Element('filter', nsmap=nsmap)
+    element.set('type', 'xpath')
+    element.set('select', select)
+    return etree.tostring(element, encoding='unicode')
+
+
+def filter_reply(reply, select, nsmap):
+    """
+    Filter a reply locally, when the device does not support XPath filters.
+    The nodes selected are kept with their ancestors and the leaves of their
+    ancestors, which hold the keys of the ancestor list entries.
+    :param reply: the <rpc-reply> of the subtree filter
+    :return: the filtered reply
+    """
+    if isinstance(reply, str):
+        reply = reply.encode('utf-8')
+    root = etree.fromstring(reply, etree.XMLParser(remove_blank_text=True, resolve_entities=False))
+    data = root if etree.QName(root).localname == 'data' else \
+        next((child for child in root if isinstance(child.tag, str) and etree.QName(child).localname == 'data'), None)
+    if data is None:
+        return reply.decode('utf-8')
+    for child in list(data):
+        if not isinstance(child.tag, str):
+            continue
+        # every top node in a document of its own, for the absolute expression
+        document = etree.ElementTree(copy.deepcopy(child))
+        selected = [node for node in document.xpath(select, namespaces=nsmap) if isinstance(node, etree._Element)]
+        if not selected:
+            data.remove(child)
+            continue
+        keep = set()
+        for node in selected:
+            keep.update(node.iter())
+            for ancestor in node.iterancestors():
+                keep.add(ancestor)
+                keep.update(leaf for leaf in ancestor if isinstance(leaf.tag, str) and len(leaf) == 0)
+        for node in list(document.getroot().iter()):
+            if node not in keep and node.getparent() is not None:
+                node.getparent().remove(node)
+        data.replace(child, document.getroot())
+    return etree.tostring(root, encoding='unicode')
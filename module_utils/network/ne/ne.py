@@ -17,10 +17,12 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import os
 import re
 import json
 
 from contextlib import contextmanager
+from itertools import groupby
 from ansible.module_utils.six import iteritems
 from ansible.module_utils.connection import Connection, ConnectionError
 
@@ -166,6 +168,24 @@ def get_configuration(module, format='xml', filter=None):
     return reply
 
 
+def get_device_id(module):
+    """The name of the device in the files kept on the control node: its host,
+    or the persistent connection of the device when the host is not a param"""
+    provider = module.params.get('provider') or dict()
+    host = module.params.get('host') or provider.get('host')
+    if host:
+        return '%s_%s' % (host, module.params.get('port') or provider.get('port') or '')
+    return os.path.basename(getattr(module, '_socket_path', None) or 'local')
+
+
+def get_plugin_connection(module):
+    """The connection for the netconf plugin methods returning json instead of a netconf reply,
+    which NetconfConnection would parse as xml"""
+    if not hasattr(module, '_ne_plugin_connection'):
+        module._ne_plugin_connection = Connection(module._socket_path)
+    return module._ne_plugin_connection
+
+
 def get_nc_connection(module):
     """ get_config """
 
@@ -190,26 +210,145 @@ def set_nc_config(module, xml_str, *args, **kwargs):
     return to_string(to_xml(out))
 
 
-def get_config(module, flags=None):
-    global _DEVICE_CONFIGS
+WITH_DEFAULTS_CAPABILITY = 'urn:ietf:params:netconf:capability:with-defaults:1.0'
+NMDA_NAMESPACE = 'urn:ietf:params:xml:ns:yang:ietf-netconf-nmda'
 
-    if _DEVICE_CONFIGS != {}:
-        return _DEVICE_CONFIGS
-    else:
-        connection = get_connection(module)
-        out = connection.get_config()
-        cfg = to_text(out, errors='surrogate_then_replace').strip()
-        _DEVICE_CONFIGS = cfg
-        return cfg
 
+def has_capability(module, capability):
+    """Whether the server advertises the netconf capability, e.g. ':candidate'"""
+    prefix = 'urn:ietf:params:netconf:capability' + capability + ':'
+    return any(c.startswith(prefix) for c in get_capabilities(module).get('server_capabilities', []))
+
+
+def with_defaults_modes(module):
+    """The with-defaults modes (RFC 6243) the server supports, empty if it does not advertise :with-defaults"""
+    for capability in get_capabilities(module).get('server_capabilities', []):
+        if capability.startswith(WITH_DEFAULTS_CAPABILITY):
+            query = dict(item.partition('=')[::2] for item in capability.partition('?')[2].split('&') if item)
+            modes = set(query.get('also-supported', '').split(','))
+            modes.add(query.get('basic-mode', ''))
+            modes.discard('')
+            return modes
+    return set()
+
+
+def has_yang_module(module, namespace):
+    """Whether the server advertises the yang module of the namespace"""
+    return any(c.partition('?')[0] == namespace for c in get_capabilities(module).get('server_capabilities', []))
+
+
+@contextmanager
+def candidate_transaction(module, confirm_timeout=None, error_option='rollback-on-error', persist=None,
+                          persist_id=None):
+    """ Lock the candidate, yield the function sending an edit-config into it, commit once and unlock.
+
+    The candidate is discarded if an edit or the commit fails ( the body raises
+    ConnectionError ), so running is never left half configured. A confirm_timeout
+    makes the commit a confirmed commit, reverted by the device unless another
+    commit confirms it in time ( see confirm_commit ). With persist the confirmed
+    commit survives the end of the session and is confirmed by a commit with that
+    persist_id.
+    :raise ConnectionError: if an edit or the commit fails
+    """
+    if not has_capability(module, ':candidate'):
+        module.fail_json(msg='The device does not support the candidate datastore.')
+    if (confirm_timeout or persist_id) and not has_capability(module, ':confirmed-commit'):
+        module.fail_json(msg='The device does not support the confirmed commit.')
+    if persist and not confirm_timeout:
+        module.fail_json(msg='persist is only valid with confirm_timeout.')
+    if persist and persist_id:
+        module.fail_json(msg='persist and persist_id are mutually exclusive.')
+
+    conn = get_nc_connection(module)
+
+    def edit(xml_str):
+        """:return: the reply of the edit-config"""
+        return to_string(to_xml(conn.edit_config(target='candidate', config=xml_str, error_option=error_option)))
+
+    conn.lock(target='candidate')
+    try:
+        yield edit
+        conn.commit(confirmed=bool(confirm_timeout), timeout=confirm_timeout or None, persist=persist,
+                    persist_id=persist_id)
+    except ConnectionError as exc:
+        # the failure of the edit is the one to report, not the one of the discard
+        try:
+            conn.discard_changes()
+        except ConnectionError as discard_exc:
+            module.warn('The candidate could not be discarded: %s' % to_text(discard_exc))
+        raise exc
+    finally:
+        conn.unlock(target='candidate')
 
-def get_nc_config(module, xml_str, *args, **kwargs):
+
+def edit_candidate(module, xml_strs, confirm_timeout=None, error_option='rollback-on-error', persist=None,
+                   persist_id=None):
+    """ Send the edit-configs into the candidate and commit them once, see candidate_transaction.
+
+    :return: the replies of the edit-configs
+    :raise ConnectionError: if an edit or the commit fails
+    """
+    with candidate_transaction(module, confirm_timeout, error_option, persist, persist_id) as edit:
+        return [edit(xml_str) for xml_str in xml_strs]
+
+
+def confirm_commit(module, persist_id=None):
+    """ Confirm the pending confirmed commit with a plain commit, a persistent one with its persist_id
+
+    :return: the reply of the commit
+    """
+    if not has_capability(module, ':confirmed-commit'):
+        module.fail_json(msg='The device does not support the confirmed commit.')
+    conn = get_nc_connection(module)
+    try:
+        out = conn.commit(persist_id=persist_id)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc))
+    return to_string(to_xml(out))
+
+
+# The seconds a configuration fetched by get_config is reused by the next tasks, 0 disables the cache.
+# Off by default: the cache can not see the changes made by other sessions to the device.
+CONFIG_CACHE_TTL = 0
+
+
+def get_config(module, flags=None, ttl=None):
+    """ The running configuration, cached by the persistent connection of the device.
+
+    The cache is keyed by the flags (the filter of the fetch) and dropped by the
+    connection whenever it sends a command or rpc which may change the
+    configuration, e.g. set_nc_config, the ConfigBase edits or the ne_config
+    merge, replace and rollback.
+    :param flags: the cli: appended to display current-configuration, e.g. ['configuration', 'aaa'];
+                  netconf: the filter of get-config
+    :param ttl: the seconds a cached configuration is reused, module.params['config_cache_ttl']
+                or CONFIG_CACHE_TTL if None
+    """
+    if ttl is None:
+        ttl = module.params.get('config_cache_ttl')
+    if ttl is None:
+        ttl = CONFIG_CACHE_TTL
+    connection = get_plugin_connection(module)
+    try:
+        if get_capabilities(module).get('network_api') == 'netconf':
+            out = connection.get_config(source='running', filter=flags, ttl=ttl)
+        else:
+            out = connection.get_config(flags=flags, ttl=ttl)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc))
+    return to_text(out, errors='surrogate_then_replace').strip()
+
+
+def get_nc_config(module, xml_str, with_defaults=None, *args, **kwargs):
     """ get_config """
 
     conn = get_nc_connection(module)
     if xml_str is not None:
         try:
-            response = conn.get(xml_str)
+            if with_defaults:
+                response = conn.get(xml_str, with_defaults=with_defaults)
+            else:
+                response = conn.get(xml_str)
         except ConnectionError as exc:
             module.fail_json(msg=to_text(exc))
         finally:
@@ -219,6 +358,31 @@ def get_nc_config(module, xml_str, *args, **kwargs):
     return to_string(to_xml(response))
 
 
+def get_nc_data(module, xml_str, datastore='operational', max_depth=None, with_defaults=None):
+    """ get-data (RFC 8526), the server has to advertise ietf-netconf-nmda """
+
+    conn = get_nc_connection(module)
+    if xml_str is None:
+        return None
+    try:
+        response = conn.get_data(datastore=datastore, filter=xml_str, max_depth=max_depth,
+                                 with_defaults=with_defaults)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc))
+    return to_string(to_xml(response))
+
+
+def get_nc_parallel(module, filters, sessions=1, source=None, with_defaults=None):
+    """ get (get-config if source is given) of the filters, sent concurrently, see Netconf.get_parallel """
+
+    conn = get_plugin_connection(module)
+    try:
+        replies = conn.get_parallel(filters, sessions=sessions, source=source, with_defaults=with_defaults)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc))
+    return [to_string(reply) for reply in replies]
+
+
 def execute_nc_action(module, xml_str, *args, **kwargs):
     """ huawei execute-action """
 
@@ -250,6 +414,19 @@ def execute_nc_action_yang(module, xml_str, *args, **kwargs):
     return to_string(to_xml(response))
 
 
+def execute_nc_pipeline(module, xml_strs, window=8):
+    """ huawei execute-action_yang of several rpcs, pipelined with at most window of them in flight
+
+    :return: { 'ok': whether the rpc succeeded, 'xml': its rpc-reply } of the rpcs, in their order
+    """
+    conn = get_plugin_connection(module)
+    try:
+        replies = conn.dispatch_pipeline(xml_strs, window=window)
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc))
+    return [{'ok': reply['ok'], 'xml': to_string(reply['xml'])} for reply in replies]
+
+
 def execute_nc_cli(module, xml_str, *args, **kwargs):
     """ huawei execute-cli """
 
@@ -272,19 +449,31 @@ def check_args(module, warnings):
     pass
 
 
-def run_commands(module, commands):
+def run_commands(module, commands, batch_size=None):
+    """ Send the cli commands, :return: [ command, output, command, output ... ]
+
+    :param batch_size: more than 1 sends the runs of commands which ask no question in blocks of
+                       batch_size, see Cliconf.run_batch; module.params['cli_batch_size'] if None
+    """
+    if batch_size is None:
+        batch_size = module.params.get('cli_batch_size') or 1
     responses = list()
     connection = get_connection(module)
 
-    for cmd in to_list(commands):
-        out = connection.get(**cmd)
-
-        try:
-            out = to_text(out, errors='surrogate_or_strict')
-        except UnicodeError:
-            module.fail_json(msg=u'Failed to decode output from %s: %s' % (cmd, to_text(out)))
-        responses.append(cmd)
-        responses.append(out)
+    for batched, group in groupby(to_list(commands), key=lambda cmd: batch_size > 1 and not cmd.get('prompt')):
+        group = list(group)
+        if batched and len(group) > 1:
+            outputs = connection.run_batch([cmd['command'] for cmd in group], batch_size=batch_size)
+        else:
+            outputs = (connection.get(**cmd) for cmd in group)
+
+        for cmd, out in zip(group, outputs):
+            try:
+                out = to_text(out, errors='surrogate_or_strict')
+            except UnicodeError:
+                module.fail_json(msg=u'Failed to decode output from %s: %s' % (cmd, to_text(out)))
+            responses.append(cmd)
+            responses.append(out)
 
     return responses
 
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_105 module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_105'
+SCHEMA_DIGEST = '177fa5bb8b796973ba6da4bba6a9635151f68a99'
+SCHEMA_DATA = (
+    'eNrtXV9vpDgS/y5IJyWzkE4ymayC9m5upbt7Ot3TvdFcRLrdCRpC9wEdTdTDd18bA/4PNjZ0VprR'
+    'qNMNplwul8vlXxX2yUuK5+MryKvH8gA2Xnjyiv2xSvNn9LV6PwAv9LbppvJ8b3+o0n1eohubfV4V'
+    '+yw4ZEkOgkOxr/abfVZSz2RpiZ4BGUDESwMqgxXjG32Bsirg/QL8/5gWYOuFuyQrQe17efKqUywt'
+    '03KwOpAnTxlN6WkPGZSRysAbyIKOvc3LPt0ASCJqb9x4XZHb/luSZV4so1W+lxV4DdKtRhOSAiRB'
+    'st0WoCw1ipfF232w2T07avUW7JJjVgXZfpNU+0JLULhooNlFB1DATqqgDgUg3wbfg5IRi6Ia9M/3'
+    'np4Pg+18zvZPybC+JbRQ07yS98EuDUr4Yar/3XPDHLSFdAWGO2+r0xXp4e0uOObpJoG8DvFQgmfU'
+    'ikDDNNTcP6xyjtQN5JvkUB6zBD07zPH+WGyA9sCoiWKadqKo+mIZo67TEcShALv0+7DeaNuEDOTP'
+    '1cuonjd9WUHRbwbrRfLI0Cg1FSQ7sGVqsg2ewEvylkLroTkPoGe21d0Iw/tvx0NQIdkHaEhoSEJQ'
+    '8gwku8c03+25GXRgohyb/U58vT7VWkS+N79emB+zDGpFUlWggAMjgtPKN/DuhVVxBKSDo5iaGmch'
+    '3k2oRJNV1SDVBkmuU498ilURBjl0ZwpsIXSJ+wYTNj8/T5ejF10HD78H/0qCXXy6q9frq5ELHsc0'
+    'I3reEXDE1219IfBxebr274e5of2MWZRB4nm4VDXOSbEfLDIhqXwbZw2hnCDi6ySD6oEtnm5ziiR/'
+    'hk9F0bV/d/tw93D/6+3DlzjmfSLa0RH8mVkMEeUFOVQL3mGS+EWttyPxf2YZBoJHJDo+Fobg4iL8'
+    'gYY+HPdw9Mdw2MPBH15e8NdCZBG+1BcXkjtfZTQuf8Cyt1/g9S/xj1v45y5GZWJY8ib+2nzFn5fQ'
+    '+FyePtd6hS8vL/4SrdeH039q9PnvOv7l8itsIeTrf2H8C2Tzvu6+N5+Qj6tPsIqrT5eYp7bcJ3z3'
+    'axgKl2AVV4iqemBzviRloRZQecf6RRzNnxp1Po2ifXTHhvvzrf9wH8esc8/68O2sJPW/55kYKbdd'
+    '6p3PO3lRthsN2PKQYM/w5K2KKuxtfeTBuv7+/TXLy7Co/rr2jkUepqDahYekSF7LEN4K4b13WE1z'
+    'vZsm1uhBmhRsMkMbfVUuHJpqWQJD5QXaaDoK8ZxEtwBd0WlD49g9JSXgW0ERNmiP+pZpSwcoqWWA'
+    'v3WWM/KQWRUrlRcfp8pMzbLWDD4xRp/MMRqk+8JO+gbdwUMuwks+J/3UU3XGI55vEY8B/H/jjs2G'
+    'sBs2kfxCvG6mxyO6ojMeUbm1k2YRRtw0DC48wmbxQTcLXtBpFSzmplEdE0aDtb3JedKR9/tNGN7c'
+    'fjYbx1JiE9hJ4SRYZahlh+S5tyk3U5iRkNI1NswvI8vDPul47OBvY3bcYR2z8E8DXBGFPs3QDKqq'
+    'WZpCQWRQSeG/q/5jngaRCmdpD4uuRd719TzNYOqZoyVBPzwxPMfPOYGuI9gXXs8gB45LpxNS87eD'
+    'w1z5mDLik2wq/tE5LhUoq5tpJpYiZMGIoWs8TsmCF6gW/dLOnh+KmgVPHT4ydSJkqEznI8Br97Bb'
+    'wvMru/a+9gIPF19PbhHHz/yGjLq0gBcwVvei7RUiIZHXABzLtpznYlERsOEabDaXbT7DwaJtlweR'
+    'zqH8Uk7mmrqbr0nji904c8bU1czbDBIrm9Ef4aqynvTwd3p5fKu3PDak7IjRHmD27u9csdjSdDVv'
+    'M5doDN7Ku9CrYxkFZ34tqO1svTP3F1sSW+O5+0+o8wz9yfzo52ImZn6G3pZwdS7Z9EkJTmfn6Xyc'
+    'Sw5sGsV5jIDIyMJWgfm9P2z222a43N8vbSpkjJxTFpI4c+T9M99e/eO/d2eVjcjYucXUxMiXn1yk'
+    'fHwEY4IuwLVIKORlcSEoWEYzCgVLrj+AcVI17AMoIPeokK2hWJ99OEY/sP72l0nWxodVSYbXP4lM'
+    '++/pFuV47zfBazsbH0ARvB3yP4vAFQ2J69j3no5lmsP19GOVNAaxNyG+Bw3f4wtIoGPq/QZZ36XP'
+    'f/Pw1SpJM3R1RS5/A++PzesckMaq40ElC4UgmsnTn/x448RPfxx1QSt+Ivpe7OxSgaqlEXBvpzoT'
+    'hRcUvpfmW/AdNPlySELNz+7HIaleSht5TeR4WbHynTosL6RCj1A4jcQmVtkspHCtHdlZJIzq4VaQ'
+    'Y+1Ej7RrTTqNkOhFDgcm0/ZmTJKcQD+KvC63ELZPN7fQi2MNKbR1qe76Ucw3ED1BEvwIc/inQdqg'
+    'HoMDHa5O85OwvSLBIDo+Iy/JpetJUvJkz9FpeGyqHVd6ynDC7cU6bkWtQ2O63DU7al26GkkZIxrR'
+    '5gNq5Q9YKcOqTS7rUrwIC80vLfeeY0BUhJWYBSbL5xpVqJU8fUuVjjWkaLSJYXKq7PuUGi50spMD'
+    'wmxqE5+C5KACJuGIywhyQJ7P/xGTdVy0gcrKkWTBsGMs0DW9pLDtaFuRrBkqzUVHV3v7Q5JStB7T'
+    'N9/Co2y2CJ/yoUWCJHfQWRpaj5JEDEk6BDt9Bt1Vo9wMu85k1I0b9cGAqK2qkSQqqPMHXFbMpwco'
+    'wvYuq1RF5Uei5XYs0E5s2Y3SpHRIlQ5Us+FkgwG14ifToVlURYOEc+lIrMHYXLEBVkVY1L3omFUF'
+    'E5acxvyq1Sw+ADgj5yshyCfG2Oasnoqj0eGsOavkQ1ZC9Gh6561I8EcSibGgKw2kDAc0LGtr4xGy'
+    '8MBSnbOSYP8K8JxZMMACmmsGVDK2FdNKipQPI9TnEmEPANDQ7lmZWYlIrRz5RFzWaHePNINTTPOC'
+    'PHrhUx9O8T3ybUUwFp+GbYzIKTGXcdAm9iMToKXdeYAHcjTxIQeNmo4lejL8ybDxnQMrB4SMZckB'
+    'QYPgkTFxAhmpwCU70MyoMy3BeRwY942qdAFca1XZglPtHyv4S6s+jEThTxuYaxyuNDUNHH5lgoEZ'
+    'q7cM4DIFywaB12nDbTRY4TnASPWVUjRYFgieyWiggThnKJ8JAxRS5woENKmehfEc4oTaTHRYHoH6'
+    'HAGJ9vC6tpHr0EAXAKMW+G046I3CuW58DRWcaW5AKeDSAPc0rqdDODWBUX36PcTZf9HDT11C6oZj'
+    '0Y055jFWY5Mg4KIzgbHGjLHQ6RxIrTFLckh1TkTXWUBF28wmpecKIDbwYCmc1y2ObBKFMTRmKt92'
+    'DJU2X7212LMZcm0SRDI2szSCbQ6HzxAtMNa0ufK7vIkBAvOZjrU9Jmj+nCEH444IFsy2M7BIPeg/'
+    'c4zBgCXuTacFAhEW8SJjfe7iEVYxjgkeoyRI4SocMpGbJpxhFyRZLFAVaYc0fGE327OEaxzEnybM'
+    'lkKoxXVw52zBLyMF4OIFC0eYzhvdMhIUF2X6KHGwJtjV6OQjG/KiziQgkauajmINHFUwHi7qNrnm'
+    'Yja1TqRJfRDC5IBHLQSPyO7b8nCQsJH2INpO7++sAqVri3hNf/yEZSo+zs6wfR8AA9l2OHi7Db0V'
+    'FlmPhEDEvc9NghrSKEVoGqWo1UEKaiPwMWyzto06yNTdIpjAHr3hLETAHKThCvjnD8JwCOfTp1o4'
+    'QiVrS3ienOvgAoaqx1H3k2BUBnB0X2V1VcA4g3SHBkg32aheE00iu51rgjC1MyDa1eDkoWXJmSgz'
+    'YcX8+ShzgL+q01HmRHNrN2AuPmLFEUjLnKTiFpWrtaFX6vQHQzCVbOxvho7W2uAoe1qBObRXu8Y6'
+    '6eNuZoLx6ikQZnuQwzTAqJ4NkRROBFroLdk+iXhmAJE/NWgJ3KeeCgueOpgvtIL5ZKhd6Aq1o44H'
+    'sUOK6mUwOMkxUeeAgmpbXE16FotrnKw+D0x2EgCMhfGn+ozQ14nHs8KPgmehd+ePBX7dSDMIow/i'
+    '6aaHGaUgGCS9GsWYzV4NhGJ7S7J0263ZMpC8NUcYxXQufEQ2AfEHyihBP+NnmEe6rRtOwpFR/QFn'
+    'NQrQ4Ol6sBRfO+44pq5ujXTiz0Jr6qBBiZP8IFGDA0IRRQqQEFm3OgK0Ic/iEto1DB3mKYqRZCMa'
+    'iFJYKyokzqz1+AY0ReTZPBJyLN+oIc3zjT0Y0NEuYZFpXEKLsz39V3FMmCAvKklmoFqS4MBWzLqn'
+    'Y6Oi9y5H5cHvwDnAmhAAZDjEFu4kl7f43++f0FQenhsOc2d54cDbwRHw88zBgTMHJd1JhuewJlND'
+    'nOoaE/3V0oMOsWOHy8+et+/5ZubDuWsqm9cdDynVki6APqIjXSLakOXBpp0xFMK6T5wlRJPRZmcw'
+    'pCTh/WkmXmXq+lcMH/fFFhTtW4b0Dmv0Jk8jQVTZzkuKKCUVhxzclojk+OruWkWlP/OAucneF3RO'
+    '4cTX8pt3OSa/FD+EHjh40VmS52GwqYiAkWrsScW/iaW11ZfqJUvf1cZr/Rt1zbtq1js6dW+BuNqs'
+    'hoPRZ9gLg2SXLrYFHZ0CySYFLrUHgpC6da73+wW7OXE7M1m4m307TRUPdrnzkzKcJ7xzoThwpa7/'
+    'AG4UZm8='
+)
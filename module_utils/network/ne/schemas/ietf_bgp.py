@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_bgp module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_bgp'
+SCHEMA_DIGEST = '36f0c832803bb0b60e3fb8366c82d2a635c80fe7'
+SCHEMA_DATA = (
+    'eNrNW+uOmzoQfhf/BrGt9vRoo9Oq78GiyEmcLKpjqA1RVxHvfmwTwJjLmrUNXVVbLmbmGzODvxnP'
+    '3gGkl/KKSLFnOTqC3R3QrCxSchGHxXuOwA6c0mMBApDlRZoRJm4cM1LQDIc5hgSFOc2K7JhhpjyD'
+    'U2b0zKya+kY7gBWU36fod5lSdAK7M8QMVQEg8Goy7HDJZ7VdcHaA84CgamJKilE98JyGjP+an45m'
+    '1Ly+x6DQ0ERE4AGLC+3IQ8bneGxomt+ew5KkR8iRzWFg6CL8IzTxC0Zv3+YHpKcQYpwdw2t2khZp'
+    'yAJwfMvSI+KjY5AjGh4RlyAOhP7m+JYTkFTtDzccIwGSNUrn7wQAI3jep+ScaR4/49gf+e8dnNAZ'
+    'lpjPJikx5kBhUSBKuCFJoLw4oSkYmo0RuRRv9eBf6B3sClqqzu1F+CMkOs+vHdxA18P5Ibnwszh+'
+    'Cp6/vjy/fPv368s/STKCQGodjRA1EAb+7sVqJUo0+TOwx5WL8EKQgJGAGombJjyGUWBgJyL8O02h'
+    'CKUxY43DpvcuKjWIxKSzHNZS7iBqkceAC/j554oJ+/4KSkp2KSrOuxxSeGU7fn1H2O6d+4K83lj8'
+    'Kp5qhSRV0ImMJuNMqlKemxxpJC+aClpTNVMCbLRH9QuNZfTZoKgFWUGp40xC+WKHRUqywiI/Rgtd'
+    'jT/zaoNa6LQFHTWfT0unUmU5whRBGVJfnp5cIRMSnYHrlgF3U6dIdY4z6tYqH4A78f6QR9oSG/fX'
+    'LX82aYo9Wtgu7zEQC75PmxpVHq3p0wqvbtfXtZJN0YAnLV8CQkZf15mVAdqNZimqqeR67jAOYEvr'
+    'I51Fxy3H3XJOdFhJxRn3oWQpQYztCygdvPWeAHB/3r8hyD9X4D+O6JxefoD6agFTLK5G3WXO3Pey'
+    'lMBlWJFGS5630hrBkypyQn+QzBOF7fK0OeFJ0huzmYklWDabsJrjB7KCtOdmy7mwyHser7+ZYG/0'
+    'SF/u1fyye4+Eh0jPIjU6gjgGchngeE2TTpAkBlYJLVO3gjj5/LxMC7aT2+aM9euzEtUQv9oxrUQ9'
+    'UjaZyC55WTLtSpy4n9D/OLK2pZ81QeZQoprqdCfu5Y/GoE89w4RC+3B6VK0w/ebQpzqdivczp5UU'
+    'j/Fl/dLSWOT82VU4fprIyv+3msQpQqldEfAqUWpN8YkiItYtUfw2X5yCbm1TKqOKyUvFTS5iBgVU'
+    's3XSARybOqvVUrwIuyUvfvC0RSpdMEsjlXWluf5tVSq15grGYJs13Uk11RXTMEYPmbtqq/kLVoiF'
+    '40qqexa02Ch/xVaPFGyxleGq+bUxvJZe+S6kmkPS6tZrVETXYpaxMWsLhtxvkyroVtR30UxJhrld'
+    'rXRTfr1oojTW+9eUUgX55mcQ7/sUXGnh6Zh0pbLqmc6ej0lwZUKUpxuEPk1gKwvu2/ZgWZaJ66Te'
+    'tvgpuZ8Vc6wsiWfX5OSCCVZu+GTdb+WIJ/baqtyytco1+1O7vjxxr8obqRu0qa20AdFWuzxzML2V'
+    'bQ3OU63DrEa68rbgLdU2bKlpQNyMhlQbMqBh1+XfQmvE1lhJ660Bw9zHnMuZ75txFDeI0xMsMiqm'
+    'CyN4k52giVrxjJXtuZkxk3XJxc/0Hmn2v+6D5t+uv1ekkPUXc3aUrl1O7Ay6ph7VQwOZomW2JXqo'
+    'UCnWzKjtqh99xf214aP5aD/t90Hj8gBXP6+egTbIPOfGytyrZ4KeZdzHG53N/xxAs0RcmPv3GLzP'
+    '6AnRRylfbcxQd6Qna+g2W83AbptZJeg1w7bfyG3qpa42ZjVa6nEvdcVeBrUa1q8PrbXxOCi/bLbx'
+    'KAsb2+4b6u1WVfU/QIEd7Q=='
+)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_interfaces_config module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_interfaces_config'
+SCHEMA_DIGEST = 'b86ae7fc34d614bee7c2d141195e474cbef97b7d'
+SCHEMA_DATA = (
+    'eNqlV21vmzAQ/iuTP04kpOm+1NqmSdO0H0EQcsEQa8Qw21StIv77/ALEJsWYtarUYp+fO989d+e7'
+    'AsSq7oKpyHiLcwCvgFCBWYlyzNWXeGsxgKAmXIAI4BorWbkDCpKrlaYVpKHcOWidu5ei6GILcMHk'
+    'PsN/O8JwAWCJao77aNheFSPty5eNZqKiYJhzr5GkDdDdMlyS112NaSXOlrz0wzvy008EaozKjNCy'
+    'uXe348PRVQUuUVcLAGlX1xH4g98AFKzDCsnoTlJpDhLyLDUfN9MJrbwOfg9cy3wIfYyL5Wzj0613'
+    'Aclh93Q67dPPIEjxXVA893PuxBCtJHaSHKLHY3rT5YlmpCPEWxO85ApiO5gJkOd+vF5qyr+dQMco'
+    'JFiUsEUMXTiU65By+Ca16vXd7ehJHbSh0j5ysGOLJVqLK29tL5+MDbkS8JtU6JmIX+IsXYHFp8f4'
+    'ED94MM1BD7DxWwIIooiUAuIB+Se/oLyYfAKH/TXfSKkdKXcK9bRslFbqMcrwcWtIWo9GjbiiMZ7o'
+    'b2mGNF9WLv2UN7SEz4hj+LA/rBgwKQg0JFZJmICHp+P+sD/uj744z8+FqphlYAIew9W4Z9NepuFz'
+    'xwmVe5lAlaaVlRcRkG7LzhjJvARfleNI9R2YVYFIrVbj27LM/Ux3CAnj4XawQ2SZowV+NZVbgevP'
+    '8UNWlzNfVjVH86dbpFtbJnG1ssViMEqHcVJH1S5jtxvQpsBzVTP3R0kCNKOl7RvKG0jTJQMdBRJ/'
+    'UXCqXiZgHsGxGum/k8Vj8Vmz3Co+HrOn6qL/bnNLu4Zrx2v893YPmi9rmdeSUE1DkVCcTAJP3OW8'
+    'u6BwJM3yM6mlPFW0Up12E2sih3puf3SN/Aj0cif1cHarNm+VGTJ4K6bht7c7BmGqQmRo7O17a6kQ'
+    'qmpidFCTC02U8ItuKPahoDPq/0fbU7lSNzmqMzdj3GHBoXw/ywBnklggbr/I6HH08HfJ4YHsodw4'
+    'B/i40vuZZI0QIbHvwxhippHgzjwrb9tDqppsx4gu4tvyOqiDSPQXVJMCiYapy8kB80XXwdQuuonb'
+    'vUPEHKmx217vxrBpiutVmpjQz6X69E6LLjMeM6bi4BihInJvwtLE6Jo2y835yO6OgHOL1cLtd9jK'
+    'GlZgNnS02eN06ekEfO8fO7mG/Fl9d0wFcsPDb85q+RDs/wHArVvz'
+)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_isis module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_isis'
+SCHEMA_DIGEST = '23f483d19cc727ea5d34d55c8795fb5ced6d0bcc'
+SCHEMA_DATA = (
+    'eNq1Wu2O6yYQfRd+tZJ9s3tVXalWb9X+6Us4UcTGJGuV4BTIaleR3718+ANsk8XLZBWtEhtmDjDM'
+    'OR58Q5ifrmfC5F5cyAEVN8Sbq6zZSX+VHxeCClTVB4ky1Fxk3TChbxwaJnlD8wvFjOQX3sjm0FDh'
+    '9KG1iOpz1429MTQQkqv7nPx3rTmpUHHEVJA2QwyfY5rVohZ33RGGX6hr6aVRAJdMUfJGaN7Dm9zP'
+    '0OG1qQ9E2Sy7ls+o7/N9+IYpRTtlS3wISc55XUUMAXOCc1xVnAgR0Vzwtx/54XgCGnVFjvhKZU6b'
+    'A5YNj5oo2zSPXKIL4WqRpArHnLAqf8+FNy0BN91fhgglOpRFP057lRJ83Nfs2Eyi+04Qfxart34u'
+    'UMGulCrgWErCmVrxXeYMUnvK5vFBCTvJV9v4X/KBCsmvbiA/xHgf/uN6T9zMLJne3fclDHo5CGZo'
+    'tiEi8BOmsg7HOgqXBhG/g1yY090UxIHKp/z3v/N/cH7c3X5rt9tvn1xAX5r50LaNw/W9/WWG49fb'
+    'U/YjEY2bFR4SDAt5AjLUJikFdrN8lonABtLnLD0MccE22G9oMySoEinAf72fKRM/t+jKWVETeSwu'
+    'mOOzKNT1goniA7OTuZ53/ba612BE8ctochNMeMaV0y/YMsreJpQ9Y92EDKR439j5L20aTIFhLSVh'
+    'saGrseTq85wGxxhLgmOZYWW86U7bFNzGazLuTZ/BSqR5Lm0qXYPpyFxOLB3ySgXo2E0H6fBliZ7V'
+    '37fhHwDU0Xo6Up9ES/T0BADQMwowmwO1fmE35br3Nn3Oewxww4HfZFPLgFhn6qNEho8hUU99AML3'
+    '5Y2acGIepMGge/YBcS8LJviAWfSza5XCermKmql9vJfYbMBBBGVI7bf9K8EKEPpDeTnWpz+RvSpx'
+    'TfXVzXhZSbi9KV8oG0kaIZXT1TMbq8g7Mc8MGpX52f9Q6vJVpGA0TlJlUGYqPXsFyKBM0IbdlHVx'
+    '6SrjcdysqYjnx13nrCyRSbjKSqxcRrvdLotSyKFbWRlj4c64A3eS7A5q105qkqk+EdlwSTLVC02r'
+    'wdcslxWLqb4dHuu+pY9nUeYBTPtcnY0/ACxP1ZT3GwK5o4SG76uX3EgigHVfEDJwAXBPeUwvQbqb'
+    'KgXvN6SjELUvXteOW13Aq6kKJqaTtWpbxmfkbEzoTiHDGcxac8HMHVHviCMHADgpZZEk/lmFPVHW'
+    'dJJhlctEldIpqTKSYrK+PpRW1UjnyHjAfSKDqXqsmCmX6uAqGisAOIQIVqZY4d6nTMg6RCwIS49O'
+    'RR+sdABI/yvHAhPOs/rC2imdEfejKgdrgfks/5CiwFpIyzrgoc/7u+4giO59oeEc8I56oXW1w51z'
+    '38+pvo2RA+Hj4y/TdJvA8MPpeWItw8rM1GqDpbc0dmxT2XU89wQhTf/4G4wKvcNsKIKbHkYD0pZ7'
+    'sgzEHi0YDUEt+ZRYFk67H8QU05PvR6T+0Ln3I3O5LvVduS0MxUqvVfQUXwtUSN4wrav+rQVK8Js5'
+    'l9+5D7SlU3K80yb42Lm6j9elr+ndZi83jC/7aAa363m31dS7nVzPVx/lt9n7C9qHm6xuy2/2rHgV'
+    'Tlt0EtUcetL7O8a8n6+iPdx7E2c+jaMaXzGVs90emHFvt04HYJosq7EFcz5uPRDv093dN7wivCvj'
+    'uGcqbgk+WD9Jqa2jtLq6K1s63QFQul6ifP9JNMSJkBXVIPnMng8Cx2Vt+z9/uAhA'
+)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_l3vpn module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_l3vpn'
+SCHEMA_DIGEST = 'cc99bb31d87337e719c0cd84bb084774184c1046'
+SCHEMA_DATA = (
+    'eNrtHetuszj2XZBGSjRhcmvSJprd2fkzv0bzAgRVNKEt+hLIAum0Snj3tbnaxiY2YOOu5tOnBhv7'
+    'XHzDPuf4nKvhhG+Xk+vHz9HZ3Rvbq3Fcfpx904//hon46+waW+Pg7WNjYgTn2Av8CL6AZSI3/PD2'
+    'bpp2jy6EElWF86pHL2JXvYvCOyBFojgEJUL3vxcvdMGLV+cYucnE2F+iODi5oek7J5ejPEKAGQfn'
+    '4Bi8fXFW84NDK35hvbvMwkJ8HPuc5Y7B3jmaziUO/OAUXCIz+opi94TU9PyYWjM8cLZIDAaQG7dp'
+    'k6ymYEWMbSbxwSV2UcqYzY6WvMtwQoA2s9JXsiAYke9BNjEswzudgxBidT/zh5cgfjfsJEnhpf3u'
+    'xn8H4Q/T2YM6UbvxhYFoZJlr4EBS+YYYmA/70EvBc5SOYie+IPT5l+OROdcwnsrGvoPBO5v7wPfd'
+    'PUERpSHOHw+CTe0cDiGkxTnCmQWzeck6h97JCb/MHAJHjXrJOgsFPVw9FZnnMPjwDmCh5KciMsvV'
+    'VaTSOXRfvU/z6PpvYLDfm7FJPhng5PL8N0hnHOyDo+hMIOt3nwecvfvydm7EdXZh+7VYhtsv4MXQ'
+    'eHVO3vHr7ioF5wKcPB9rsDTBD4z39v4ShBxrIuUfoNt1Xp89/zWo7SjIjQOxG6g++j/cr5LSigTQ'
+    'vXUqwPRy4tgNwXy3bIg8G3Xw+eC+OpdjnK00tL2CHDSsLYY8bOXOBN1uELuKFHscXnpF7rtSO6xh'
+    'BlAQUmcDgS10/DdQ1rJmk4fF5mGzflxsVjYFdXiQ22XIBgXfD7F6S4g7c754mswXj1TOyA0SuQ9q'
+    'N1KM0Ww7Wq9WS2tmruwbeAIPCxv82cAU+H3IEtdFclsjyWVys+agSpZ6SFObPDWbgLez8XZUdlYG'
+    'vUiC1FOOIs+yZvMKTZYHkusKV5qXQikRwqwK0nWV5oDnZZ6xhhlIgUeQrvA8pRQXZTcE/U+Q/vFt'
+    'NN+ORqOM0ur9bV6Suqha5LZYpfSNd7tfxoBk0Wpjaf0A+Fh8976Q2Tjr0dZyzNffzT9yGGNAL8gf'
+    'WUtz9WhusndZV+bPEET+eJ0DQOMtnjMHQIzG9YR1MKGsXa4Pjvthune9u5ZgSHhPNewzDf2gIvHT'
+    'hJxi5KzixOFHDpLqzFSHTz0/IbCz99T9Av10JYeF2qGsOHs1HKjkUEI5h8lBhCDAT2lSRjr9bNeS'
+    'M4P5lco/MuLfKXbF0U/Wbne+/pXAv38m9s/j34y7zNLOpP+3zNbO0t33vctFfVfIPoHTjtUSx7Lc'
+    'BSA/qrNP5LJPFQMeaOoyAXkbhAaBgoyOxaQP8GwfnZ2MlKsxRQQQlgGQ/OfzdPSjf+2MS+hvPTd+'
+    '3Z6d0DlFW5C/9aPtF2jQNN8sa+5gPQQQ4AkFPMXFGikWrAJeoKn2FJOI3IGEFeaFOi2ELALAizrc'
+    'OAhBiwgqvKoQV3WZiyiPNQhC+HMpjCjSrJo4pmkl7GmFsqrfAfcUkzJ1owOD1YUmvxdq/M50MFf7'
+    'jpSx4HahNezeYOGh80gqpVI9jKQCVufRXTvN9jHMSaA9tdwUFSb214go2L7bc0oTDUhoYhqe/lt9'
+    '2tM6SIcsgV5CHCyHdByJZC5yKYJ8TjJECuZDX4OKE5UKjkrxnCK2CnwqeMMkg4r4Q3Gq4LEQTCpi'
+    'L0engjOmgBQ5Pm5hoX1wOgU+z0myKr1T0FYsBpQsVLiwV9WahWFVwSdFVqaI1zpm2ZuCKa4gVrBD'
+    'wDEqH7fTTEMxxODNUA8ygqd1Ue9QQ7pOyjBjYMpUUQ02NpgkDdRCNZ3acC1DkjLsmNFgjGiyjqg8'
+    'vfBRo0m7fK9tJS9DmjRuquvTZ9RBcoZdkKaoKcLgaxNKzcDtQrOfGL59KFQN3k510wsd2qlGlQbj'
+    'CbPa0GMwoSTps0ZPWcYYWi3dLCo1akdZykZFZGrUkqSljF4NSFCnUbtVZj56tVhJl53YE+PlEnk+'
+    'qP0cO2+QUsSsZ2KALfbzu+uADZLxK1hLX723fxtZbux4R5g7rbJ/uF/P6T00AEXAiqYX8wgJukWF'
+    'Ej0VSixN9ra6nHgnhucf3E+3MJd9TpNF4uzE75HScfxPJ4p34j8rR2owDZbcZzBo05HMaUdZGDBO'
+    'OpjYYdZpk/5tdSSArRt3kI0p346nM1vdxbCoqGGih14llXqg1srVelxe5sVNl6vExLKMVFwIJh6/'
+    'EbNh22zmi/FdpieWzddURE3+ioghcvFB4a5asy/GM8RooJkNU/PFwJbWwFWiBQDqCtQJEGmxi30b'
+    'usAtrW797rAaDrOsV53wZdav4aF7yyJrLZrs3mMUK1Rqfl8cEF8nJNU7L4wvByVXAnO5dso7SAHe'
+    '+AGOpKMstdX1TBW92GPbCtoUFo9K8BL2fmhSCf7KFi9/UoK1wU6O9arcuSCKTp5NDFLathXvJrML'
+    'bWiGktalGpjVM6WvWTXjL1yQY9lDbO6rS4aDdAV1R1/LG6htmmyWWK+GIpViPERmDdyKSKvpMtgU'
+    'f1QF7Fi+0xrPb0ECfwYehYTpBiqZHJgwuu0EJXd4QmnGC5RcHVqUsB4gs3SZ983qe8YbnYhXLWaQ'
+    'rqgmcnQiFtUOl8+QQOiY8d07AsJT70DQl4WIWHOCSkYxLw0Y6+JgcXko251Do1S1PU5evw/cYtoW'
+    'pAjpdlLpuiASQm7bxkPEpH0TI6LdDi4i2hCQy4NFfUS0ED+3JK6DM4kuIu6W1PZmViHcmX433H47'
+    'rMyPU+8eJUQpCw/d/Ee0mUylMLUXbxGtpnNNCN+vb4i+VBKtG7d/JxK9a0M6d5sCbxMSFDOCbMsx'
+    'ABFfJnAtiFxvE12Iy+Vj8p1IqNCoKR4rvN4mRPun1O0o8xkhSiGmAVLq+UGU0kJhpMp/Q/evaw8z'
+    'spMTBVEOCN2RYlcIbdY+QsM0gEMD6Wr4Dl8EpdaO6nWdwqM7dfU5gIuEYVSwHaeTHr4UBlLZCrYd'
+    'U1mpk9MF4b0Lqd7UwU/CpF3PDOvaQBO9v4Z7at4bIYKkq5l83F4GRMlP1bi6OAIY2KSh5Uqsz4Uc'
+    '8XMORSOt2eV+cZbqumvN7uG36SVM0a3TlXmNbFJENx0MTbzmd+sH14qouvrecv9Vavk1vZkurksr'
+    'rAK0uzhuF7E7nnFTBSy+JWptkOC2B2ToS6bFQNJgTEDEy+RS+yec1gFV8E2xK8DETawWCnxWvMz2'
+    'GnksJqagwjwR1rCjQTfbKr6T9ipzIs5nPzeE/W7ACqU407yqbzV1Fq6zg96ZiMnZh7aVFQqvV7Vn'
+    '0o9iGI9B2rOOMulZ00uPJShbe5b0rrrN4mjJuI1PSLulytKpwSelq0sT+drS7t3D7eOivLemSqFJ'
+    'BK9UqaGsQloqUjk2RLwcSodYi4mpVslDjfSnXpmSSFbykYGt1antEtVauyKm6gBqnWQINRwtLKUG'
+    '2oBkEL1aQyBdjTRllOi7Gqi+kFC9AwrkEy1UWWo2PLyertQMYF5tUx46VhMBcDKo9giPaa2Lgzba'
+    'RUS9FDz02NV6aWwoIac1UsEk2mhg2DGk9dapSJDJKVKS1ANY66n1QKNd66bGgA7nLqGX3nwWcRwH'
+    'qn04R+/gxFkM76PrfKR3Lmz06qaF+ahrKIVfrOQriJWrPMZdiRjiCVQ6EfoFahm64qBelEZSfnnv'
+    'DuHZLboa1aWQ/VoLf56GRo/Di5tS6LtsDpmT5EqEjqcHh09hhAdefktR3x2OC/tYjGeMB4Iqc754'
+    'mswXjxArzjzlCsaVHqMeDTt/gvItkOd+5g8vQerrvsYVIcLECMZtfeu9VMWkN0az7Wi9Wi2tmbmy'
+    'b+AJPCxs8GcDU+D3IUtcF8ltjSSXyc2agypZ6iFNbfLUbALezsbbUdlhGfQiCVJPOYo8y5rNKzRZ'
+    'HkiuK1xpXgqlRAizKkjXVZoDnpd5xhpmIAUeQbrC85RSXJTdEPQ/QfrHt9F8OxqNMkqr97d5Seqi'
+    'apHbYpXSN97tfhkDkkWrjaX1A+Bj8d37QmbjrEdbyzFffzf/yGGMAb0gf2QtzdWjucneZV2ZP0MQ'
+    '+eN1DgCNt3jOHAAx8BUBn79wQif5Kka/fXlvaSbu/bEXLMbaXMrRqaszJu6mlihE01cGD+SSx1ye'
+    'CcFuA9+ZoT7GKVNUQ6W5Jjq5Tx1SlIKWp6Fpx6jmJZm1dOQLhviaw644+sna7c7XvxL498/E/nn8'
+    'm2HnZNdPVt+CbML8jr2dWC5su2leUu4RNQzO+jUJ4SnJO2NSM2AMOuuoJLCX6mM/Rp4jOPY72d0b'
+    '8LPOO7CyoLrXEGVfMf7nhZ+DEMy93C0LHioD906Nu0Th9TNtiPmYplgcMf15IF4zOvhs7s9jfOUq'
+    'otGIhfRoQPcHoMCTsDLn8Oh9XqqiuOkS6H3FpiaeOnVyPF9e5UivImjkaU9YaEUxha1sNodwEwsv'
+    'Jg7kD5Vf8VYpvTQKzMC4osElo5bgsV1WhI+66wuKLwjFUUCSJPkfy97yJQ=='
+)
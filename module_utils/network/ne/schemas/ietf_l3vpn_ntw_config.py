@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_l3vpn_ntw_config module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_l3vpn_ntw_config'
+SCHEMA_DIGEST = '651f7ab0223936d81075d185367877fd571cdfdf'
+SCHEMA_DATA = (
+    'eNrtXW2PozgS/isjpJUSbZgkpJPuRHe3N6d90UqruS/3jUYtJqG70SSQI6R3Wgn//WxebWMTG7Dx'
+    'rG5nlcbGriqXX7DrKdsXw41ezgcviJ9OR29rbC7GfvF2DMwg/hMG4vejZ2yMnb+NjYkRHmM/DE7w'
+    'BUxz8qI3f+udkIR7/wQTensP0jzdynqThb9DkpziCKSIvP+e/cgDL57d/clLJsb2fIrDgxeZgXvw'
+    'ONIjAphxeAz34cs7Z7Yg3LUqL8x3s7AwEV+JA850+3Dr7k33HIdBeAjPJ/P0foq9A5LTD2JqzmjH'
+    'qZEYNCAvbqOTLKdgRqzYTOHDc+xRJKuTQ1PeLHBCkDaz1Bdj+xpm/cA2/MMxjNJSfMsfvoTxq+HQ'
+    'qCVFo/LiP8Poq+luAZFTu/aFkWgsMhSLr/WApr6N/DQnR+pT7MZnhHVw3u+Z3QgTt9TjDQ7+0dyG'
+    'QeBtCYkoreT4dieoRXe3i6As7h52GhjNK9Yx8g9u9G7mFDhy1FOy5eGqqZN5jMI3fwfGQH4pTmY5'
+    'cIpkOkbes//N3HvBC2jYtzpjkrdz2G/84AXKGYfbcC/ayMn8zdXPozPO2v3ycmzuTh7UX4sRtv3Y'
+    'XDSNZ/fg79/JAQg2fdhX3la0UQd+O/yX1y9hxDHcUf4Dcnvu85MfPIe1yQI5JyA+9NX3fOc9u+d9'
+    'XIwRXz1QiDg6e5B41qpsIPrRjWMvCrJAJSloBXyzABqXNHEnNqzJgzxu5ZwDnUgQ8wUpGg2aqHcv'
+    'W0MHaGCIMYnc4AVwse3Z5M5a361X99Z66VTcm2c38qoMmXrgM51btUUvnTm3HiZz656nZOTUh5zh'
+    'iLYUYzTbjFbL5cKemUvnCp7Ag+WAnzUMgb93WeBiJdcVElwkV3sOsmShuzS0zkOzCXg7G29GZa1l'
+    '1IsgCD3kLPIoezav2GRxILiqeKVxKZWSIYyqKF2WaQx4XuQRKxiBJLgH4YrPQypxkXZNyP8A5R9f'
+    'R/PNaDTKJK3eX+elqFalkau1TOUbPz5+HAORRbONpdUDKIf1vdeFTOWsRhvbNZ8/mb/mNMZAXhA/'
+    'shfm8t5cZ++yqsyfIYn88TIHhMYbPGYOiBgc4wlrycE7QnItTXIhvOAMvp/p3Jex+mGtVuhLEGSl'
+    'IWeoJRYocphU65oG+uiSp6TfYgUkpwi1hVOxPmpY9MiRhLJWksMIYYCvpKTMlOjrL+GSGcxPSf4l'
+    'EP+YsDOOfrAfH4+Xzwn8/SNxfhz/ZHAWlrZu/MsWtrbebTE5XVg3p27sVTJt6SuxLcsdAPLlNHvV'
+    'LHvqP+Cqo75ub/MVx9f3XJ9ufNEvo2IxCwFcgJ+ObibwxZgiRgLbAJn/+e2wD05/fzTOUbDxvfh5'
+    'c3Qj93DagPhNcNq8A/2m8WaZ8xHmQwg5yQQlPMVNDykXLAOeoCn3FLNa3KCEJealOi0MIbZx9xs3'
+    '+SIXNxfCHmIbh/ciip8pTkSohHUjiZ3baMTKXKMjJEVuPBGoRySbOKdpZaNpxbLK34H3FDMOgVZ2'
+    '10USjFoXqYJCnvnsI/w37yRV0Fke5pfANsACcjnrJB6LeBeBo1R7s00q3aab+qJd5xZWGpm6tXSM'
+    'VudWX1uc9iBcjWhPmpuitsH+lIiS7VufU9pKX4KKaXz61/o0H48kaH7q72QITJh3pTQagonkUuQG'
+    'BzszRkkuTcZMQaeYlrYv2/jNf3G/+PEv8SuYTnvxh8V0Np2p6DGlECoKjNnibOP3ACwensEa4MPP'
+    'n/7z6UMcfvA+//vnX8x/KSk4KoyKwhc2QjUjYcFORcmYtko7NWNuw8MhDDbHEKx5wQzdTB/KJd6m'
+    'SsKz2qtSPypQIqtkKrRKGGQVNRucq4pyUuxZispa5yz7azzFkda+JurirJU34GkGJwzRijPWgzTl'
+    'ad0uO1TbrosyTBuYMvEkO4XR/G2JGAzTUpgCDqSvGhzWx2KkJ1mGbUIDDidTlRq43Zd7W6T2J44m'
+    'iqFMRCG89F3MPnmLp4mqU9hOm89bKs6w49MU9SoYcNSmiDOwYmi+EEBBa+vj7KP1cXBFUcQbXGF1'
+    'f4pKYdbwCquJp0ELw3wybGNh6dCuUKH0GbinLGcL27BmM42GdJagGqlSKmaoSFaN1El6xJTuLdoo'
+    'kZBQI91VLj2qPxaiAjqJMzG+nE9+AHI/xe4LFBnx5ZkYYDL+9Oq5YCpl/A0MsM/+yz+MLDZ2/T2M'
+    'nVbRX733p3TLGKAi4DjTi/+DBJRQoWVQkwmqLqvYieEHO+9b5sIOW1UaLAJHN349KW1jfzUF/7/H'
+    'wTYGh6on0KDSVsbpdFj4+k06eJ9hbluT/t1VJJCtuzeQyhzUHomusSd64A3pch91ua3GsHLbKO5/'
+    'WwUmtm2khjLQIfg9cQ3HYRe+aHdleGI7fKoicvJnRLxpi0GYO2vNRRaPEJOB5u9KjRcjWzqwVoEW'
+    'BKgjQydCpJMpNmZ3oVu6iQbdaTUs11ivOvHLPDSjXXfNImMgGuxeYxQHSWp8XyUgvhpIqPeyMJwT'
+    'KbESCpfDNP5OCvHGD+NJOssSxa1HqqhF1JuueFTCl3BqQ4NK+Fd+ZfmTEq43fL5or8q5BAK68Uwr'
+    'kNSOo3h+l5mb0Agl2qX6RNUjpY8iNX8l3FRgO0NMtysT4CBVQZ1j1+IG0k2Tdw3r1VCiUhxbyKiB'
+    'tYhoTZfG1uMUomcPi+9pjOf3ZkidRYZthYQbAWrDG1gwOoxPiR1eUBp8TonVQaMEbE1G6dLvm1Fj'
+    'xhudhFe98JeOixIxOgmLApHlMxQQHsr36u+B4OmhM/DEBBFD4wS1VWKb/7Gii5PFLZTsUwIa7Zzt'
+    'efIeJ8BtOG0hihAKktq7BZkQltQ2hw1M2qsYMbZ2OGegjQC5hVb0oIEWBuGWwnU4kaCL0bmltL0B'
+    '98KVGXTjHbTjyvw49X4Ogahk0a7bYQNtOlNp3uzlaIFW3blmFu/3IIG+QILWyu3/xIHe8YnO1abg'
+    'aAIJUIlgseW4SogPEzguIfdkgi7C5fYx+YcNqMC4BPVQYijKDiAQrSkMaVF6WoCopAUwo2rPf/ev'
+    'WA8tv9P+etESEBiN4l3ybcYYAskZYK+7dAC6w8ir1P9OPaYo3LpTh/cBNs0PA3V27E567K4fCBoV'
+    '1B0TFNRp473o+FqDEXXYKj9pVzPD7m7XBF9XvM7pc/+AoOhqOh/3znJR8bO99Zps/h7YdaDlSKzP'
+    'FhHxdQ4F+dVsG7d4keoYsWYbrdvUEgYo67QjWiPfD9FJBwPx1nzf9ODog6odzS3nXyWarulmY3HM'
+    'qkDftdsC7BRXLzzhLgHYFYIoqp/gGD95uyATmU8aQHviSkIueD3hROGr+w3FNowSe5BaAOWsOwnb'
+    'I9/YvYOCwHQijGSjFxu2BZiT9tA0cZdiP3tWg27ECvCZ6cbUNxycXYnYAd8l7j3sA9VkXTfWK7yY'
+    '9APA4vc89owFJj0jqvT72mSjVEnvEGl2DZKM/eGEtVuqLZ16wZ90WDKRj0oiFwCqwhmJKwFVAofV'
+    'RYGKkMCGewSHgvZqNw2qxV6o96epxzgSydgbeaevOjQtUQ2mFTdVDoC2JEOgY7TL/jQw0ieDwF0N'
+    '15NqBGBR7jTVAJFCLkAd0E6eaIEwdZ8m9nkkkpoGzAsC5RdyamKXTQYFdfCbgnU5yYu2D08v3IV+'
+    'I7BeQArlIl+NkJFEG2CEfTOv3lCHBFOZIuyifi2wnmAEeoewbugCPAHtHPnpxl+Rk8xAtjd37+/c'
+    'OLsZee+5b+mWAwfduWhjh6Y1pML3FfIlxNJVR5hdajcul5d7JxAWIhAAMnmahm7aryelSZdvY7tR'
+    'hmw/Wa0ApRn8VikCerL0HbO/XIhrtumXcac0oh1veUtj3I0SFx6sWJmxMhBSmXPrYTK37iFXvPCU'
+    'zQgX+nXe6O3fB2jqAnHet/whvTbRqZeKMDJiAuPeuPVaqq7+NkazzWi1XC7smbl0ruAJPFgO+FnD'
+    'EPh7lwUuVnJdIcFFcrXnIEsWuktD6zw0m4C3s/FmVFZYRr0IgtBDziKPsmfzik0WB4Krilcal1Ip'
+    'GcKoitJlmcaA50UesYIRSIJ7EK74PKQSF2nXhPwPUP7xdTTfjEajTNLq/XVeimpVGrlay1S+8ePj'
+    'xzEQWTTbWFo9gHJY33tdyFTOarSxXfP5k/lrTmMM5AXxI3thLu/NdfYuq8r8GZLIHy9zQGi8wWPm'
+    'gIiBjwh4/4UdOslHMfo+xFtDM7EDDuv/pbmcOvJiVm1qisICfWHIRw5nzKGXsN82lClzk8dKwbTI'
+    'UGWuWUhuS4ckpbDl+cDRVkvNwy1rWMgHA/HxhJ1x9IP9+Hi8fE7g7x+J8+P4J8PJxa4voL4LsQnn'
+    'N/ZUYWE5TlOfo+ziaWic9U0K7PkBo6Xw9pjUCRfvzIwVkcA8qY+5Frlc4JjLZDtfwJ9VXoGV/9It'
+    'RZR1xfg/T/wURqDv5YeP4FcO4Kci4wd/8J5vbIidbUzx92GeWoGcDdHhrOD+ThCvDkRodCEh9+3T'
+    'd70rOMHWUHK0LB13RjaF8iKlNOhSk6ModTrrvNxDke4B0OgoOWGzFMUHtXKWHOIcVLgjcKADP/mh'
+    'tQrW0uguAMbeCC4rtIRDwmVd9lA/24Fy2IHiCyGSJPkfxle0Qw=='
+)
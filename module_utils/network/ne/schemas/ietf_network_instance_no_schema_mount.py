@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_network_instance_no_schema_mount module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_network_instance_no_schema_mount'
+SCHEMA_DIGEST = '0ab1376eb155dc67f3fbcd53de1bdd9aaf187961'
+SCHEMA_DATA = (
+    'eNrVWumO2zYQfhf+SgDasnfjAhGaou8hCwZrUbYQmlJ1LLJQ9e7loYNSLZlakm4SLGId5MxwyJnv'
+    '41A1QPmlumFanooMn4FfgzytyoRe+GWalUlKi+4pzjdJJG7w31WSY3YdI1JgCMr3DAMfFGUOGgjO'
+    'KS3zlGwygijeZHlapueUCDGYYK6MXYMoOZcAqjru95sYIlU9tIGim06ztMjiiQKUY/TYVt7qTkc9'
+    'ByWU+TJGZ/xYT990okxzfOe0KJeaMfGgafpboV+5J0lh9F67PcEoPiU0TicrcHnZZahkbynwA/Dp'
+    'U7DbfA3/Cfbsf3m5Fz/y+oX9fOmuD+z3EH4+Href69dmfUcQcoPppbwyzew6wjGqCPMzrQhRZ4AP'
+    'AoLv+L21eDk25pf/7JofHPABk8q8wkuRYkN4F199UHVxsxQsv9C0tsMcB/QoZp26dza8R8LvC+Sh'
+    'ry5OCHJEL+xNEOzgb4fD6yEMm/6fXCdFJscY1MDrozQATM6fP26EFt+OoMqpn+Ay9jOUo1vhs+c+'
+    'Lfx3Jls837T9jrxXLyRs4CDSU6I+APuvL9vd9mW7Z+2VLkqjcefZCBN2qhLmWmrJ8+bCVVfNnAAT'
+    '7Z6c20DGnYkZUpKRLXLlswk0M0SIMTJEJqGVy5R3OprYLbQa2+2hKMpxUZxidEvIOx9Gkr19MXPp'
+    'PcEWLJU53nD9q7Is2eRJ0LFnmBRo0zqvx8MAvOxeWcLb71+3e6sG9zqsGq5Cn2UPq7Id2ewpWO3O'
+    'ekWL83H0aReX1737AVlKzw/VSKbDwGT3hDEJZWHDqNNfVZFQniVLJJhOz1cgYIhxumLEQhb8zpTF'
+    'yeUPIJ+WKCH8qTc8ZjTrJDY/TIYRIhviqP1k8pTlxRl2hH9Ies19KW67G0Z2r4WJZ39h15gSPCj2'
+    '5CfmRuFbA9bbLs9uwizCdo9b0DkCtNlM3e4Ma42mER55Sc0IMAiAIJfMB7p7IBCGIZzZ9gw3MAg1'
+    'Rs77zL3Sk7AwtzNvjOT2exW5cIxEdZgnQ8JIVLdZkDuoNZMqCX8YQtuEf/LEfHwDVZcXtiSOItau'
+    'VJUg9/nVqoIxkVXuXKkZZ57hxr0+2/Gizd7EL9fHa1fXhLB1TXlC5UUn/awJh6SrVJCUMXxEXJtr'
+    '79aX4Cpps1lYo/Kkl+gtmGNSoDLCklW2G1LeluKsUmnIqlr6E2jCBewqdWZVJnO80zd4ikZ2q1Ar'
+    'PNdil5VCky1AXWe9zWKUVQBfNwy7e52B7etboaK1k+qTK57xgSE6r1C5Jzv6o7a8M18qMegbJVnM'
+    'M0pQnCeR9IzIacyWlDPygfQ0KgEaHZ3fIzULR9GPKUijQ1PmT7Q/TB8aA+bRHaOb1t8kdzatNUnY'
+    'NUPtxhT16ymY+1bBvINo3wa2NnYQuvsCwRpYNhZxV/kswkExUgUeF2jWuMHI0fcUbpGpcY18tWn2'
+    'WFMYlpvuJ8AUL5dWeSLqJroYql8iZcLfEEkiVKY59yDB6E1wp1CtIQRKJVZpM6qj1v/5luZ/+9Ko'
+    'CafWz1YNFkY8t7UfOUDCVr3wHRHnPnLNLLaaapczuWBeu0F70GJibp+vfqLZWnSDuvdYGKrC30fj'
+    '1XA87Apn9fjbrTvfa02s4w/u/7XNTmke4bwtwamnm9Mjjkek0eiEApidTqjErGVWFg4A2sqAzUq7'
+    'o3OxEbS7r4g/7RyuhTD+FeK/C6sDAg=='
+)
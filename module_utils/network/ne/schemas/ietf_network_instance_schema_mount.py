@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_network_instance_schema_mount module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_network_instance_schema_mount'
+SCHEMA_DIGEST = '6d1c2871aec1aee561b92415f88580490e616483'
+SCHEMA_DATA = (
+    'eNrtXP2O2ygQfxf+aiVnnex2T6p1d+p7OFbEJWRjrWP7MNk2yvndD4w/sIMdcLLASVdVjY2BGQYY'
+    '5jcz9AIgfjsdUUo2RY62ILiAFJGfGX5fxGlBYLpFBStECWKV6DPYxVsCPJDlJM7SQtaClYmf4bEq'
+    'wujvU4zRDgR7mBTIA+Sc0w+gIBiUHvjA+wXOMjJojbMTidM3SSnCi3in0PE2SwnOkkWewBQtcpyR'
+    'bJslt4clbzdghJO6yYOiDLIi3w8IQIzgbV5ZLUlDNQHFKZXlHqpMdVt13hxvs4JMVaPdg7JsXyv6'
+    'wnsSF3d9v7f+aPsEwf0mTvfZ6AaS7ZFRoeWQUDGnIAgj1nf6Rg78eYf28JRQEaanJBGFy3aIB97R'
+    'GQQEn9BgOwl7aHrjdITBly/hcvE9+idc0X/546r64c/P9Odb8/xKf1+jr+v109fLS6nfEMwYZsXx'
+    '9O4e38Cju/YRkv/UaW00RKsWmp0/td3/Q9NaD7Ovknpa51PFO6qgep3LO2TKS1ycHsAwfaNfwnDp'
+    '/fb6+vIaRaX4hy+VIufDDC/Al6iOENBOf/w6JmnxxxqccBrEiOyDHGJ4LAJaHqRFcKaEqvLFsIc1'
+    'ay7pNyo9GT3/Wk9VDEg7ua6s2qvPJzHkWoqKWZUCb6hMplOCGqPoWmnT8VtNqzltdbu1Lostwdms'
+    '+sKJEILV9+en5dPz00pfWpIO5zM1qtXnzOPNXh/Opz929HwG+2PETI3K5/ov5GeTqeFxqsbG2Cis'
+    'lbkBzlN1c6lxw0JTbbFGa1PyqDg0Kg8f7nYYFcVmD49xcmbiifOPb+aWgIwJwxLgdqZBvSXStTBW'
+    'nxvUdgbMidsatd9iiBA8L1+oIbBavTytrAmi5ceaQEQYYnFFiHw4IAtfwGNuSEXgyCn5tGYDIoeV'
+    'W4KyYF7cZImjb2pkLR2TVcVYVFLo/9epiFN2GhNYoTwJsvYAtZM2BwSpIgW/U7L7+O1PwEsJjBNW'
+    '6nfF7+i8qRyJtDdlBGzQxDZo7No9ZZzbm8wNtkO/uA+MLZPqtXnJITkUDi6a/2fyaiZNAmKvikps'
+    '6Aqplo2ii69ZcIacILViMUhVZuG35qXnlEFVH8yie7jb+Wm2QyMTKz+OvDAEFZ6n8tb2HoMoUhOO'
+    'jDYlrdi6NZP4blFuJrp322f95qLXtnnUElvrhJ1Lue+E7V7mj2XKgzr26fHUJlTAyBdjPLReS66L'
+    'jJG9c6nf697jPlqdxc3dblHk2XS7DUrMyq1zgvEHG9R7h5Y9DkQXUWttWWOm754R3lxgqX+ody9u'
+    '8WZTHyn7A6pfxhuL0B/ihOqClNlALLQ+w6jxZGaSNEguFcbDqKoG1ZVNsJlsqUOU2mCfR6ez0DSj'
+    '8PrWYKhus3mdyTcz8j7f2tRms7YK747Le1qUR+3FB0fhH2/qPmCYpoL1xixvLZkY9ADW7gst9ky7'
+    'tZTYq9Mg6h9zkXGzSEJdEEPb3V7kXGP2akvfeMDbBqzRk4qtoLg1yKUnHnv+586dqc6xiJmsR7Zd'
+    'QJEzROdU9Nst2KsuTYtRo6kInPoAOEZ1LWTNEHOSbWGy6eNm6S0VGdYt5QhYdqFFCaSWili2yfPX'
+    'iW52AFAPL5a6+FK4UTMP+pVzIWPvAs+9MHDi8sxjgVj5aGA3frfHCIgqDWG15qKSyWQPjW33oEwB'
+    'DijMYZfSJE66DOFPYA3+NKAmMI0wSvOYprkXZwUylJaQinAJ0HL6jWhS27bpS/uooneD0R37vHQJ'
+    'K1xMnjw6qVs8COWYYc+yg044ruKec2IxqqhGPfWFXTmHSbyDJMNsNhMEPypEHYkxu1CaoqRRu1e5'
+    'iVpeJu70RsMeuzDUBNnWxdyjJpjO1yStXbK+HuJowGZixGPRj54AuI04KW5v1qTw5TbBXu2PvVFj'
+    'wG57IDk0W5NiEN1xE0MVXE+6u8FroumX/rV1yVX1AXes4Mbfuv4mwzuE6wC9PENeLXsRaCQfDlwA'
+    'MzIIW1V2X/bgLWxtLKHPUj5vDegM57XV4RNbSWEOZDH3rG63ErKczLCuLTv2X3L8C6iT7no='
+)
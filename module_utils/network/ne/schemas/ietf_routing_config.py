@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_routing_config module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_routing_config'
+SCHEMA_DIGEST = 'df56e356de522433862a6b651e93fa18a5c2b1b1'
+SCHEMA_DATA = (
+    'eNrVWv1uozgQfxf/TUo2avdUdHfa96BR5CROitYxHDbVVhHvfv4AbCAQU9u52yqqArHny2PPb8Zz'
+    'BbA8VxdE2I4W6ACSKyjzimXkLL6yzwKBBByzAwMRyAuW5YSKHw45YWWOVwWGBK2KMmf5IcfUmIMz'
+    'KuYgjARxuoDKLGP1QzeAspL/XqJ/qqxER5CcIKaojgCBF5th+3Mxy+2M8z2cFwiaSmeE3eQDT9mK'
+    '8n9LDdTOm5egGbSyVBoRuMfiRTdyn3Orj4eqP25MlJ3f93m5VPp23qz0JbrkDK3g8VgiSn2KH3W0'
+    '7y9R7y8CGMHTLiOnfLAfZtz+ni9fwRGdYIUZSEiFcQR+ok+QsLJCgh05s3eQpNsIFJAxVBL1oE0h'
+    'BJhz9CDEm+2hd4Gy5C1ecsqAQQnJmXNI03X0vHl9fv3+x+b1Zas5W+0WcwuMPD2I1oaDzWhq+B6C'
+    'BAxVH/vXYB+Zm2O8B34bxQabLKxr6BOJrz8t4AFxpukVxN0WTQGf9uPXBRP61xuoSpJkiJ2SApbw'
+    'QhP+PiE0+eTM5ftVM+9NzOqIbOtIk4wnt7xkZcybHGlFL546P2zZTBFw4R6r1UjFQZCIw6C1rXiw'
+    'sS8f9uYgvOLvpIE6KaQGm/XayZSKlpM08kBd6KOuNhQ8XYWO2xDg6I0mLWeZjOPUh1ianCdrxVBK'
+    '5ux2fYrehNNB1t+iGlT9LW+sQ6XXddZ0vds01qglhHE1+QBWjodoJAXfXjdP66fN07cQ1h/yC6FS'
+    'h3xSIFBUEDVaHiGXRK7G95eXl3XQlaABd0Q8APE8NLMkKz6eVxXJDlBmlS3IYJbxcSVwAn0Lts0G'
+    'Mgc0jndHvc9qW3PYva9oRvju2zEoUXSHhSPADb57R5DLBP7kjE7Z+W+g3jKYYfE21q854N/J0gCn'
+    '4QT6HFHaYxwh+FEY8UToiH4hmVsJ28rH9oFnVO/UxdL/J13/swVXOUYkK1o7blZpa4d0rXFfdVJE'
+    '4WDF4EyKAoCtUWQ2U2/tiyQ/op7VzBMkSlMgj3NuE9t8HGy3FvoILlM/Ren26xaZJuxGt0unlYu0'
+    'hmkya5tAZ2eYe7mw2jBOmjSJrJR8yQI769BPRptvzrr0c0n94E64lwpCnxTN/E0/eDRF7yjovvtX'
+    '4OapFkSRG6nNMAqF4GqAuvZrUO16itGQKzYG8wPQoM84Znk8KCzv65C4g7HN5eCx7fCeYe4HRMQy'
+    'UZy2D1iRjndGIdlQYSm5ycBmUW+2i50exHEpSzuF50WyO+YTDT5cxNIRkjaILrWLp+qezrFA7IwF'
+    'rIVtY7aXGrK9jYyg7qtM7AvGWOsAqb8ysr3lDHDhuUTsEbQt9oMAVWT/wG7xGoUrNIdAldbqeasV'
+    '2NZdrCXrEESwcnK02Eo0aGU4IPpf7O6rBxb7Hu4UFqVbAVpxfoB414euRtOSRqC1iUZnepnug8fa'
+    'BmBOt0R9GfjVDpixawBzLEurRMe1WCkxkxPiqh0Bm27r8gFies1NnoJ67Qdeqa41T7Cp15zmN9rX'
+    '3sCQ2VzmO2jXvjGO2eEXKLDU/qHLuGcv+PVIV7YIhTR6rXzhAEQdDD+MGkQfdDHmZ2Xuh3tx/VKV'
+    'quJriUTsb1w47Q+IsyNkyr8xgh+yvXJr1sVS42JnZsxk9WrxnN6U9ubkOmp27RpkawHT1LrMjhpy'
+    'l+aaka6Ncz1pIDW4NC2rtxtbxwyNrHqGrc7r+oz7HnjPHt0Ovw67e4dyCUHlJ+pdg8xIqPPpnoTD'
+    '48tFxKhXzf6awTvFjE8zYJeXR1Q2NV+z88G8zpwstrrcUwK3O0oTkSpI6X6jdwPPhbhae8h9tZmI'
+    'GQmsr8vHARwMeK33wD4CbbNtXdf/AkN23C8='
+)
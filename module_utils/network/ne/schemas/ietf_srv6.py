@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Schema artifact of the ietf_srv6 module, generated by tools/schema. Do not edit.
+
+SCHEMA_FORMAT = 2
+SCHEMA_NAME = 'ietf_srv6'
+SCHEMA_DIGEST = '4e0481fa3c93f4768ead1e4d733941b38d4c2370'
+SCHEMA_DATA = (
+    'eNrtWm1vqzYU/i+WJjW9UNo0zVS0rbsftk/T/gDhRm5wUnQpMF6qVrn899mAsQEDxxBtXypVDXF8'
+    'XrCPz/P42GeEk1P+SsJsn8bkgOwzSqI888MTe8w+YoJs5PmHDBkoijM/ClP2Q5q8bUc7kBA/B0Tq'
+    '8hxFAe2SkH9yPyEeso84SElh0J4HHKd5gJnsuNEoTw7ExJ6XkDSVuqZZolTtx2aWBWacRDE+dfUP'
+    'OFRQuSA64CxKZBOBn3a8qTuNehziVwLwEz5Yfmp65IjzIIP0jhNy9N9HPYQPZkDCU/YidfTDbGD8'
+    '0owO9mHULhu9wEx9b3yQaYdRNVF8iDwy6RQbYs98Ji/4zY8Ss+oLmBbP9LLNxHtE33MaZmwCTT9+'
+    '2wAGqBwjEhC26lKudao9IPi498Nj1FmifCWKGGoCJMyDoGffQN/JR/Mc4ywjCV0WjmvI4URwiFRr'
+    's78EO9aEQnR1Zf9wbs1HbB6/mn+651tjU6zs1VW3zV7Rj4fi6krxy5NKx+oH7bt+oO0P7o81/di4'
+    'rI9Le965T+Vj9X+1292szvcFrPNqdfWTs9vF578L9v+vwv2yeqITSP36ZrtfqJvbgj+X/6kfN9fU'
+    'xM31qvKp7ndd/fpk270mauKGaRWjTYOPzaRinviCY1Mj5mwwrV1s2jsJUMpzPJ0Nzvms18qSvJ0E'
+    'LxjA7Xx5QcUitX6uhf9zLQhUAgRlnZBxeKLfHOd+bTxuXXc0ENpw1katGpwEBum7sN0Ym/Xj5nH7'
+    '8/rxYdiVZokoQOyyi1GBfUqI03/VW9CbShhZ4R7LOWmMD4QOuXNGVgN9DqLaf39/DcL01x3Kk9D2'
+    'SXa0Y5zg19Sm7XaY2h/Uetlu1nI7JtUocQtDqLQqKNXUy4TMZ5ySluZKV1+9xbOcg9icUomuEO+h'
+    'lG2hcemoQlzupNAicrtaQfP7lAdWlww46Oudbd+t7yf96opOmlJBnoPupg0pBEfGxGrAbnxsmn4A'
+    'XVaFmnTCSZrdQbRWEhDV09E0JALRLoOnhgVJDGKFIylsxHl3iGaet+es6Ep2B3CotgJ/VUteMOvB'
+    'BTMlrWGwyfJou9ExVcvBx9qSARI4oX3JWfasEo3n2iylZ9u1OAWgA/ww3wGuZr4fCoLgoD9Cb4FP'
+    'fZXL3CtJxZJparQs9sNSMBsKKre3y51TqHYLSnqe89QP6erdZ7ikMA0RMRDNQ/sXgmkQo18OUXj0'
+    'T7+hqjXDfsBaLdFMudK+rJZQHRAwWRiQdCMVeuSdlLSX2S6/8i+U/L2k/5kn7LX31GzpyzSMV1hq'
+    'zM4nzZqUuah4/5D+2PJEnlXDcVAJO/StoQQVuW7XW6ay/NTS1xBThUaJONRPhqPq1OGb7QaViEwu'
+    'm+dJ3Qom2WmZVqFmiIrWMbflwOGPkP4Nx6tCHCIBmoEJSiZ9A0kLqlU/gaQEjaqf9MOQcySwjzJH'
+    'GouBacZTP2m8aYfESN/mKeGZhH3M1yBxjPppgS4lT+g3LrRQQz1/XK5NDdj9RmaJpuvDix/Q0Cmr'
+    'o6wCAc/BhkjhUrFA8h6mTqRgo07g3QKBItVr6uXZY6CKYGira6X48eKCrnKBCIM1h0kQ0h32Do5o'
+    'VSV030+FNtrViTFMnTfegDIGBBE1jcPYXk3PLhP0g8UO7YmUgFWn3KFrh8MwtOgB1s+RuoFsaBVD'
+    'g0RovuvQEpysc2hnmRrxNYscGkRIexZkDjGjHjKPuejHCiMoM0sn83mRtpuc/izcSGrbVfCji5VU'
+    '5nlTsqqFRZTlBG/GaugRtosXW9z6FDvYt1mgdHdCkLlCJnb8SkWHmBU9pibuXKi5V+/6xCizkQ/d'
+    'hwhAMUGO+vczdOiO+mKBLn8phumLdJdgim0U03yEX0cAVp0G5mqIMrSvDmhwAHE1AAik4nwZiD8F'
+    'GKKlywmaoCtOhvVQtACDaPswXR/fijmYWJ/Zz4OqYi7EiSsCiyBLef5/KQSSTvyX4UGxFE+UFw4u'
+    'jQ+smpsnflng0agKaPFQvdIYdegNB77Hk1tA8Ft558GVCxmOVFwe6VMVG6QOosp47l1mcrvSHWBq'
+    'qelixrl3x+Tz1hPs1lPBSJ+qYjA5Q5WoKKaMBEJTAWhNYgWJ/akTd42YgZGIMdq1Z0BMcbBr+fEZ'
+    'RZeJIr7jPY9fdFPHEaflE1HEt69jWYftH1sTzJHrDL3+1o3AHkx1I0WVveqNUcsTxZ7jDLqophi0'
+    'gb+62z5KPJLUNWf5gFc+Iayqv4pzvoG9g7Q7gJy5IdAJV5sZd6peXXaqc04k1y7mHbqUNYXFh7bq'
+    'PXuz9V1+tKHYeGocwvXI9vQJLGTL5hZF8S9eXw/3'
+)
@@ -17,18 +17,15 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-
-
-
-import sys
-from collections import OrderedDict
-from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase,GetBase, InputBase
-from ansible.module_utils.network.ne.ne import get_nc_config, set_nc_config, ne_argument_spec
+from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import ietf_bgp as schema_artifact
 
 ANSIBLE_METADATA = {'metadata_version': '1.1',
                     'status': ['preview'],
                     'supported_by': 'community'}
 
+
 EXAMPLE = """
 ---
 - name: ietf_bgp
@@ -68,6 +65,8 @@ EXAMPLE = """
 
 
 """
+
+
 DOCUMENTATION = """
 ---
 module:ietf_bgp
@@ -200,61 +199,6 @@ options:
 """
 
 
-
-xml_head = """<config>"""
-
-xml_tail = """</config>"""
-
-# Keyword list
-key_list = ['/routing/control-plane-protocols/control-plane-protocol/type', '/routing/control-plane-protocols/control-plane-protocol/name', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/afi-safi-name']
-
-namespaces = [{'/routing': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"', '/routing']}, {'/routing/control-plane-protocols': ['', '', '/routing/control-plane-protocols']}, {'/routing/control-plane-protocols/control-plane-protocol': ['', '', '/routing/control-plane-protocols/control-plane-protocol']}, {'/routing/control-plane-protocols/control-plane-protocol/type': ['bgp', '', '/routing/control-plane-protocols/control-plane-protocol/type']}, {'/routing/control-plane-protocols/control-plane-protocol/name': ['bgp1', '', '/routing/control-plane-protocols/control-plane-protocol/name']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-bgp"', '/routing/control-plane-protocols/control-plane-protocol/bgp']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global': ['', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/as': ['100', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/as']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis': ['', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi': ['', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/afi-safi-name': ['ipv4-unicast', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/afi-safi-name']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/enabled': ['true', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/enabled']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast': ['', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast/segment-routing': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-bgp-sr"', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast/segment-routing']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast/segment-routing/srv6': ['', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast/segment-routing/srv6']}, {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast/segment-routing/srv6/sid-alloc-mode': ['per-vpn', '', '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/ipv4-unicast/segment-routing/srv6/sid-alloc-mode']}]
-
-business_tag = ['routing']
-
-# Passed to the ansible parameter
-argument_spec = OrderedDict([('routing', {'type': 'dict', 'options': OrderedDict([('control-plane-protocols', {'type': 'list', 'options': OrderedDict([('control-plane-protocol', {'type': 'dict', 'options': OrderedDict([('type', {'type': 'str', 'required': False}), ('name', {'type': 'str', 'required': False}), ('bgp', {'type': 'dict', 'options': OrderedDict([('global', {'type': 'dict', 'options': OrderedDict([('as', {'type': 'int', 'required': False}), ('afi-safis', {'type': 'list', 'options': OrderedDict([('afi-safi', {'type': 'dict', 'options': OrderedDict([('afi-safi-name', {'type': 'str', 'required': False}), ('enabled', {'type': 'bool', 'required': False}), ('ipv4-unicast', {'type': 'dict', 'options': OrderedDict([('segment-routing', {'type': 'dict', 'options': OrderedDict([('srv6', {'type': 'dict', 'options': OrderedDict([('sid-alloc-mode', {'required': False, 'choices': ['per-ce', 'per-route', 'per-vpn']})])})])})])})])})]), 'elements': 'dict'})])})])})])})]), 'elements': 'dict'})])})])
-
-# Operation type
-operation_dict = {'operation_type':{'type': 'str', 'required':True, 'choices': ['config','get','get-config','rpc']},
-                  'operation_specs': {
-                      'elements': 'dict', 'type': 'list','options': {
-                          'path': {
-                              'type': 'str'}, 'operation': {
-                              'choices': ['merge', 'replace', 'create', 'delete', 'remove'],'default':'merge'}}}}
-
-# Parameters passed to check params
-leaf_info =  OrderedDict([('routing', OrderedDict([('control-plane-protocols', OrderedDict([('control-plane-protocol', OrderedDict([('type', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': True}), 
-            ('name', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': True}), 
-            ('bgp', OrderedDict([('global', OrderedDict([('as', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'int', 'range': [(0, 4294967295)], 
-                'required': False, 'key': False}), 
-            ('afi-safis', OrderedDict([('afi-safi', OrderedDict([('afi-safi-name', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': True}), 
-            ('enabled', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('ipv4-unicast', OrderedDict([('segment-routing', OrderedDict([('srv6', OrderedDict([('sid-alloc-mode', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'enumeration', 'required': False, 'choices': ['per-ce', 'per-route', 'per-vpn'], 
-                'key': False})]))]))]))]))]))]))]))]))]))]))])
-
-
 # User check params
 class UserCheck(object):
     def __init__(self, params, infos):
@@ -273,47 +217,9 @@ class UserCheck(object):
         return 1   
 
 
-# Call the ConfigBase base class
-def config_base(config_args):
-    class_object = ConfigBase(*config_args)
-    class_object.run()
-
-
-# Call the GetBase base class
-def get_base(get_args):
-    class_object = GetBase(*get_args)
-    class_object.run()
-
-def input_base(input_args):
-    class_object = InputBase(*input_args)
-    class_object.run()
-
-
-# According to the type of message
-def operation(operation_type,args):
-    if operation_type == 'config':
-        config_base(args)
-    elif operation_type == 'get' or operation_type == 'get-config':
-        get_base(args)
-    else:
-        input_base(args)
-
-
-def filter_check(user_check_obj):
-    return (list(
-        filter(lambda m: m.startswith("check_"), [i + '()' for i in dir(user_check_obj)])))
-
-
 def main():
     """Module main"""
-    argument_spec.update(ne_argument_spec)
-    argument_spec.update(operation_dict)
-    args = (argument_spec, leaf_info, namespaces, business_tag, xml_head,xml_tail,key_list)
-    module_params = ConfigBase(*args).get_operation_type()
-    for check_func in filter_check(UserCheck):
-        if not eval('UserCheck(module_params, leaf_info).' + check_func):
-            ConfigBase(*args).init_module().fail_json(msg='UserCheck.'+ check_func)
-    operation(module_params['operation_type'], args)
+    run_module(load_schema(schema_artifact).args(), UserCheck)
 
 
 if __name__ == '__main__':
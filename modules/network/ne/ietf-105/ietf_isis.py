@@ -17,18 +17,15 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-
-
-
-import sys
-from collections import OrderedDict
-from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase,GetBase, InputBase
-from ansible.module_utils.network.ne.ne import get_nc_config, set_nc_config, ne_argument_spec
+from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import ietf_isis as schema_artifact
 
 ANSIBLE_METADATA = {'metadata_version': '1.1',
                     'status': ['preview'],
                     'supported_by': 'community'}
 
+
 EXAMPLE = """
 ---
 - name: ietf_isis
@@ -67,6 +64,8 @@ EXAMPLE = """
 
 
 """
+
+
 DOCUMENTATION = """
 ---
 module:ietf_isis
@@ -203,78 +202,6 @@ options:
 """
 
 
-
-xml_head = """<config>"""
-
-xml_tail = """</config>"""
-
-# Keyword list
-key_list = ['/routing/control-plane-protocols/control-plane-protocol/type', '/routing/control-plane-protocols/control-plane-protocol/name']
-
-namespaces = [{'/routing': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"', '/routing']}, {'/routing/control-plane-protocols': ['', '', '/routing/control-plane-protocols']}, {'/routing/control-plane-protocols/control-plane-protocol': ['', '', '/routing/control-plane-protocols/control-plane-protocol']}, {'/routing/control-plane-protocols/control-plane-protocol/type': ['isis', '', '/routing/control-plane-protocols/control-plane-protocol/type']}, {'/routing/control-plane-protocols/control-plane-protocol/name': ['is-is-1', '', '/routing/control-plane-protocols/control-plane-protocol/name']}, {'/routing/control-plane-protocols/control-plane-protocol/isis': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-isis"', '/routing/control-plane-protocols/control-plane-protocol/isis']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/enable': ['true', '', '/routing/control-plane-protocols/control-plane-protocol/isis/enable']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/level-type': ['level-2', '', '/routing/control-plane-protocols/control-plane-protocol/isis/level-type']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/system-id': ['1111.1111.1111', '', '/routing/control-plane-protocols/control-plane-protocol/isis/system-id']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/area-address': ['00', '', '/routing/control-plane-protocols/control-plane-protocol/isis/area-address']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-isis-srv6"', '/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/enable': ['true', '', '/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/enable']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/default-locator': ['false', '', '/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/default-locator']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/locator-name': ['test', '', '/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/locator-name']}, {'/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/persistent-end-x-sid': ['true', '', '/routing/control-plane-protocols/control-plane-protocol/isis/srv6-cfg/persistent-end-x-sid']}]
-
-business_tag = ['routing']
-
-# Passed to the ansible parameter
-argument_spec = OrderedDict([('routing', {'type': 'dict', 'options': OrderedDict([('control-plane-protocols', {'type': 'list', 'options': OrderedDict([('control-plane-protocol', {'type': 'dict', 'options': OrderedDict([('type', {'type': 'str', 'required': False}), ('name', {'type': 'str', 'required': False}), ('isis', {'type': 'dict', 'options': OrderedDict([('enable', {'type': 'bool', 'required': False}), ('level-type', {'required': False, 'choices': ['level-1', 'level-2', 'level-all']}), ('system-id', {'type': 'str', 'required': False}), ('area-address', {'type': 'str', 'required': False}), ('srv6-cfg', {'type': 'dict', 'options': OrderedDict([('enable', {'type': 'bool', 'required': False}), ('default-locator', {'type': 'bool', 'required': False}), ('locator-name', {'type': 'str', 'required': False}), ('persistent-end-x-sid', {'type': 'bool', 'required': False})])})])})])})]), 'elements': 'dict'})])})])
-
-# Operation type
-operation_dict = {'operation_type':{'type': 'str', 'required':True, 'choices': ['config','get','get-config','rpc']},
-                  'operation_specs': {
-                      'elements': 'dict', 'type': 'list','options': {
-                          'path': {
-                              'type': 'str'}, 'operation': {
-                              'choices': ['merge', 'replace', 'create', 'delete', 'remove'],'default':'merge'}}}}
-
-# Parameters passed to check params
-leaf_info =  OrderedDict([('routing', OrderedDict([('control-plane-protocols', OrderedDict([('control-plane-protocol', OrderedDict([('type', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': True}), 
-            ('name', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': True}), 
-            ('isis', OrderedDict([('enable', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('level-type', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'enumeration', 'required': False, 'choices': ['level-1', 'level-2', 'level-all'], 
-                'key': False}), 
-            ('system-id', {
-                'default': None, 
-                'pattern': ['[0-9A-Fa-f]{4}\\.[0-9A-Fa-f]{4}\\.[0-9A-Fa-f]{4}'], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': False}), 
-            ('area-address', {
-                'default': None, 
-                'pattern': ['[0-9A-Fa-f]{2}(\\.[0-9A-Fa-f]{4}){0,6}'], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': False}), 
-            ('srv6-cfg', OrderedDict([('enable', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('default-locator', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('locator-name', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': False}), 
-            ('persistent-end-x-sid', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'})]))]))]))]))]))])
-
-
 # User check params
 class UserCheck(object):
     def __init__(self, params, infos):
@@ -293,47 +220,9 @@ class UserCheck(object):
         return 1   
 
 
-# Call the ConfigBase base class
-def config_base(config_args):
-    class_object = ConfigBase(*config_args)
-    class_object.run()
-
-
-# Call the GetBase base class
-def get_base(get_args):
-    class_object = GetBase(*get_args)
-    class_object.run()
-
-def input_base(input_args):
-    class_object = InputBase(*input_args)
-    class_object.run()
-
-
-# According to the type of message
-def operation(operation_type,args):
-    if operation_type == 'config':
-        config_base(args)
-    elif operation_type == 'get' or operation_type == 'get-config':
-        get_base(args)
-    else:
-        input_base(args)
-
-
-def filter_check(user_check_obj):
-    return (list(
-        filter(lambda m: m.startswith("check_"), [i + '()' for i in dir(user_check_obj)])))
-
-
 def main():
     """Module main"""
-    argument_spec.update(ne_argument_spec)
-    argument_spec.update(operation_dict)
-    args = (argument_spec, leaf_info, namespaces, business_tag, xml_head,xml_tail,key_list)
-    module_params = ConfigBase(*args).get_operation_type()
-    for check_func in filter_check(UserCheck):
-        if not eval('UserCheck(module_params, leaf_info).' + check_func):
-            ConfigBase(*args).init_module().fail_json(msg='UserCheck.'+ check_func)
-    operation(module_params['operation_type'], args)
+    run_module(load_schema(schema_artifact).args(), UserCheck)
 
 
 if __name__ == '__main__':
@@ -17,18 +17,15 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-
-
-
-import sys
-from collections import OrderedDict
-from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase,GetBase, InputBase
-from ansible.module_utils.network.ne.ne import get_nc_config, set_nc_config, ne_argument_spec
+from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import ietf_srv6 as schema_artifact
 
 ANSIBLE_METADATA = {'metadata_version': '1.1',
                     'status': ['preview'],
                     'supported_by': 'community'}
 
+
 EXAMPLE = """
 ---
 - name: ietf_srv6
@@ -73,6 +70,8 @@ EXAMPLE = """
 
 
 """
+
+
 DOCUMENTATION = """
 ---
 module:ietf_srv6
@@ -243,83 +242,6 @@ options:
 """
 
 
-
-xml_head = """<config>"""
-
-xml_tail = """</config>"""
-
-# Keyword list
-key_list = ['/routing/srv6/locators/locator/name', '/routing/srv6/locators/locator/static/local-sids/sid/opcode']
-
-namespaces = [{'/routing': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"', '/routing']}, {'/routing/srv6': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-srv6-base"', '/routing/srv6']}, {'/routing/srv6/enable': ['true', '', '/routing/srv6/enable']}, {'/routing/srv6/encapsulation': ['', '', '/routing/srv6/encapsulation']}, {'/routing/srv6/locators': ['', '', '/routing/srv6/locators']}, {'/routing/srv6/encapsulation/source-address': ['A1::123', '', '/routing/srv6/encapsulation/source-address']}, {'/routing/srv6/encapsulation/ip-ttl-propagation': ['1', '', '/routing/srv6/encapsulation/ip-ttl-propagation']}, {'/routing/srv6/locators/locator': ['', '', '/routing/srv6/locators/locator']}, {'/routing/srv6/locators/locator/name': ['test1', '', '/routing/srv6/locators/locator/name']}, {'/routing/srv6/locators/locator/enable': ['true', '', '/routing/srv6/locators/locator/enable']}, {'/routing/srv6/locators/locator/is-default': ['true', '', '/routing/srv6/locators/locator/is-default']}, {'/routing/srv6/locators/locator/prefix': ['', '', '/routing/srv6/locators/locator/prefix']}, {'/routing/srv6/locators/locator/static': ['', '@xmlns="urn:ietf:params:xml:ns:yang:ietf-srv6-static"', '/routing/srv6/locators/locator/static']}, {'/routing/srv6/locators/locator/prefix/address': ['A2::123', '', '/routing/srv6/locators/locator/prefix/address']}, {'/routing/srv6/locators/locator/prefix/length': ['64', '', '/routing/srv6/locators/locator/prefix/length']}, {'/routing/srv6/locators/locator/static/local-sids': ['', '', '/routing/srv6/locators/locator/static/local-sids']}, {'/routing/srv6/locators/locator/static/local-sids/sid': ['', '', '/routing/srv6/locators/locator/static/local-sids/sid']}, {'/routing/srv6/locators/locator/static/local-sids/sid/opcode': ['65', '', '/routing/srv6/locators/locator/static/local-sids/sid/opcode']}, {'/routing/srv6/locators/locator/static/local-sids/sid/end-behavior-type': ['End', '', '/routing/srv6/locators/locator/static/local-sids/sid/end-behavior-type']}, {'/routing/srv6/locators/locator/static/local-sids/sid/end-dt4': ['', '', '/routing/srv6/locators/locator/static/local-sids/sid/end-dt4']}, {'/routing/srv6/locators/locator/static/local-sids/sid/end-dt4/lookup-table-ipv4': ['100', '', '/routing/srv6/locators/locator/static/local-sids/sid/end-dt4/lookup-table-ipv4']}]
-
-business_tag = ['routing']
-
-# Passed to the ansible parameter
-argument_spec = OrderedDict([('routing', {'type': 'dict', 'options': OrderedDict([('srv6', {'type': 'dict', 'options': OrderedDict([('enable', {'type': 'bool', 'required': False}), ('encapsulation', {'type': 'dict', 'options': OrderedDict([('source-address', {'type': 'str', 'required': False}), ('ip-ttl-propagation', {'type': 'bool', 'required': False})])}), ('locators', {'type': 'list', 'options': OrderedDict([('locator', {'type': 'dict', 'options': OrderedDict([('name', {'type': 'str', 'required': False}), ('enable', {'type': 'bool', 'required': False}), ('is-default', {'type': 'bool', 'required': False}), ('prefix', {'type': 'dict', 'options': OrderedDict([('address', {'type': 'str', 'required': False}), ('length', {'type': 'int', 'required': False})])}), ('static', {'type': 'dict', 'options': OrderedDict([('local-sids', {'type': 'list', 'options': OrderedDict([('sid', {'type': 'dict', 'options': OrderedDict([('opcode', {'type': 'int', 'required': False}), ('end-behavior-type', {'type': 'str', 'required': False}), ('end-dt4', {'type': 'dict', 'options': OrderedDict([('lookup-table-ipv4', {'type': 'int', 'required': False})])})])})]), 'elements': 'dict'})])})])})]), 'elements': 'dict'})])})])})])
-
-# Operation type
-operation_dict = {'operation_type':{'type': 'str', 'required':True, 'choices': ['config','get','get-config','rpc']},
-                  'operation_specs': {
-                      'elements': 'dict', 'type': 'list','options': {
-                          'path': {
-                              'type': 'str'}, 'operation': {
-                              'choices': ['merge', 'replace', 'create', 'delete', 'remove'],'default':'merge'}}}}
-
-# Parameters passed to check params
-leaf_info =  OrderedDict([('routing', OrderedDict([('srv6', OrderedDict([('enable', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('encapsulation', OrderedDict([('source-address', {
-                'default': None, 
-                'pattern': ['((:|[0-9a-fA-F]{0,4}):)([0-9a-fA-F]{0,4}:){0,5}((([0-9a-fA-F]{0,4}:)?(:|[0-9a-fA-F]{0,4}))|(((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])\\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])))(%[\\p{N}\\p{L}]+)?', '(([^:]+:){6}(([^:]+:[^:]+)|(.*\\..*)))|((([^:]+:)*[^:]+)?::(([^:]+:)*[^:]+)?)(%.+)?'], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': False}), 
-            ('ip-ttl-propagation', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'})])), 
-            ('locators', OrderedDict([('locator', OrderedDict([('name', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': True}), 
-            ('enable', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('is-default', {
-                'default': None, 'required': False, 'key': False, 
-                'pattern': [], 
-                'type': 'boolean'}), 
-            ('prefix', OrderedDict([('address', {
-                'default': None, 
-                'pattern': ['((:|[0-9a-fA-F]{0,4}):)([0-9a-fA-F]{0,4}:){0,5}((([0-9a-fA-F]{0,4}:)?(:|[0-9a-fA-F]{0,4}))|(((25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])\\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])))(%[\\p{N}\\p{L}]+)?', '(([^:]+:){6}(([^:]+:[^:]+)|(.*\\..*)))|((([^:]+:)*[^:]+)?::(([^:]+:)*[^:]+)?)(%.+)?'], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': False}), 
-            ('length', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'int', 'range': [(32, 96)], 
-                'required': False, 'key': False})])), 
-            ('static', OrderedDict([('local-sids', OrderedDict([('sid', OrderedDict([('opcode', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'int', 'range': [(64, 4294967295)], 
-                'required': False, 'key': True}), 
-            ('end-behavior-type', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'string', 'required': False, 'length': [], 
-                'key': False}), 
-            ('end-dt4', OrderedDict([('lookup-table-ipv4', {
-                'default': None, 
-                'pattern': [], 
-                'type': 'int', 'range': [(0, 4294967295)], 
-                'required': False, 'key': False})]))]))]))]))]))]))]))]))])
-
-
 # User check params
 class UserCheck(object):
     def __init__(self, params, infos):
@@ -338,47 +260,9 @@ class UserCheck(object):
         return 1   
 
 
-# Call the ConfigBase base class
-def config_base(config_args):
-    class_object = ConfigBase(*config_args)
-    class_object.run()
-
-
-# Call the GetBase base class
-def get_base(get_args):
-    class_object = GetBase(*get_args)
-    class_object.run()
-
-def input_base(input_args):
-    class_object = InputBase(*input_args)
-    class_object.run()
-
-
-# According to the type of message
-def operation(operation_type,args):
-    if operation_type == 'config':
-        config_base(args)
-    elif operation_type == 'get' or operation_type == 'get-config':
-        get_base(args)
-    else:
-        input_base(args)
-
-
-def filter_check(user_check_obj):
-    return (list(
-        filter(lambda m: m.startswith("check_"), [i + '()' for i in dir(user_check_obj)])))
-
-
 def main():
     """Module main"""
-    argument_spec.update(ne_argument_spec)
-    argument_spec.update(operation_dict)
-    args = (argument_spec, leaf_info, namespaces, business_tag, xml_head,xml_tail,key_list)
-    module_params = ConfigBase(*args).get_operation_type()
-    for check_func in filter_check(UserCheck):
-        if not eval('UserCheck(module_params, leaf_info).' + check_func):
-            ConfigBase(*args).init_module().fail_json(msg='UserCheck.'+ check_func)
-    operation(module_params['operation_type'], args)
+    run_module(load_schema(schema_artifact).args(), UserCheck)
 
 
 if __name__ == '__main__':
@@ -17,16 +17,15 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-
-import sys
-from collections import OrderedDict
-from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase, GetBase, InputBase
-from ansible.module_utils.network.ne.ne import get_nc_config, set_nc_config, ne_argument_spec
+from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import ietf_interfaces_config as schema_artifact
 
 ANSIBLE_METADATA = {'metadata_version': '1.1',
                     'status': ['preview'],
                     'supported_by': 'community'}
 
+
 EXAMPLE = """
 ---
 - name: ietf-interfaces_config
@@ -58,6 +57,8 @@ EXAMPLE = """
 
 
 """
+
+
 DOCUMENTATION = """
 ---
 module:ietf-interfaces_config
@@ -189,126 +190,6 @@ options:
 """
 
 
-xml_head = """<config>"""
-
-xml_tail = """</config>"""
-
-# Keyword list
-key_list = ['/interfaces/interface/name',
-            '/interfaces/interface/ipv4/address/ip']
-
-namespaces = [{'/interfaces': ['',
-                               '@xmlns="urn:ietf:params:xml:ns:yang:ietf-interfaces"',
-                               '/interfaces']},
-              {'/interfaces/interface': ['',
-                                         '',
-                                         '/interfaces/interface']},
-              {'/interfaces/interface/name': ['GigabitEthernet 3/0/1',
-                                              '',
-                                              '/interfaces/interface/name']},
-              {'/interfaces/interface/type': ['ianaift:ethernetCsmacd',
-                                              '@xmlns:ianaift="urn:ietf:params:xml:ns:yang:iana-if-type"',
-                                              '/interfaces/interface/type']},
-              {'/interfaces/interface/ipv4': ['',
-                                              '@xmlns="urn:ietf:params:xml:ns:yang:ietf-ip"',
-                                              '/interfaces/interface/ipv4']},
-              {'/interfaces/interface/ipv4/address': ['',
-                                                      '@xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0"',
-                                                      '/interfaces/interface/ipv4/address']},
-              {'/interfaces/interface/ipv4/address/ip': ['192.0.2.2',
-                                                         '',
-                                                         '/interfaces/interface/ipv4/address/ip']},
-              {'/interfaces/interface/ipv4/address/prefix-length': ['32',
-                                                                    '',
-                                                                    '/interfaces/interface/ipv4/address/prefix-length']}]
-
-business_tag = ['interfaces']
-
-# Passed to the ansible parameter
-argument_spec = OrderedDict([('interfaces',
-                              {'type': 'list',
-                               'elements': 'dict',
-                               'options': OrderedDict([('interface',
-                                                        {'type': 'dict',
-                                                         'options': OrderedDict([('name',
-                                                                                  {'type': 'str',
-                                                                                   'required': False}),
-                                                                                 ('type',
-                                                                                  {'type': 'str',
-                                                                                   'required': False}),
-                                                                                 ('ipv4',
-                                                                                  {'type': 'list',
-                                                                                   'elements': 'dict',
-                                                                                   'options': OrderedDict([('address',
-                                                                                                            {'type': 'dict',
-                                                                                                             'options': OrderedDict([('ip',
-                                                                                                                                      {'type': 'str',
-                                                                                                                                       'required': False}),
-                                                                                                                                     ('prefix-length',
-                                                                                                                                      {'type': 'int',
-                                                                                                                                       'required': False})])})])})])})])})])
-
-# Operation type
-operation_dict = {
-    'operation_type': {
-        'type': 'str',
-        'required': True,
-        'choices': [
-            'config',
-            'get',
-            'get-config',
-            'rpc']},
-    'operation_specs': {
-        'elements': 'dict',
-        'type': 'list',
-                'options': {
-                    'path': {
-                        'type': 'str'},
-                    'operation': {
-                        'choices': [
-                            'merge',
-                            'replace',
-                            'create',
-                            'delete',
-                            'remove'],
-                        'default': 'merge'}}}}
-
-# Parameters passed to check params
-leaf_info = OrderedDict([('interfaces',
-                          OrderedDict([('interface',
-                                        OrderedDict([('name',
-                                                      {'default': None,
-                                                       'key': True,
-                                                       'length': [],
-                                                          'pattern': [],
-                                                          'type': 'string',
-                                                          'required': False}),
-                                                     ('type',
-                                                      {'default': None,
-                                                       'key': False,
-                                                       'length': [],
-                                                       'pattern': [],
-                                                       'type': 'string',
-                                                       'required': False}),
-                                                     ('ipv4',
-                                                      OrderedDict([('address',
-                                                                    OrderedDict([('ip',
-                                                                                  {'default': None,
-                                                                                   'key': True,
-                                                                                   'length': [],
-                                                                                   'pattern': ['[0-9\\.]*'],
-                                                                                   'type': 'string',
-                                                                                   'required': False}),
-                                                                                 ('prefix-length',
-                                                                                  {'default': None,
-                                                                                   'key': False,
-                                                                                   'pattern': [],
-                                                                                   'range': [(0,
-                                                                                              32)],
-                                                                                   'type': 'int',
-                                                                                   'required': False})]))]))]))]))])
-
-
 # User check params
 class UserCheck(object):
     def __init__(self, params, infos):
@@ -327,62 +208,9 @@ class UserCheck(object):
         return 1
 
 
-# Call the ConfigBase base class
-def config_base(config_args):
-    class_object = ConfigBase(*config_args)
-    class_object.run()
-
-
-# Call the GetBase base class
-def get_base(get_args):
-    class_object = GetBase(*get_args)
-    class_object.run()
-
-
-def input_base(input_args):
-    class_object = InputBase(*input_args)
-    class_object.run()
-
-
-# According to the type of message
-def operation(operation_type, args):
-    if operation_type == 'config':
-        config_base(args)
-    elif operation_type == 'get' or operation_type == 'get-config':
-        get_base(args)
-    else:
-        input_base(args)
-
-
-def filter_check(user_check_obj):
-    return (
-        list(
-            filter(
-                lambda m: m.startswith("check_"), [
-                    i + '()' for i in dir(user_check_obj)])))
-
-
 def main():
     """Module main"""
-    argument_spec.update(ne_argument_spec)
-    argument_spec.update(operation_dict)
-    args = (
-        argument_spec,
-        leaf_info,
-        namespaces,
-        business_tag,
-        xml_head,
-        xml_tail,
-        key_list)
-    module_params = ConfigBase(*args).get_operation_type()
-    for check_func in filter_check(UserCheck):
-        if not eval('UserCheck(module_params, leaf_info).' + check_func):
-            ConfigBase(
-                *
-                args).init_module().fail_json(
-                msg='UserCheck.' +
-                check_func)
-    operation(module_params['operation_type'], args)
+    run_module(load_schema(schema_artifact).args(), UserCheck)
 
 
 if __name__ == '__main__':
@@ -17,16 +17,15 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-
-import sys
-from collections import OrderedDict
-from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase, GetBase, InputBase
-from ansible.module_utils.network.ne.ne import get_nc_config, set_nc_config, ne_argument_spec
+from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import ietf_l3vpn_ntw_config as schema_artifact
 
 ANSIBLE_METADATA = {'metadata_version': '1.1',
                     'status': ['preview'],
                     'supported_by': 'community'}
 
+
 EXAMPLE = """
 ---
 - name: ietf-l3vpn-ntw_config
@@ -92,6 +91,8 @@ EXAMPLE = """
 
 
 """
+
+
 DOCUMENTATION = """
 ---
 module:ietf-l3vpn-ntw_config
@@ -386,503 +387,6 @@ options:
 """
 
 
-xml_head = """<config>"""
-
-xml_tail = """</config>"""
-
-# Keyword list
-key_list = [
-    '/l3vpn-ntw/vpn-services/vpn-service/vpn-id',
-    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-node-id',
-    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/id',
-    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-targets/route-target',
-    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/address-id',
-    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/id']
-
-namespaces = [{'/l3vpn-ntw': ['',
-                              '@xmlns="urn:ietf:params:xml:ns:yang:ietf-l3vpn-ntw"',
-                              '/l3vpn-ntw']},
-              {'/l3vpn-ntw/vpn-services': ['',
-                                           '',
-                                           '/l3vpn-ntw/vpn-services']},
-              {'/l3vpn-ntw/vpn-services/vpn-service': ['',
-                                                       '',
-                                                       '/l3vpn-ntw/vpn-services/vpn-service']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-id': ['4G',
-                                                              '',
-                                                              '/l3vpn-ntw/vpn-services/vpn-service/vpn-id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/customer-name': ['mycustomer',
-                                                                     '',
-                                                                     '/l3vpn-ntw/vpn-services/vpn-service/customer-name']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-service-topology': ['custom',
-                                                                            '',
-                                                                            '/l3vpn-ntw/vpn-services/vpn-service/vpn-service-topology']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes': ['',
-                                                                 '',
-                                                                 '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node': ['',
-                                                                          '',
-                                                                          '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-node-id': ['44',
-                                                                                      '',
-                                                                                      '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-node-id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/ne-id': ['10.0.0.1',
-                                                                                '',
-                                                                                '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/ne-id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/local-autonomous-system': ['65550',
-                                                                                                  '',
-                                                                                                  '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/local-autonomous-system']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/rd': ['0:65550:1',
-                                                                             '',
-                                                                             '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/rd']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets': ['',
-                                                                                      '',
-                                                                                      '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses': ['',
-                                                                                               '',
-                                                                                               '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target': ['',
-                                                                                                 '',
-                                                                                                 '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access': ['',
-                                                                                                                  '',
-                                                                                                                  '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/id': ['1',
-                                                                                                    '',
-                                                                                                    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-targets': ['',
-                                                                                                               '',
-                                                                                                               '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-targets']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-target-type': ['both',
-                                                                                                                   '',
-                                                                                                                   '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-target-type']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/port-id': ['GigabitEthernet 3/0/0',
-                                                                                                                          '',
-                                                                                                                          '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/port-id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/description': ['Interface DATA to eNODE-B',
-                                                                                                                              '',
-                                                                                                                              '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/description']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/status': ['',
-                                                                                                                         '',
-                                                                                                                         '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/status']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/vpn-network-access-type': ['vpn-common:point-to-point',
-                                                                                                                                          '@xmlns:vpn-common="urn:ietf:params:xml:ns:yang:ietf-vpn-common"',
-                                                                                                                                          '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/vpn-network-access-type']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection': ['',
-                                                                                                                                '',
-                                                                                                                                '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols': ['',
-                                                                                                                                    '',
-                                                                                                                                    '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-targets/route-target': ['0:65550:1',
-                                                                                                                            '',
-                                                                                                                            '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-targets/vpn-target/route-targets/route-target']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4': ['',
-                                                                                                                                     '',
-                                                                                                                                     '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol': ['',
-                                                                                                                                                     '',
-                                                                                                                                                     '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address-allocation-type': ['static-address',
-                                                                                                                                                             '',
-                                                                                                                                                             '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address-allocation-type']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/primary-address': ['1',
-                                                                                                                                                     '',
-                                                                                                                                                     '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/primary-address']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address': ['',
-                                                                                                                                             '',
-                                                                                                                                             '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/id': ['1',
-                                                                                                                                                        '',
-                                                                                                                                                        '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/type': ['vpn-common:bgp',
-                                                                                                                                                          '@xmlns:vpn-common="urn:ietf:params:xml:ns:yang:ietf-vpn-common"',
-                                                                                                                                                          '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/type']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp': ['',
-                                                                                                                                                         '',
-                                                                                                                                                         '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/address-id': ['1',
-                                                                                                                                                        '',
-                                                                                                                                                        '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/address-id']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/s-provider-address': ['192.0.2.1',
-                                                                                                                                                                '',
-                                                                                                                                                                '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/s-provider-address']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/s-customer-address': ['192.0.2.2',
-                                                                                                                                                                '',
-                                                                                                                                                                '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/s-customer-address']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/s-prefix-length': ['32',
-                                                                                                                                                             '',
-                                                                                                                                                             '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/ip-connection/ipv4/address/s-prefix-length']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/peer-autonomous-system': ['200',
-                                                                                                                                                                                '',
-                                                                                                                                                                                '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/peer-autonomous-system']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/local-autonomous-system': ['65550',
-                                                                                                                                                                                 '',
-                                                                                                                                                                                 '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/local-autonomous-system']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/address-family': ['ipv4',
-                                                                                                                                                                        '',
-                                                                                                                                                                        '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/address-family']},
-              {'/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/neighbor': ['192.0.2.2',
-                                                                                                                                                                  '',
-                                                                                                                                                                  '/l3vpn-ntw/vpn-services/vpn-service/vpn-nodes/vpn-node/vpn-network-accesses/vpn-network-access/routing-protocols/routing-protocol/bgp/neighbor']}]
-
-business_tag = ['l3vpn-ntw']
-
-# Passed to the ansible parameter
-argument_spec = OrderedDict([('l3vpn-ntw',
-                              {'type': 'dict',
-                               'options': OrderedDict([('vpn-services',
-                                                        {'type': 'list',
-                                                         'elements': 'dict',
-                                                         'options': OrderedDict([('vpn-service',
-                                                                                  {'type': 'dict',
-                                                                                   'options': OrderedDict([('vpn-id',
-                                                                                                            {'type': 'str',
-                                                                                                             'required': False}),
-                                                                                                           ('customer-name',
-                                                                                                            {'type': 'str',
-                                                                                                             'required': False}),
-                                                                                                           ('vpn-service-topology',
-                                                                                                            {'type': 'str',
-                                                                                                             'required': False}),
-                                                                                                           ('vpn-nodes',
-                                                                                                            {'type': 'list',
-                                                                                                             'elements': 'dict',
-                                                                                                             'options': OrderedDict([('vpn-node',
-                                                                                                                                      {'type': 'dict',
-                                                                                                                                       'options': OrderedDict([('vpn-node-id',
-                                                                                                                                                                {'type': 'str',
-                                                                                                                                                                 'required': False}),
-                                                                                                                                                               ('ne-id',
-                                                                                                                                                                {'type': 'str',
-                                                                                                                                                                 'required': False}),
-                                                                                                                                                               ('local-autonomous-system',
-                                                                                                                                                                {'type': 'int',
-                                                                                                                                                                 'required': False}),
-                                                                                                                                                               ('rd',
-                                                                                                                                                                {'type': 'str',
-                                                                                                                                                                 'required': False}),
-                                                                                                                                                               ('vpn-targets',
-                                                                                                                                                                {'type': 'list',
-                                                                                                                                                                 'elements': 'dict',
-                                                                                                                                                                 'options': OrderedDict([('vpn-target',
-                                                                                                                                                                                          {'type': 'list',
-                                                                                                                                                                                           'elements': 'dict',
-                                                                                                                                                                                           'options': OrderedDict([('id',
-                                                                                                                                                                                                                    {'type': 'int',
-                                                                                                                                                                                                                     'required': False}),
-                                                                                                                                                                                                                   ('route-targets',
-                                                                                                                                                                                                                    {'type': 'dict',
-                                                                                                                                                                                                                     'options': OrderedDict([('route-target',
-                                                                                                                                                                                                                                              {'type': 'str',
-                                                                                                                                                                                                                                               'required': False})])}),
-                                                                                                                                                                                                                   ('route-target-type',
-                                                                                                                                                                                                                    {'choices': ['import',
-                                                                                                                                                                                                                                 'export',
-                                                                                                                                                                                                                                 'both'],
-                                                                                                                                                                                                                     'required': False})])})])}),
-                                                                                                                                                               ('vpn-network-accesses',
-                                                                                                                                                                {'type': 'list',
-                                                                                                                                                                 'elements': 'dict',
-                                                                                                                                                                 'options': OrderedDict([('vpn-network-access',
-                                                                                                                                                                                          {'type': 'dict',
-                                                                                                                                                                                           'options': OrderedDict([('port-id',
-                                                                                                                                                                                                                    {'type': 'str',
-                                                                                                                                                                                                                     'required': False}),
-                                                                                                                                                                                                                   ('description',
-                                                                                                                                                                                                                    {'type': 'str',
-                                                                                                                                                                                                                     'required': False}),
-                                                                                                                                                                                                                   ('status',
-                                                                                                                                                                                                                    {'type': None,
-                                                                                                                                                                                                                     'required': False}),
-                                                                                                                                                                                                                   ('vpn-network-access-type',
-                                                                                                                                                                                                                    {'type': 'str',
-                                                                                                                                                                                                                     'required': False}),
-                                                                                                                                                                                                                   ('ip-connection',
-                                                                                                                                                                                                                    {'type': 'dict',
-                                                                                                                                                                                                                     'options': OrderedDict([('ipv4',
-                                                                                                                                                                                                                                              {'type': 'list',
-                                                                                                                                                                                                                                               'elements': 'dict',
-                                                                                                                                                                                                                                               'options': OrderedDict([('address-allocation-type',
-                                                                                                                                                                                                                                                                        {'type': 'str',
-                                                                                                                                                                                                                                                                         'required': False}),
-                                                                                                                                                                                                                                                                       ('primary-address',
-                                                                                                                                                                                                                                                                        {'type': 'str',
-                                                                                                                                                                                                                                                                         'required': False}),
-                                                                                                                                                                                                                                                                       ('address',
-                                                                                                                                                                                                                                                                        {'type': 'dict',
-                                                                                                                                                                                                                                                                         'options': OrderedDict([('address-id',
-                                                                                                                                                                                                                                                                                                  {'type': 'str',
-                                                                                                                                                                                                                                                                                                   'required': False}),
-                                                                                                                                                                                                                                                                                                 ('s-provider-address',
-                                                                                                                                                                                                                                                                                                  {'type': 'str',
-                                                                                                                                                                                                                                                                                                   'required': False}),
-                                                                                                                                                                                                                                                                                                 ('s-customer-address',
-                                                                                                                                                                                                                                                                                                  {'type': 'str',
-                                                                                                                                                                                                                                                                                                   'required': False}),
-                                                                                                                                                                                                                                                                                                 ('s-prefix-length',
-                                                                                                                                                                                                                                                                                                  {'type': 'int',
-                                                                                                                                                                                                                                                                                                   'required': False})])})])})])}),
-                                                                                                                                                                                                                   ('routing-protocols',
-                                                                                                                                                                                                                    {'type': 'list',
-                                                                                                                                                                                                                     'elements': 'dict',
-                                                                                                                                                                                                                     'options': OrderedDict([('routing-protocol',
-                                                                                                                                                                                                                                              {'type': 'dict',
-                                                                                                                                                                                                                                               'options': OrderedDict([('id',
-                                                                                                                                                                                                                                                                        {'type': 'str',
-                                                                                                                                                                                                                                                                         'required': False}),
-                                                                                                                                                                                                                                                                       ('type',
-                                                                                                                                                                                                                                                                        {'type': 'str',
-                                                                                                                                                                                                                                                                         'required': False}),
-                                                                                                                                                                                                                                                                       ('bgp',
-                                                                                                                                                                                                                                                                        {'type': 'dict',
-                                                                                                                                                                                                                                                                         'options': OrderedDict([('peer-autonomous-system',
-                                                                                                                                                                                                                                                                                                  {'type': 'int',
-                                                                                                                                                                                                                                                                                                   'required': False}),
-                                                                                                                                                                                                                                                                                                 ('local-autonomous-system',
-                                                                                                                                                                                                                                                                                                  {'type': 'int',
-                                                                                                                                                                                                                                                                                                   'required': False}),
-                                                                                                                                                                                                                                                                                                 ('address-family',
-                                                                                                                                                                                                                                                                                                  {'choices': ['ipv4',
-                                                                                                                                                                                                                                                                                                               'ipv6'],
-                                                                                                                                                                                                                                                                                                   'required': False}),
-                                                                                                                                                                                                                                                                                                 ('neighbor',
-                                                                                                                                                                                                                                                                                                  {'type': 'str',
-                                                                                                                                                                                                                                                                                                   'required': False})])})])})])})])})])})])})])})])})])})])})])
-
-# Operation type
-operation_dict = {
-    'operation_type': {
-        'type': 'str',
-        'required': True,
-        'choices': [
-            'config',
-            'get',
-            'get-config',
-            'rpc']},
-    'operation_specs': {
-        'elements': 'dict',
-        'type': 'list',
-                'options': {
-                    'path': {
-                        'type': 'str'},
-                    'operation': {
-                        'choices': [
-                            'merge',
-                            'replace',
-                            'create',
-                            'delete',
-                            'remove'],
-                        'default': 'merge'}}}}
-
-# Parameters passed to check params
-leaf_info = OrderedDict([('l3vpn-ntw',
-                          OrderedDict([('vpn-services',
-                                        OrderedDict([('vpn-service',
-                                                      OrderedDict([('vpn-id',
-                                                                    {'default': None,
-                                                                     'key': True,
-                                                                     'length': [],
-                                                                        'pattern': [],
-                                                                        'type': 'string',
-                                                                        'required': False}),
-                                                                   ('customer-name',
-                                                                    {'default': None,
-                                                                     'key': False,
-                                                                     'length': [],
-                                                                     'pattern': [],
-                                                                     'type': 'string',
-                                                                     'required': False}),
-                                                                   ('vpn-service-topology',
-                                                                    {'default': None,
-                                                                     'key': False,
-                                                                     'length': [],
-                                                                     'pattern': [],
-                                                                     'type': 'string',
-                                                                     'required': False}),
-                                                                   ('vpn-nodes',
-                                                                    OrderedDict([('vpn-node',
-                                                                                  OrderedDict([('vpn-node-id',
-                                                                                                {'default': None,
-                                                                                                 'key': True,
-                                                                                                 'length': [],
-                                                                                                 'pattern': [],
-                                                                                                 'type': 'string',
-                                                                                                 'required': False}),
-                                                                                               ('ne-id',
-                                                                                                {'default': None,
-                                                                                                 'key': False,
-                                                                                                 'length': [],
-                                                                                                 'pattern': [],
-                                                                                                 'type': 'string',
-                                                                                                 'required': False}),
-                                                                                               ('local-autonomous-system',
-                                                                                                {'default': None,
-                                                                                                 'key': False,
-                                                                                                 'pattern': [],
-                                                                                                 'range': [(0,
-                                                                                                            4294967295)],
-                                                                                                 'type': 'int',
-                                                                                                 'required': False}),
-                                                                                               ('rd',
-                                                                                                {'default': None,
-                                                                                                 'key': False,
-                                                                                                 'length': [],
-                                                                                                 'pattern': [],
-                                                                                                 'type': 'string',
-                                                                                                 'required': False}),
-                                                                                               ('vpn-targets',
-                                                                                                OrderedDict([('vpn-target',
-                                                                                                              OrderedDict([('id',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': True,
-                                                                                                                             'pattern': [],
-                                                                                                                             'range': [(-128,
-                                                                                                                                        127)],
-                                                                                                                             'type': 'int',
-                                                                                                                             'required': False}),
-                                                                                                                           ('route-targets',
-                                                                                                                            OrderedDict([('route-target',
-                                                                                                                                          {'default': None,
-                                                                                                                                           'key': True,
-                                                                                                                                           'length': [],
-                                                                                                                                           'pattern': ['(0:(6553[0-5]|655[0-2][0-9]|65[0-4][0-9]{2}|6[0-4][0-9]{3}|[1-5][0-9]{4}|[1-9][0-9]{0,3}|0):(429496729[0-5]|42949672[0-8][0-9]|4294967[01][0-9]{2}|429496[0-6][0-9]{3}|42949[0-5][0-9]{4}|4294[0-8][0-9]{5}|429[0-3][0-9]{6}|42[0-8][0-9]{7}|4[01][0-9]{8}|[1-3][0-9]{9}|[1-9][0-9]{0,8}|0))|(1:((([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])):(6553[0-5]|655[0-2][0-9]|65[0-4][0-9]{2}|6[0-4][0-9]{3}|[1-5][0-9]{4}|[1-9][0-9]{0,3}|0))|(2:(429496729[0-5]|42949672[0-8][0-9]|4294967[01][0-9]{2}|429496[0-6][0-9]{3}|42949[0-5][0-9]{4}|4294[0-8][0-9]{5}|429[0-3][0-9]{6}|42[0-8][0-9]{7}|4[01][0-9]{8}|[1-3][0-9]{9}|[1-9][0-9]{0,8}|0):(6553[0-5]|655[0-2][0-9]|65[0-4][0-9]{2}|6[0-4][0-9]{3}|[1-5][0-9]{4}|[1-9][0-9]{0,3}|0))|(6(:[a-fA-F0-9]{2}){6})|(([3-57-9a-fA-F]|[1-9a-fA-F][0-9a-fA-F]{1,3}):[0-9a-fA-F]{1,12})'],
-                                                                                                                                           'type': 'string',
-                                                                                                                                           'required': False})])),
-                                                                                                                           ('route-target-type',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': False,
-                                                                                                                             'pattern': [],
-                                                                                                                             'choices': ['import',
-                                                                                                                                         'export',
-                                                                                                                                         'both'],
-                                                                                                                             'type': 'enumeration',
-                                                                                                                             'required': False})]))])),
-                                                                                               ('vpn-network-accesses',
-                                                                                                OrderedDict([('vpn-network-access',
-                                                                                                              OrderedDict([('port-id',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': False,
-                                                                                                                             'length': [],
-                                                                                                                             'pattern': [],
-                                                                                                                             'type': 'string',
-                                                                                                                             'required': False}),
-                                                                                                                           ('description',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': False,
-                                                                                                                             'length': [],
-                                                                                                                             'pattern': [],
-                                                                                                                             'type': 'string',
-                                                                                                                             'required': False}),
-                                                                                                                           ('status',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': False,
-                                                                                                                             'type': None,
-                                                                                                                             'pattern': None,
-                                                                                                                             'required': False}),
-                                                                                                                           ('vpn-network-access-type',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': False,
-                                                                                                                             'length': [],
-                                                                                                                             'pattern': [],
-                                                                                                                             'type': 'string',
-                                                                                                                             'required': False}),
-                                                                                                                           ('ip-connection',
-                                                                                                                            OrderedDict([('ipv4',
-                                                                                                                                          OrderedDict([('address-allocation-type',
-                                                                                                                                                        {'default': None,
-                                                                                                                                                         'key': False,
-                                                                                                                                                         'length': [],
-                                                                                                                                                         'pattern': [],
-                                                                                                                                                         'type': 'string',
-                                                                                                                                                         'required': False}),
-                                                                                                                                                       ('primary-address',
-                                                                                                                                                        {'default': None,
-                                                                                                                                                         'key': False,
-                                                                                                                                                         'length': [],
-                                                                                                                                                         'pattern': [],
-                                                                                                                                                         'type': 'string',
-                                                                                                                                                         'required': False}),
-                                                                                                                                                       ('address',
-                                                                                                                                                        OrderedDict([('address-id',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': True,
-                                                                                                                                                                       'length': [],
-                                                                                                                                                                       'pattern': [],
-                                                                                                                                                                       'type': 'string',
-                                                                                                                                                                       'required': False}),
-                                                                                                                                                                     ('s-provider-address',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'length': [],
-                                                                                                                                                                       'pattern': ['(([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])\\.){3}([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])(%[\\p{N}\\p{L}]+)?'],
-                                                                                                                                                                       'type': 'string',
-                                                                                                                                                                       'required': False}),
-                                                                                                                                                                     ('s-customer-address',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'length': [],
-                                                                                                                                                                       'pattern': ['(([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])\\.){3}([0-9]|[1-9][0-9]|1[0-9][0-9]|2[0-4][0-9]|25[0-5])(%[\\p{N}\\p{L}]+)?'],
-                                                                                                                                                                       'type': 'string',
-                                                                                                                                                                       'required': False}),
-                                                                                                                                                                     ('s-prefix-length',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'pattern': [],
-                                                                                                                                                                       'range': [(0,
-                                                                                                                                                                                  32)],
-                                                                                                                                                                       'type': 'int',
-                                                                                                                                                                       'required': False})]))]))])),
-                                                                                                                           ('routing-protocols',
-                                                                                                                            OrderedDict([('routing-protocol',
-                                                                                                                                          OrderedDict([('id',
-                                                                                                                                                        {'default': None,
-                                                                                                                                                         'key': True,
-                                                                                                                                                         'length': [],
-                                                                                                                                                         'pattern': [],
-                                                                                                                                                         'type': 'string',
-                                                                                                                                                         'required': False}),
-                                                                                                                                                       ('type',
-                                                                                                                                                        {'default': None,
-                                                                                                                                                         'key': False,
-                                                                                                                                                         'length': [],
-                                                                                                                                                         'pattern': [],
-                                                                                                                                                         'type': 'string',
-                                                                                                                                                         'required': False}),
-                                                                                                                                                       ('bgp',
-                                                                                                                                                        OrderedDict([('peer-autonomous-system',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'pattern': [],
-                                                                                                                                                                       'range': [(0,
-                                                                                                                                                                                  4294967295)],
-                                                                                                                                                                       'type': 'int',
-                                                                                                                                                                       'required': False}),
-                                                                                                                                                                     ('local-autonomous-system',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'pattern': [],
-                                                                                                                                                                       'range': [(0,
-                                                                                                                                                                                  4294967295)],
-                                                                                                                                                                       'type': 'int',
-                                                                                                                                                                       'required': False}),
-                                                                                                                                                                     ('address-family',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'pattern': [],
-                                                                                                                                                                       'choices': ['ipv4',
-                                                                                                                                                                                   'ipv6'],
-                                                                                                                                                                       'type': 'enumeration',
-                                                                                                                                                                       'required': False}),
-                                                                                                                                                                     ('neighbor',
-                                                                                                                                                                      {'default': None,
-                                                                                                                                                                       'key': False,
-                                                                                                                                                                       'length': [],
-                                                                                                                                                                       'pattern': [],
-                                                                                                                                                                       'type': 'string',
-                                                                                                                                                                       'required': False})]))]))]))]))]))]))]))]))]))]))])
-
-
 # User check params
 class UserCheck(object):
     def __init__(self, params, infos):
@@ -901,62 +405,9 @@ class UserCheck(object):
         return 1
 
 
-# Call the ConfigBase base class
-def config_base(config_args):
-    class_object = ConfigBase(*config_args)
-    class_object.run()
-
-
-# Call the GetBase base class
-def get_base(get_args):
-    class_object = GetBase(*get_args)
-    class_object.run()
-
-
-def input_base(input_args):
-    class_object = InputBase(*input_args)
-    class_object.run()
-
-
-# According to the type of message
-def operation(operation_type, args):
-    if operation_type == 'config':
-        config_base(args)
-    elif operation_type == 'get' or operation_type == 'get-config':
-        get_base(args)
-    else:
-        input_base(args)
-
-
-def filter_check(user_check_obj):
-    return (
-        list(
-            filter(
-                lambda m: m.startswith("check_"), [
-                    i + '()' for i in dir(user_check_obj)])))
-
-
 def main():
     """Module main"""
-    argument_spec.update(ne_argument_spec)
-    argument_spec.update(operation_dict)
-    args = (
-        argument_spec,
-        leaf_info,
-        namespaces,
-        business_tag,
-        xml_head,
-        xml_tail,
-        key_list)
-    module_params = ConfigBase(*args).get_operation_type()
-    for check_func in filter_check(UserCheck):
-        if not eval('UserCheck(module_params, leaf_info).' + check_func):
-            ConfigBase(
-                *
-                args).init_module().fail_json(
-                msg='UserCheck.' +
-                check_func)
-    operation(module_params['operation_type'], args)
+    run_module(load_schema(schema_artifact).args(), UserCheck)
 
 
 if __name__ == '__main__':
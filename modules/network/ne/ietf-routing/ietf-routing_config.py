@@ -17,16 +17,15 @@
 # along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 #
 
-
-import sys
-from collections import OrderedDict
-from ansible.module_utils.network.ne.common_module.ne_base import ConfigBase, GetBase, InputBase
-from ansible.module_utils.network.ne.ne import get_nc_config, set_nc_config, ne_argument_spec
+from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import ietf_routing_config as schema_artifact
 
 ANSIBLE_METADATA = {'metadata_version': '1.1',
                     'status': ['preview'],
                     'supported_by': 'community'}
 
+
 EXAMPLE = """
 ---
 - name: ietf-routing_config
@@ -67,6 +66,8 @@ EXAMPLE = """
 
 
 """
+
+
 DOCUMENTATION = """
 ---
 module:ietf-routing_config
@@ -223,211 +224,6 @@ options:
 """
 
 
-xml_head = """<config>"""
-
-xml_tail = """</config>"""
-
-# Keyword list
-key_list = [
-    '/routing/control-plane-protocols/control-plane-protocol/type',
-    '/routing/control-plane-protocols/control-plane-protocol/name',
-    '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/afi-safi-name',
-    '/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/remote-address']
-
-namespaces = [{'/routing': ['',
-                            '@xmlns="urn:ietf:params:xml:ns:yang:ietf-routing"',
-                            '/routing']},
-              {'/routing/control-plane-protocols': ['',
-                                                    '',
-                                                    '/routing/control-plane-protocols']},
-              {'/routing/control-plane-protocols/control-plane-protocol': ['',
-                                                                           '',
-                                                                           '/routing/control-plane-protocols/control-plane-protocol']},
-              {'/routing/control-plane-protocols/control-plane-protocol/type': ['bgp:bgp',
-                                                                                '@xmlns:bgp="urn:ietf:params:xml:ns:yang:ietf-bgp"',
-                                                                                '/routing/control-plane-protocols/control-plane-protocol/type']},
-              {'/routing/control-plane-protocols/control-plane-protocol/name': ['bgp200',
-                                                                                '',
-                                                                                '/routing/control-plane-protocols/control-plane-protocol/name']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp': ['',
-                                                                               '@xmlns="urn:ietf:params:xml:ns:yang:ietf-bgp"',
-                                                                               '/routing/control-plane-protocols/control-plane-protocol/bgp']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/global': ['',
-                                                                                      '',
-                                                                                      '/routing/control-plane-protocols/control-plane-protocol/bgp/global']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors': ['',
-                                                                                         '',
-                                                                                         '/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/as': ['200',
-                                                                                         '',
-                                                                                         '/routing/control-plane-protocols/control-plane-protocol/bgp/global/as']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis': ['',
-                                                                                                '',
-                                                                                                '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor': ['',
-                                                                                                  '',
-                                                                                                  '/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi': ['',
-                                                                                                         '',
-                                                                                                         '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/remote-address': ['192.0.2.1',
-                                                                                                                 '',
-                                                                                                                 '/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/remote-address']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/enabled': ['true',
-                                                                                                          '',
-                                                                                                          '/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/enabled']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/remote-as': ['65550',
-                                                                                                            '',
-                                                                                                            '/routing/control-plane-protocols/control-plane-protocol/bgp/neighbors/neighbor/remote-as']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/afi-safi-name': ['bt:ipv4-unicast',
-                                                                                                                       '@xmlns:bt="urn:ietf:params:xml:ns:yang:ietf-bgp-types"',
-                                                                                                                       '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/afi-safi-name']},
-              {'/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/enabled': ['true',
-                                                                                                                 '',
-                                                                                                                 '/routing/control-plane-protocols/control-plane-protocol/bgp/global/afi-safis/afi-safi/enabled']}]
-
-business_tag = ['routing']
-
-# Passed to the ansible parameter
-argument_spec = OrderedDict([('routing',
-                              {'type': 'dict',
-                               'options': OrderedDict([('control-plane-protocols',
-                                                        {'type': 'list',
-                                                         'elements': 'dict',
-                                                         'options': OrderedDict([('control-plane-protocol',
-                                                                                  {'type': 'dict',
-                                                                                   'options': OrderedDict([('type',
-                                                                                                            {'type': 'str',
-                                                                                                             'required': False}),
-                                                                                                           ('name',
-                                                                                                            {'type': 'str',
-                                                                                                             'required': False}),
-                                                                                                           ('bgp',
-                                                                                                            {'type': 'dict',
-                                                                                                             'options': OrderedDict([('global',
-                                                                                                                                      {'type': 'dict',
-                                                                                                                                       'options': OrderedDict([('as',
-                                                                                                                                                                {'type': 'int',
-                                                                                                                                                                 'required': False}),
-                                                                                                                                                               ('afi-safis',
-                                                                                                                                                                {'type': 'list',
-                                                                                                                                                                 'elements': 'dict',
-                                                                                                                                                                 'options': OrderedDict([('afi-safi',
-                                                                                                                                                                                          {'type': 'dict',
-                                                                                                                                                                                           'options': OrderedDict([('afi-safi-name',
-                                                                                                                                                                                                                    {'type': 'str',
-                                                                                                                                                                                                                     'required': False}),
-                                                                                                                                                                                                                   ('enabled',
-                                                                                                                                                                                                                    {'type': 'bool',
-                                                                                                                                                                                                                     'required': False})])})])})])}),
-                                                                                                                                     ('neighbors',
-                                                                                                                                      {'type': 'list',
-                                                                                                                                       'elements': 'dict',
-                                                                                                                                       'options': OrderedDict([('neighbor',
-                                                                                                                                                                {'type': 'dict',
-                                                                                                                                                                 'options': OrderedDict([('remote-address',
-                                                                                                                                                                                          {'type': 'str',
-                                                                                                                                                                                           'required': False}),
-                                                                                                                                                                                         ('enabled',
-                                                                                                                                                                                          {'type': 'bool',
-                                                                                                                                                                                           'required': False}),
-                                                                                                                                                                                         ('remote-as',
-                                                                                                                                                                                          {'type': 'int',
-                                                                                                                                                                                           'required': False})])})])})])})])})])})])})])
-
-# Operation type
-operation_dict = {
-    'operation_type': {
-        'type': 'str',
-        'required': True,
-        'choices': [
-            'config',
-            'get',
-            'get-config',
-            'rpc']},
-    'operation_specs': {
-        'elements': 'dict',
-        'type': 'list',
-                'options': {
-                    'path': {
-                        'type': 'str'},
-                    'operation': {
-                        'choices': [
-                            'merge',
-                            'replace',
-                            'create',
-                            'delete',
-                            'remove'],
-                        'default': 'merge'}}}}
-
-# Parameters passed to check params
-leaf_info = OrderedDict([('routing',
-                          OrderedDict([('control-plane-protocols',
-                                        OrderedDict([('control-plane-protocol',
-                                                      OrderedDict([('type',
-                                                                    {'default': None,
-                                                                     'key': True,
-                                                                     'length': [],
-                                                                        'pattern': [],
-                                                                        'type': 'string',
-                                                                        'required': False}),
-                                                                   ('name',
-                                                                    {'default': None,
-                                                                     'key': True,
-                                                                     'length': [],
-                                                                     'pattern': [],
-                                                                     'type': 'string',
-                                                                     'required': False}),
-                                                                   ('bgp',
-                                                                    OrderedDict([('global',
-                                                                                  OrderedDict([('as',
-                                                                                                {'default': None,
-                                                                                                 'key': False,
-                                                                                                 'pattern': [],
-                                                                                                 'range': [(0,
-                                                                                                            4294967295)],
-                                                                                                 'type': 'int',
-                                                                                                 'required': False}),
-                                                                                               ('afi-safis',
-                                                                                                OrderedDict([('afi-safi',
-                                                                                                              OrderedDict([('afi-safi-name',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': True,
-                                                                                                                             'length': [],
-                                                                                                                             'pattern': [],
-                                                                                                                             'type': 'string',
-                                                                                                                             'required': False}),
-                                                                                                                           ('enabled',
-                                                                                                                            {'default': None,
-                                                                                                                             'key': False,
-                                                                                                                             'type': 'boolean',
-                                                                                                                             'pattern': [],
-                                                                                                                             'required': False})]))]))])),
-                                                                                 ('neighbors',
-                                                                                  OrderedDict([('neighbor',
-                                                                                                OrderedDict([('remote-address',
-                                                                                                              {'default': None,
-                                                                                                               'key': True,
-                                                                                                               'length': [],
-                                                                                                               'pattern': [],
-                                                                                                               'type': 'string',
-                                                                                                               'required': False}),
-                                                                                                             ('enabled',
-                                                                                                              {'default': None,
-                                                                                                               'key': False,
-                                                                                                               'type': 'boolean',
-                                                                                                               'pattern': [],
-                                                                                                               'required': False}),
-                                                                                                             ('remote-as',
-                                                                                                              {'default': None,
-                                                                                                               'key': False,
-                                                                                                               'pattern': [],
-                                                                                                               'range': [(0,
-                                                                                                                          4294967295)],
-                                                                                                               'type': 'int',
-                                                                                                               'required': False})]))]))]))]))]))]))])
-
-
 # User check params
 class UserCheck(object):
     def __init__(self, params, infos):
@@ -446,62 +242,9 @@ class UserCheck(object):
         return 1
 
 
-# Call the ConfigBase base class
-def config_base(config_args):
-    class_object = ConfigBase(*config_args)
-    class_object.run()
-
-
-# Call the GetBase base class
-def get_base(get_args):
-    class_object = GetBase(*get_args)
-    class_object.run()
-
-
-def input_base(input_args):
-    class_object = InputBase(*input_args)
-    class_object.run()
-
-
-# According to the type of message
-def operation(operation_type, args):
-    if operation_type == 'config':
-        config_base(args)
-    elif operation_type == 'get' or operation_type == 'get-config':
-        get_base(args)
-    else:
-        input_base(args)
-
-
-def filter_check(user_check_obj):
-    return (
-        list(
-            filter(
-                lambda m: m.startswith("check_"), [
-                    i + '()' for i in dir(user_check_obj)])))
-
-
 def main():
     """Module main"""
-    argument_spec.update(ne_argument_spec)
-    argument_spec.update(operation_dict)
-    args = (
-        argument_spec,
-        leaf_info,
-        namespaces,
-        business_tag,
-        xml_head,
-        xml_tail,
-        key_list)
-    module_params = ConfigBase(*args).get_operation_type()
-    for check_func in filter_check(UserCheck):
-        if not eval('UserCheck(module_params, leaf_info).' + check_func):
-            ConfigBase(
-                *
-                args).init_module().fail_json(
-                msg='UserCheck.' +
-                check_func)
-    operation(module_params['operation_type'], args)
+    run_module(load_schema(schema_artifact).args(), UserCheck)
 
 
 if __name__ == '__main__':
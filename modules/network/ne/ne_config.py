@@ -63,8 +63,15 @@ options:
         - This argument will cause the module to download all backups in remote device 
         to the local path of "local_file_path"
         If the directory does not exist, it will be created.
+        The files whose size and modification time did not change since the previous
+        backup_all into the same path are not downloaded again.
     required: false
     default: false
+  backup_channels:
+    description:
+        - The number of files downloaded at once by backup_all, each over its own sftp channel.
+    required: false
+    default: 4
   transfer:
     description:
         - This argument will send a config configurations file to the remote device. 
@@ -72,6 +79,19 @@ options:
         Local flie must be exist
     required: false
     default: null
+  transfer_mode:
+    description:
+        - How C(transfer) uploads the local file. C(full) always uploads the whole file.
+          C(auto) skips the upload when the file of the device still has the size and
+          modification time it had after the previous upload from this control node and
+          the local file did not change since, otherwise uploads the whole file.
+          C(delta) also writes only the changed 64 KiB blocks of the local file into the file
+          of the device over sftp, falling back to the whole upload if the device does not
+          support it. Inserted or removed lines shift all the following blocks, so C(delta)
+          pays off for edits which keep the size of the file.
+    required: false
+    default: auto
+    choices: ['full', 'auto', 'delta']
   delete:
     description:
       - This argument will send a command to delete particular configuration files from the remote device
@@ -132,6 +152,25 @@ options:
       the value should be a value of second between 60 and 3600
     required: false
     default: null
+  config_cache_ttl:
+    description:
+      - The seconds the configuration searched by C(section) and C(contain) is reused from the
+        cache of the persistent connection, instead of being fetched from the device again.
+        Within a task, the configuration is fetched once for all the sections and contains.
+        The cache is dropped whenever the connection sends a command which may change the
+        configuration (merge, replace, rollback, lines, commit ...), but not on the changes
+        made by other sessions to the device (other users, controllers, the netconf connection
+        of other tasks). Only set it when nothing else changes the device. 0 disables the cache.
+    required: false
+    default: 0
+  cli_batch_size:
+    description:
+      - More than 1 sends the commands (e.g. C(lines)) in blocks of this size, every block written
+        at once instead of waiting for the prompt after every command, the output is split on the
+        prompts. A failed command is still reported by its position and text, but the commands
+        after it in its block have been sent too. Commands answering a prompt are sent one by one.
+    required: false
+    default: 1
 
 """
 
@@ -239,6 +278,12 @@ stdout_lines:
   type: list
   sample: [['...', '...'], ['...'], ['...']]
 
+backup_files:
+  description: the files of backup_all downloaded, and the ones left as they were since the previous backup_all
+  returned: when backup_all is set
+  type: dict
+  sample: {'fetched': ['vrpcfg.cfg'], 'unchanged': ['old.cfg']}
+
 failed_conditions:
   description: the conditionals that failed
   returned: failed
@@ -246,12 +291,15 @@ failed_conditions:
   sample: ['...', '...']
 """
 import os
-import time
-import paramiko
 import sys
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_text
 from ansible.module_utils.network.ne.ne import ne_argument_spec
-from ansible.module_utils.network.ne.ne import run_commands
+from ansible.module_utils.network.ne.ne import run_commands, get_config, get_plugin_connection, get_device_id
+from ansible.module_utils.network.ne.common_module.config_tree import ConfigTree
+from ansible.module_utils.network.ne.common_module.backup_store import BackupStore
+from ansible.module_utils.network.ne.common_module.file_delta import BLOCK_SIZE, block_hashes, changed_blocks, \
+    read_record, write_record
 from ansible.module_utils.network.common.utils import to_list
 from ansible.module_utils.six import string_types
 from ansible.module_utils.network.common.utils import ComplexList
@@ -263,12 +311,6 @@ else:
     reload(sys)
     sys.setdefaultencoding('utf-8')
 
-try:
-    from scp import SCPClient
-    HAS_SCP = True
-except ImportError:
-    HAS_SCP = False
-
 
 def to_lines(stdout):
     lines = list()
@@ -321,27 +363,37 @@ def delete_config(module):
     return responses
 
 
+def get_config_tree(module):
+    """The current configuration parsed into its sections, fetched once for all the searches
+    of the task, and reused by the next tasks for config_cache_ttl seconds if it is set"""
+    if not hasattr(module, '_ne_config_tree'):
+        module._ne_config_tree = ConfigTree(get_config(module))
+    return module._ne_config_tree
+
+
 def search_section(module):
     responses = list()
     sections = module.params['section']
+    config_tree = get_config_tree(module)
     for section in sections:
         search_cmd = "display current-configuration configuration " + section
         command = dict()
         command['command'] = search_cmd
-        response = run_commands(module, to_list(command))
-        responses.append(response)
+        response = config_tree.section(section)
+        responses.append([command, response])
     return responses
 
 
 def search_contain(module):
     responses = list()
     contains = module.params['contain']
+    config_tree = get_config_tree(module)
     for contain in contains:
-        search_cmd = "display current-configuration  | include " + contain
+        search_cmd = "display current-configuration | include " + contain
         command = dict()
         command['command'] = search_cmd
-        response = run_commands(module, to_list(command))
-        responses.append(response)
+        response = config_tree.contain(contain)
+        responses.append([command, response])
     return responses
 
 
@@ -433,6 +485,7 @@ class FileOperation(object):
         # state
         self.transfer_result = None
         self.changed = False
+        self.backup_files = None
 
     def init_module(self):
         """Init module"""
@@ -451,56 +504,33 @@ class FileOperation(object):
         return os.path.isdir(self.local_file_path)
 
     def transfer_file(self, dest):
-        """Begin to transfer file by scp"""
+        """Begin to transfer file by scp, over the file session of the persistent connection"""
 
         if not self.local_file_exists():
             self.module.fail_json(
                 msg='Could not transfer file. Local file doesn\'t exist.')
 
-        hostname = self.module.params['provider']['host']
-        username = self.module.params['provider']['username']
-        password = self.module.params['provider']['password']
-        port = self.module.params['provider']['port']
-
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=hostname, username=username, password=password, port=port)
         full_remote_path = '{}{}'.format(self.file_system, dest)
-        scp = SCPClient(ssh.get_transport())
         try:
-            scp.put(self.local_file, full_remote_path)
-        except:
-            time.sleep(10)
-            scp.close()
+            get_plugin_connection(self.module).copy_file(source=self.local_file, destination=full_remote_path,
+                                                         proto='scp')
+        except ConnectionError as exc:
             self.module.fail_json(msg='Could not transfer file. There was an error '
                                       'during transfer. Please make sure the format of '
-                                      'input parameters is right.')
-        scp.close()
+                                      'input parameters is right. %s' % to_text(exc))
         return True
 
     def download_file(self, dest):
-        """Begin to download file by scp"""
+        """Begin to download file by scp, over the file session of the persistent connection"""
 
-        hostname = self.module.params['provider']['host']
-        username = self.module.params['provider']['username']
-        password = self.module.params['provider']['password']
-        port = self.module.params['provider']['port']
-
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=hostname, username=username, password=password, port=port)
         full_remote_file = '{}{}'.format(self.file_system, "/" + dest)
-        scp = SCPClient(ssh.get_transport())
-
         try:
-            scp.get(full_remote_file, self.local_file_path + dest)
-        except:
-            time.sleep(10)
-            scp.close()
+            get_plugin_connection(self.module).get_file(source=full_remote_file, destination=self.local_file_path + dest,
+                                                        proto='scp')
+        except ConnectionError as exc:
             self.module.fail_json(msg='Could not transfer file. There was an error '
                                       'during transfer. Please make sure the format of '
-                                      'input parameters is right.')
-        scp.close()
+                                      'input parameters is right. %s' % to_text(exc))
         return True
 
     def send_cfg(self):
@@ -512,8 +542,45 @@ class FileOperation(object):
 
         dest = '/' + os.path.basename(self.local_file)
 
-        self.transfer_file(dest)
-        self.transfer_result = 'The local file has been successfully transferred to the device.'
+        if self.module.params['transfer_mode'] == 'full':
+            self.transfer_file(dest)
+            self.changed = True
+            self.transfer_result = 'The local file has been successfully transferred to the device.'
+            return
+
+        connection = get_plugin_connection(self.module)
+        device = get_device_id(self.module)
+        size = os.path.getsize(self.local_file)
+        blocks = block_hashes(self.local_file)
+        try:
+            remote = connection.stat_file(dest)
+        except ConnectionError as exc:
+            self.module.fail_json(msg='Could not transfer file. %s' % to_text(exc))
+        remote_blocks = read_record(device, dest, remote)
+        if remote_blocks == blocks and remote['size'] == size:
+            self.transfer_result = 'The device already has the content of the local file.'
+            return
+
+        remote = None
+        if remote_blocks is not None and self.module.params['transfer_mode'] == 'delta':
+            changed = changed_blocks(remote_blocks, blocks)
+            try:
+                remote = connection.patch_file(self.local_file, dest, changed, BLOCK_SIZE)
+                self.transfer_result = 'The %d changed blocks of the %d blocks of the local file have been ' \
+                                       'successfully transferred to the device.' % (len(changed), len(blocks))
+            except ConnectionError:
+                # the file system of the device may not support writing in place, upload it whole
+                remote = None
+        if remote is None or remote['size'] != size:
+            self.transfer_file(dest)
+            self.transfer_result = 'The local file has been successfully transferred to the device.'
+            try:
+                remote = connection.stat_file(dest)
+            except ConnectionError:
+                remote = None
+        self.changed = True
+        if remote is not None and remote['size'] == size:
+            write_record(device, dest, remote, blocks)
 
     def receive_cfg(self):
         """Excute task """
@@ -526,19 +593,27 @@ class FileOperation(object):
     def backup_all(self):
         if not self.is_dir():
             os.makedirs(self.local_file_path)
-        hostname = self.module.params['provider']['host']
-        username = self.module.params['provider']['username']
-        password = self.module.params['provider']['password']
-        port = self.module.params['provider']['port']
-        client = paramiko.Transport((hostname, port))
-        client.connect(username=username, password=password)
-        sftp = paramiko.SFTPClient.from_transport(client)
-        files = sftp.listdir("/")
-        for file_name in files:
-            if ".cfg" in file_name:
-                sftp.get("/" + file_name, self.local_file_path + file_name)
-
-        client.close()
+        connection = get_plugin_connection(self.module)
+        store = BackupStore(self.local_file_path, get_device_id(self.module))
+        temp_paths = []
+        try:
+            remote_files = [remote_file for remote_file in connection.list_files("/") if ".cfg" in remote_file['name']]
+            changed_files = [remote_file for remote_file in remote_files if not store.unchanged(remote_file)]
+            temp_paths = [store.temp_path(remote_file['name']) for remote_file in changed_files]
+            connection.fetch_files([["/" + remote_file['name'], temp_path]
+                                    for remote_file, temp_path in zip(changed_files, temp_paths)],
+                                   channels=self.module.params['backup_channels'])
+        except ConnectionError as exc:
+            for temp_path in temp_paths:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            self.module.fail_json(msg='Could not download the backups. %s' % to_text(exc))
+        store.commit(zip(changed_files, temp_paths))
+
+        self.changed = bool(changed_files)
+        self.backup_files = dict(fetched=[remote_file['name'] for remote_file in changed_files],
+                                 unchanged=[remote_file['name'] for remote_file in remote_files
+                                            if remote_file not in changed_files])
         self.transfer_result = 'The local file has been successfully download to ansible server.'
 
 
@@ -547,6 +622,7 @@ def main():
     """
     argument_spec = dict(
         transfer=dict(type='path'),
+        transfer_mode=dict(default='auto', choices=['full', 'auto', 'delta']),
         delete=dict(type='list'),
         section=dict(type='list'),
         contain=dict(type='list'),
@@ -554,12 +630,15 @@ def main():
         # config operations
         backup=dict(type='str'),
         backup_all=dict(type='bool', default=False),
+        backup_channels=dict(type='int', default=4),
         rollback_type=dict(default='file', choices=['file', 'commit-id', 'label', 'last']),
         rollback=dict(type='str'),
         merge=dict(type='str'),
         lines=dict(type='list'),
         commit=dict(type='bool', default=False),
         trial=dict(type='str'),
+        config_cache_ttl=dict(type='int'),
+        cli_batch_size=dict(type='int', default=1),
         local_file=dict(type='path'),
         local_file_path=dict(type='path')
     )
@@ -585,6 +664,7 @@ def main():
     if module.params['backup_all']:
         file_operation_obj = FileOperation(argument_spec)
         file_operation_obj.backup_all()
+        result['backup_files'] = file_operation_obj.backup_files
 
     if module.params['section']:
         result_search_section = search_section(module)
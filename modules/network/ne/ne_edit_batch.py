@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = """
+---
+
+module: ne_edit_batch
+version_added: "2.9"
+short_description: Apply the configs staged by several modules as one edit-config.
+description:
+  - The generated config modules (ietf_bgp, ietf_isis, ietf_srv6 ...) stage their config
+    in a batch of the device instead of sending it when their C(edit_batch) is set.
+    This module merges the staged configs into one namespace correct edit-config,
+    translates and applies it once, reads the end state once and splits the results
+    back out per module. The batch is dropped after the edit, whether it succeeds or not.
+    This module works with the netconf connection.
+    In check mode the staged configs are merged but not sent, and the batch is dropped.
+options:
+  name:
+    description:
+      - The name of the batch, the C(edit_batch) of the staging modules.
+    required: false
+    default: default
+  state:
+    description:
+      - C(applied) applies the batch, C(discarded) drops it without any edit.
+      - C(confirmed) sends a plain commit, which confirms the pending confirmed commit of a previous
+        task ( with C(persist_id) if it was made persistent ). The batch is left as it is.
+    required: false
+    default: applied
+    choices: ['applied', 'discarded', 'confirmed']
+  merge:
+    description:
+      - Merge the staged configs into one edit-config. Otherwise they are sent one by one
+        in the staged order, e.g. when they conflict, which is atomic with the candidate datastore only.
+    required: false
+    type: bool
+    default: true
+  datastore:
+    description:
+      - C(candidate) locks the candidate, sends the edits into it, commits them once and unlocks it.
+    required: false
+    default: running
+    choices: ['running', 'candidate']
+  confirm_timeout:
+    description:
+      - Seconds after which the device reverts the commit unless another commit confirms it.
+        Only with the candidate datastore.
+    required: false
+    type: int
+  persist:
+    description:
+      - The token making the confirmed commit persistent, it then survives the end of the session
+        and is confirmed by a commit with this C(persist_id). Only with C(confirm_timeout).
+    required: false
+    type: str
+  persist_id:
+    description:
+      - The token of the persistent confirmed commit which this commit confirms.
+    required: false
+    type: str
+"""
+
+EXAMPLES = """
+- name: service rollout
+  hosts: ne_test
+  connection: netconf
+  gather_facts: no
+
+  tasks:
+  - name: stage the SRv6 locators
+    ietf_srv6:
+      operation_type: config
+      edit_batch: rollout
+      routing:
+        srv6:
+          enable: true
+
+  - name: stage the ISIS instance
+    ietf_isis:
+      operation_type: config
+      edit_batch: rollout
+      routing:
+        control-plane-protocols:
+          - control-plane-protocol:
+              type: isis
+              name: "1"
+
+  - name: apply both with one edit-config
+    ne_edit_batch:
+      name: rollout
+      datastore: candidate
+      confirm_timeout: 300
+
+  - name: confirm the commit once the services are checked
+    ne_edit_batch:
+      state: confirmed
+"""
+
+RETURN = """
+edits:
+  description: the number of the staged edits applied
+  returned: always
+  type: int
+  sample: 2
+results:
+  description: the result of every staged module, in the staged order
+  returned: always
+  type: list
+  sample: [{'module': 'ietf_srv6', 'changed': true, 'proposed': {}, 'existing': {}, 'end_state': {}, 'updates': []}]
+"""
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.network.ne.ne import ne_argument_spec, confirm_commit
+from ansible.module_utils.network.ne.common_module.edit_batch import EditBatch
+
+
+def main():
+    """entry point for module execution
+    """
+    argument_spec = dict(
+        name=dict(type='str', default='default'),
+        state=dict(default='applied', choices=['applied', 'discarded', 'confirmed']),
+        merge=dict(type='bool', default=True),
+        datastore=dict(default='running', choices=['running', 'candidate']),
+        confirm_timeout=dict(type='int'),
+        persist=dict(type='str'),
+        persist_id=dict(type='str')
+    )
+
+    argument_spec.update(ne_argument_spec)
+
+    module = AnsibleModule(argument_spec=argument_spec,
+                           supports_check_mode=True)
+    batch = EditBatch(module, module.params['name'])
+    if module.params['state'] == 'discarded':
+        discarded = batch.discard()
+        module.exit_json(changed=False, edits=discarded, results=[])
+    if module.params['state'] == 'confirmed':
+        if not module.check_mode:
+            confirm_commit(module, module.params['persist_id'])
+        module.exit_json(changed=True, edits=0, results=[])
+    module.exit_json(**batch.apply())
+
+
+if __name__ == '__main__':
+    main()
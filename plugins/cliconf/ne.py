@@ -19,18 +19,53 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import os
 import re
 import json
+import time
+import errno
+import socket
+import threading
 
 from itertools import chain
 
+from ansible.errors import AnsibleConnectionFailure, AnsibleError
 from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.compat.paramiko import paramiko
 from ansible.module_utils.network.common.utils import to_list
+from ansible.module_utils.network.ne.common_module.config_cache import ConfigCache
 from ansible.plugins.cliconf import CliconfBase, enable_mode
 
+try:
+    from scp import SCPClient
+    HAS_SCP = True
+except ImportError:
+    HAS_SCP = False
+
+# The commands which only read, the others may change the configuration ( display and its abbreviations )
+DISPLAY_COMMAND_RE = re.compile(r'^\s*dis(?:p|pl|pla|play)?\s', re.I)
+
+# The socket errors after which a file transfer is retried on a new session, the others are final
+TRANSIENT_ERRNOS = frozenset([errno.ECONNRESET, errno.ECONNABORTED, errno.ECONNREFUSED, errno.EPIPE,
+                              errno.ETIMEDOUT, errno.EHOSTUNREACH, errno.ENETUNREACH])
+
+
+def is_transient(exc):
+    """Whether the file transfer failed because of the session, not of the files"""
+    if isinstance(exc, (EOFError, socket.timeout)) or (paramiko and isinstance(exc, paramiko.SSHException)):
+        return True
+    return isinstance(exc, (IOError, OSError)) and exc.errno in TRANSIENT_ERRNOS
+
 
 class Cliconf(CliconfBase):
 
+    def __init__(self, *args, **kwargs):
+        super(Cliconf, self).__init__(*args, **kwargs)
+        # The configurations fetched by get_config, kept for the next tasks
+        self._configs = ConfigCache()
+        # The ssh session of the file transfers, kept for the next tasks
+        self._file_ssh = None
+
     def get_device_info(self):
         device_info = dict()
 
@@ -53,23 +88,268 @@ class Cliconf(CliconfBase):
         return device_info
 
     @enable_mode
-    def get_config(self, source='running'):
+    def get_config(self, source='running', flags=None, ttl=None):
+        """display current-configuration
+           :flags: appended to the command, e.g. ['configuration', 'aaa']
+           :ttl: seconds the configuration fetched by a previous call is reused, None fetches it again"""
         if source != 'running':
             return self.invalid_params("fetching configuration from %s is not supported" % source)
-        cmd = 'display current-configuration'
-        return self.send_command(cmd)
+        cmd = ' '.join(['display current-configuration'] + to_list(flags))
+        key = self._configs.key(cmd)
+        config = self._configs.get(key, ttl)
+        if config is None:
+            config = to_text(self.send_command(cmd), errors='surrogate_or_strict')
+            if ttl:
+                self._configs.put(key, config)
+        return config
 
     @enable_mode
-    def edit_config(self, command):
-        for cmd in chain([b'configure terminal'], to_list(command), [b'end']):
+    def edit_config(self, command, batch_size=1):
+        """:batch_size: more than 1 sends the lines in blocks, see run_batch"""
+        self._configs.invalidate()
+        commands = list(chain([b'configure terminal'], to_list(command), [b'end']))
+        if batch_size > 1:
+            self.run_batch(commands, batch_size)
+            return
+        for cmd in commands:
             self.send_command(cmd)
 
     def get(self, command, prompt=None, answer=None, sendonly=False):
+        if not DISPLAY_COMMAND_RE.match(to_text(command, errors='surrogate_or_strict')):
+            self._configs.invalidate()
         return self.send_command(command, prompt=prompt, answer=answer, sendonly=sendonly)
 
+    def run_batch(self, commands, batch_size=16):
+        """Send the commands in blocks of batch_size, every block written at once, instead of
+           waiting for the prompt after every command
+           :commands: the commands, none of them may ask a question ( prompt / answer )
+           :return: the outputs of the commands, in their order
+           :raise AnsibleConnectionFailure: for the first command whose output matches terminal_stderr_re,
+                  the commands after it in its block have been sent too"""
+        commands = [to_text(command, errors='surrogate_or_strict') for command in to_list(commands)]
+        if not all(DISPLAY_COMMAND_RE.match(command) for command in commands):
+            self._configs.invalidate()
+        batch_size = max(int(batch_size), 1)
+        outputs = []
+        for start in range(0, len(commands), batch_size):
+            block = commands[start:start + batch_size]
+            for index, output in enumerate(self._send_block(block)):
+                if any(regex.search(to_bytes(output)) for regex in self._connection._terminal.terminal_stderr_re):
+                    raise AnsibleConnectionFailure(
+                        "Command %d of %d '%s' failed: %s%s"
+                        % (start + index + 1, len(commands), block[index], output,
+                           ' (sent in the same batch after it: %s)' % ', '.join(block[index + 1:])
+                           if block[index + 1:] else ''))
+                outputs.append(output)
+        return outputs
+
+    def _send_block(self, block):
+        """Write the commands at once and read until the prompt after the last one.
+
+        The output is split on the lines where the device echoes a command after
+        its prompt ( TerminalModule.terminal_stdout_re ), the first command is
+        echoed without prompt, which the previous command has already read.
+        :return: the outputs of the commands, without their echo and prompts
+        """
+        connection = self._connection
+        stdout_re = connection._terminal.terminal_stdout_re
+        shell = connection._ssh_shell
+        socket_timeout = shell.gettimeout()
+        shell.settimeout(connection.get_option('persistent_command_timeout'))
+        chunks = []
+        window = b''
+        try:
+            shell.sendall(b''.join(to_bytes(command, errors='surrogate_or_strict') + b'\r' for command in block))
+            while True:
+                data = shell.recv(4096)
+                if not data:
+                    raise AnsibleConnectionFailure('The connection was closed while reading the output of %s'
+                                                   % ', '.join(block))
+                chunks.append(data)
+                # the prompt after the last command ends the output, like network_cli.receive
+                window = connection._strip((window + data)[-256:])
+                if any(regex.search(window) for regex in stdout_re):
+                    outputs = self._split_block(connection._strip(b''.join(chunks)), block, stdout_re)
+                    if outputs is not None:
+                        return outputs
+        except socket.timeout:
+            raise AnsibleConnectionFailure('timeout value %s seconds reached while reading the output of %s'
+                                           % (shell.gettimeout(), ', '.join(block)))
+        finally:
+            shell.settimeout(socket_timeout)
+
+    @staticmethod
+    def _split_block(response, block, stdout_re):
+        """:return: the outputs of the commands of the block, None if the response is not complete yet"""
+        lines = response.rstrip().replace(b'\r', b'').split(b'\n')
+        outputs = []
+        current = []
+        index = 0
+        for line in lines[:-1]:
+            text = to_text(line, errors='surrogate_or_strict')
+            if not outputs and not current and text.strip() == block[0].strip():
+                continue
+            if index + 1 < len(block) and text.rstrip().endswith(block[index + 1].strip()):
+                prefix = line.rstrip()[:-len(to_bytes(block[index + 1].strip()))]
+                if any(regex.search(b'\n' + prefix) for regex in stdout_re):
+                    outputs.append(u'\n'.join(current).strip())
+                    current = []
+                    index += 1
+                    continue
+            current.append(text)
+        if index + 1 < len(block):
+            return None
+        outputs.append(u'\n'.join(current).strip())
+        return outputs
+
+    def _file_session(self, renew=False):
+        """The ssh session of the file transfers, opened like the session of the cli on first use,
+        it serves the scp and sftp channels of all the transfers"""
+        transport = self._file_ssh.get_transport() if self._file_ssh is not None else None
+        if renew or transport is None or not transport.is_active():
+            if self._file_ssh is not None:
+                self._file_ssh.close()
+            self._file_ssh = self._connection.paramiko_conn._connect_uncached()
+        return self._file_ssh
+
+    def _transfer(self, action, description):
+        """
+        Run the action with the ssh session of the file transfers, retried on a new session with
+        the backoff of network_cli: network_cli_retries times, pausing 2, 4, 8 ... seconds
+        :param action: called with the ssh client
+        """
+        retries = self._connection.get_option('network_cli_retries')
+        max_pause = min(self._connection.get_option('persistent_connect_timeout'),
+                        self._connection.get_option('persistent_command_timeout'))
+        total_pause = 0
+        for attempt in range(retries + 1):
+            try:
+                return action(self._file_session(renew=attempt > 0))
+            except Exception as exc:
+                pause = 2 ** (attempt + 1)
+                if not is_transient(exc) or attempt == retries or total_pause >= max_pause:
+                    raise AnsibleConnectionFailure('%s failed: %s' % (description, to_text(exc, errors='surrogate_or_strict')))
+                self._connection.queue_message('vv', u'%s: attempt: %d, caught exception(%s), pausing for %d seconds'
+                                               % (description, attempt + 1, to_text(exc), pause))
+                time.sleep(pause)
+                total_pause += pause
+
+    def copy_file(self, source=None, destination=None, proto='scp', timeout=30):
+        """Copy the file to the device over the ssh session of the file transfers"""
+        if proto == 'scp' and not HAS_SCP:
+            raise AnsibleError("Required library scp is not installed.  Please install it using `pip install scp`")
+
+        def put(ssh):
+            if proto == 'scp':
+                with SCPClient(ssh.get_transport(), socket_timeout=timeout) as scp:
+                    scp.put(source, destination)
+            else:
+                with ssh.open_sftp() as sftp:
+                    sftp.put(source, destination)
+
+        self._transfer(put, 'Copying %s to %s' % (source, destination))
+
+    def get_file(self, source=None, destination=None, proto='scp', timeout=30):
+        """Fetch the file from the device over the ssh session of the file transfers"""
+        if proto == 'scp' and not HAS_SCP:
+            raise AnsibleError("Required library scp is not installed.  Please install it using `pip install scp`")
+
+        def get(ssh):
+            if proto == 'scp':
+                with SCPClient(ssh.get_transport(), socket_timeout=timeout) as scp:
+                    scp.get(source, destination)
+            else:
+                with ssh.open_sftp() as sftp:
+                    sftp.get(source, destination)
+
+        self._transfer(get, 'Fetching %s to %s' % (source, destination))
+
+    def fetch_files(self, transfers, channels=4):
+        """Fetch the files over sftp, on up to channels sftp channels of the file session at once
+           :transfers: [ [ source, destination ] ], the destinations are written as they are received
+           :channels: the number of files fetched at once"""
+        pending = [tuple(transfer) for transfer in transfers]
+        lock = threading.Lock()
+
+        def fetch(ssh):
+            errors = []
+            queue = list(pending)
+
+            def worker(sftp):
+                try:
+                    while not errors:
+                        with lock:
+                            if not queue:
+                                return
+                            transfer = queue.pop(0)
+                        sftp.get(*transfer)
+                        with lock:
+                            pending.remove(transfer)
+                except Exception as exc:
+                    errors.append(exc)
+                finally:
+                    sftp.close()
+
+            threads = [threading.Thread(target=worker, args=(ssh.open_sftp(),))
+                       for _ in range(max(1, min(int(channels), len(queue))))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise errors[0]
+
+        # a retry only fetches the files which were not fetched yet
+        self._transfer(fetch, 'Fetching %d files' % len(pending))
+
+    def stat_file(self, path):
+        """The attributes of the file of the device, over sftp
+           :return: { 'size': bytes, 'mtime': seconds }, None if the file does not exist"""
+        def stat(ssh):
+            with ssh.open_sftp() as sftp:
+                try:
+                    attr = sftp.stat(path)
+                except IOError as exc:
+                    if exc.errno == errno.ENOENT:
+                        return None
+                    raise
+                return {'size': attr.st_size, 'mtime': attr.st_mtime}
+
+        return self._transfer(stat, 'Reading the attributes of %s' % path)
+
+    def patch_file(self, source, destination, blocks, block_size):
+        """Write blocks of the local file into the file of the device in place, over sftp,
+           then cut the file of the device to the size of the local file
+           :blocks: the indexes of the blocks to write
+           :return: stat_file of the destination"""
+        def patch(ssh):
+            with ssh.open_sftp() as sftp:
+                with open(source, 'rb') as local_file:
+                    with sftp.open(destination, 'r+') as remote_file:
+                        for index in blocks:
+                            local_file.seek(index * block_size)
+                            remote_file.seek(index * block_size)
+                            remote_file.write(local_file.read(block_size))
+                sftp.truncate(destination, os.path.getsize(source))
+                attr = sftp.stat(destination)
+                return {'size': attr.st_size, 'mtime': attr.st_mtime}
+
+        return self._transfer(patch, 'Patching %s with %s' % (destination, source))
+
+    def list_files(self, path='/'):
+        """The files of the directory of the device, over sftp
+           :return: [ { 'name': name, 'size': bytes, 'mtime': seconds } ]"""
+        def listdir(ssh):
+            with ssh.open_sftp() as sftp:
+                return [{'name': attr.filename, 'size': attr.st_size, 'mtime': attr.st_mtime}
+                        for attr in sftp.listdir_attr(path)]
+
+        return self._transfer(listdir, 'Listing %s' % path)
+
     def get_capabilities(self):
         result = {}
-        result['rpc'] = self.get_base_rpc()
+        result['rpc'] = self.get_base_rpc() + ['run_batch', 'copy_file', 'get_file', 'fetch_files',
+                                                'list_files', 'stat_file', 'patch_file']
         result['network_api'] = 'cliconf'
         result['device_info'] = self.get_device_info()
         return json.dumps(result)
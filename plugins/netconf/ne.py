@@ -38,23 +38,51 @@ options:
 
 import json
 import re
+import threading
+from collections import deque
+from functools import wraps
 
 from ansible import constants as C
 from ansible.module_utils._text import to_text, to_bytes
 from ansible.errors import AnsibleConnectionFailure, AnsibleError
+from ansible.module_utils.network.ne.common_module.config_cache import ConfigCache
 from ansible.plugins.netconf import NetconfBase, ensure_ncclient
 
 try:
     from ncclient import manager
     from ncclient.operations import RPCError
     from ncclient.transport.errors import SSHUnknownHostError
-    from ncclient.xml_ import to_ele, to_xml, new_ele, sub_ele
+    from ncclient.xml_ import to_ele, to_xml, new_ele, new_ele_ns, sub_ele, sub_ele_ns
 except ImportError:
     raise AnsibleError("ncclient is not installed")
 
 
+NMDA_NAMESPACE = 'urn:ietf:params:xml:ns:yang:ietf-netconf-nmda'
+DATASTORES_NAMESPACE = 'urn:ietf:params:xml:ns:yang:ietf-datastores'
+
+
+def invalidates_config(func):
+    """The rpc may change the configuration, the cached configurations are dropped whatever its result"""
+    @wraps(func)
+    def wrapped(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._configs.invalidate()
+    return wrapped
+
+
 class Netconf(NetconfBase):
 
+    def __init__(self, connection):
+        super(Netconf, self).__init__(connection)
+        # Edits staged by the modules until ne_edit_batch applies them, { batch name: [ edit ] }
+        self._edit_batches = {}
+        # The extra sessions to the device opened by get_parallel, kept for the next tasks
+        self._sessions = []
+        # The configurations fetched by get_config with a ttl, kept for the next tasks
+        self._configs = ConfigCache()
+
     @ensure_ncclient
     def get_text(self, ele, tag):
         try:
@@ -74,6 +102,7 @@ class Netconf(NetconfBase):
         return self.rpc(name)
 
     @ensure_ncclient
+    @invalidates_config
     def load_configuration(self, *args, **kwargs):
         """Loads given configuration on device
         :format: Format of configuration (xml, text, set)
@@ -90,10 +119,202 @@ class Netconf(NetconfBase):
         except RPCError as exc:
             raise Exception(to_xml(exc.xml))
 
+    @ensure_ncclient
+    def get_config(self, source=None, filter=None, with_defaults=None, ttl=None):
+        """get-config, with the with-defaults mode (RFC 6243) if given
+           :ttl: seconds the reply of a previous get-config of the same filter is reused, None sends it again"""
+        key = self._configs.key(source, filter, with_defaults)
+        config = self._configs.get(key, ttl)
+        if config is not None:
+            return config
+        if isinstance(filter, list):
+            filter = tuple(filter)
+        resp = self.m.get_config(source=source, filter=filter, with_defaults=with_defaults)
+        config = resp.data_xml if hasattr(resp, 'data_xml') else resp.xml
+        if ttl:
+            self._configs.put(key, config)
+        return config
+
+    @ensure_ncclient
+    @invalidates_config
+    def edit_config(self, *args, **kwargs):
+        return super(Netconf, self).edit_config(*args, **kwargs)
+
+    @ensure_ncclient
+    @invalidates_config
+    def copy_config(self, *args, **kwargs):
+        return super(Netconf, self).copy_config(*args, **kwargs)
+
+    @ensure_ncclient
+    @invalidates_config
+    def delete_config(self, *args, **kwargs):
+        return super(Netconf, self).delete_config(*args, **kwargs)
+
+    @ensure_ncclient
+    @invalidates_config
+    def dispatch(self, *args, **kwargs):
+        """The rpcs of the modules (e.g. rollbacks) are opaque, any of them may change the configuration"""
+        return super(Netconf, self).dispatch(*args, **kwargs)
+
+    @ensure_ncclient
+    def get_data(self, datastore='operational', filter=None, max_depth=None, with_defaults=None):
+        """get-data (RFC 8526), the NMDA retrieval which the server cuts at max_depth
+           :datastore: the name of the datastore, e.g. running, operational
+           :filter: a subtree or xpath <filter>, its content becomes the subtree-filter or the xpath-filter
+           :return: the <data> of the reply"""
+        node = new_ele_ns('get-data', NMDA_NAMESPACE, nsmap={None: NMDA_NAMESPACE, 'ds': DATASTORES_NAMESPACE})
+        sub_ele_ns(node, 'datastore', NMDA_NAMESPACE).text = 'ds:' + datastore
+        if filter is not None:
+            filter_node = to_ele(filter)
+            if filter_node.get('type') == 'xpath':
+                xpath_node = sub_ele_ns(node, 'xpath-filter', NMDA_NAMESPACE, nsmap=filter_node.nsmap)
+                xpath_node.text = filter_node.get('select')
+            else:
+                subtree_node = sub_ele_ns(node, 'subtree-filter', NMDA_NAMESPACE)
+                for child in list(filter_node):
+                    subtree_node.append(child)
+        if max_depth:
+            sub_ele_ns(node, 'max-depth', NMDA_NAMESPACE).text = str(max_depth)
+        if with_defaults:
+            sub_ele_ns(node, 'with-defaults', NMDA_NAMESPACE).text = with_defaults
+        try:
+            resp = self.m.dispatch(node)
+        except RPCError as exc:
+            raise Exception(to_xml(exc.xml))
+        data = to_ele(resp.xml).find('{%s}data' % NMDA_NAMESPACE)
+        return to_xml(data) if data is not None else '<data/>'
+
+    @ensure_ncclient
+    def get_parallel(self, filters, sessions=1, source=None, with_defaults=None):
+        """Send the get or get-config of every filter without waiting for the replies in between
+           :filters: the <filter> strs, selecting independent subtrees
+           :sessions: 1 pipelines the requests on the session of the connection, more spreads
+                      them over as many sessions to the device, the extra ones are kept open
+           :source: the datastore of get-config, None for get
+           :return: the <data> of the replies, in the order of the filters"""
+        managers = [self.m] + self._extra_sessions(min(sessions, len(filters)) - 1)
+        replies = [None] * len(filters)
+        errors = []
+
+        def pipeline(manager, indexes):
+            try:
+                for index, reply in zip(indexes, self._pipeline(manager, [filters[i] for i in indexes],
+                                                                source, with_defaults)):
+                    replies[index] = reply
+            except Exception as exc:
+                errors.append(exc)
+
+        groups = [list(range(len(filters)))[i::len(managers)] for i in range(len(managers))]
+        threads = [threading.Thread(target=pipeline, args=(manager, group))
+                   for manager, group in zip(managers[1:], groups[1:])]
+        for thread in threads:
+            thread.start()
+        pipeline(managers[0], groups[0])
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return replies
+
+    @staticmethod
+    def _pipeline(manager, filters, source, with_defaults):
+        """Send all the requests on the session in the ncclient async mode, then collect the replies"""
+        manager.async_mode = True
+        try:
+            if source:
+                requests = [manager.get_config(source=source, filter=f, with_defaults=with_defaults) for f in filters]
+            else:
+                requests = [manager.get(filter=f, with_defaults=with_defaults) for f in filters]
+        finally:
+            manager.async_mode = False
+        replies = []
+        for request in requests:
+            if not request.event.wait(manager.timeout):
+                raise Exception('No reply within %s seconds' % manager.timeout)
+            if request.error is not None:
+                raise request.error
+            if not request.reply.ok:
+                raise Exception(to_xml(request.reply.error.xml))
+            replies.append(request.reply.data_xml)
+        return replies
+
+    @ensure_ncclient
+    @invalidates_config
+    def dispatch_pipeline(self, rpc_commands, window=8):
+        """Dispatch the rpcs in the ncclient async mode, with at most window of them waiting for their replies
+           :rpc_commands: the rpc xml strs
+           :return: { 'ok': whether the rpc succeeded, 'xml': its rpc-reply } of the rpcs, in their order"""
+        replies = []
+        in_flight = deque()
+
+        def collect():
+            request = in_flight.popleft()
+            if not request.event.wait(self.m.timeout):
+                raise Exception('No reply within %s seconds' % self.m.timeout)
+            if request.error is not None:
+                raise request.error
+            replies.append({'ok': request.reply.ok, 'xml': request.reply.xml})
+
+        self.m.async_mode = True
+        try:
+            for rpc_command in rpc_commands:
+                if len(in_flight) >= max(window, 1):
+                    collect()
+                in_flight.append(self.m.dispatch(to_ele(rpc_command)))
+            while in_flight:
+                collect()
+        finally:
+            self.m.async_mode = False
+        return replies
+
+    def _extra_sessions(self, count):
+        """The extra sessions to the device, opened like the session of the connection"""
+        self._sessions = [session for session in self._sessions if session.connected]
+        connection = self._connection
+        try:
+            device_handler = self.get_option('ncclient_device_handler')
+        except KeyError:
+            device_handler = 'huaweiyang'
+        while len(self._sessions) < count:
+            session = manager.connect(
+                host=connection._play_context.remote_addr,
+                port=connection._play_context.port or 830,
+                username=connection._play_context.remote_user,
+                password=connection._play_context.password,
+                key_filename=connection.key_filename,
+                hostkey_verify=connection.get_option('host_key_checking'),
+                look_for_keys=connection.get_option('look_for_keys'),
+                device_params={'name': device_handler},
+                allow_agent=connection._play_context.allow_agent,
+                timeout=connection.get_option('persistent_connect_timeout'),
+                ssh_config=connection._ssh_config
+            )
+            session._timeout = connection.get_option('persistent_command_timeout')
+            self._sessions.append(session)
+        return self._sessions[:count]
+
+    def stage_edit(self, batch, edit):
+        """Keep the edit of a module in the named batch, this process outlives the module
+           :batch: the name of the batch
+           :edit: the staged config and schema fields of the module
+           :return: the number of edits in the batch"""
+        self._edit_batches.setdefault(batch, []).append(edit)
+        return len(self._edit_batches[batch])
+
+    def get_edit_batch(self, batch):
+        """The edits staged in the named batch, in the staged order"""
+        return self._edit_batches.get(batch, [])
+
+    def discard_edit_batch(self, batch):
+        """Drop the named batch, :return: the number of dropped edits"""
+        return len(self._edit_batches.pop(batch, []))
+
     def get_capabilities(self):
         result = dict()
         result['rpc'] = self.get_base_rpc() + ['commit', 'discard_changes', 'lock',
-                                               'unlock', 'execute_rpc', 'command', 'get', 'get_config', 'edit_config', 'copy_config']
+                                               'unlock', 'execute_rpc', 'command', 'get', 'get_config', 'edit_config', 'copy_config',
+                                               'get_data', 'get_parallel', 'dispatch_pipeline',
+                                               'stage_edit', 'get_edit_batch', 'discard_edit_batch']
         result['network_api'] = 'netconf'
         result['device_info'] = self.get_device_info()
         result['server_capabilities'] = [c for c in self.m.server_capabilities]
@@ -129,12 +350,9 @@ class Netconf(NetconfBase):
         m.close_session()
         return guessed_os
 
-    # Due to issue in ncclient commit() method for Juniper (https://github.com/ncclient/ncclient/issues/238)
-    # below commit() is a workaround which build's raw `commit-configuration` xml with required tags and uses
-    # ncclient generic rpc() method to execute rpc on remote host.
-    # Remove below method after the issue in ncclient is fixed.
     @ensure_ncclient
-    def commit(self, confirmed=False, check=False, timeout=None, comment=None, synchronize=False, at_time=None):
+    @invalidates_config
+    def commit(self, confirmed=False, timeout=None, persist=None, persist_id=None):
         """Commit the candidate configuration as the device's new current configuration.
            Depends on the `:candidate` capability.
            A confirmed commit (i.e. if *confirmed* is `True`) is reverted if there is no
@@ -144,21 +362,13 @@ class Netconf(NetconfBase):
            Depends on the `:confirmed-commit` capability.
         :confirmed: whether this is a confirmed commit
         :timeout: specifies the confirm timeout in seconds
+        :persist: make the confirmed commit survive a session termination, with this token
+        :persist_id: the token of the persistent confirmed commit to confirm
         """
-        obj = new_ele('commit-configuration')
-        if confirmed:
-            sub_ele(obj, 'confirmed')
-        if check:
-            sub_ele(obj, 'check')
-        if synchronize:
-            sub_ele(obj, 'synchronize')
-        if at_time:
-            subele = sub_ele(obj, 'at-time')
-            subele.text = str(at_time)
-        if comment:
-            subele = sub_ele(obj, 'log')
-            subele.text = str(comment)
-        if timeout:
-            subele = sub_ele(obj, 'confirm-timeout')
-            subele.text = str(timeout)
-        return self.rpc(obj)
+        try:
+            # ncclient puts the timeout into the <confirm-timeout> text as it is
+            timeout = str(timeout) if timeout is not None else None
+            resp = self.m.commit(confirmed=confirmed, timeout=timeout, persist=persist, persist_id=persist_id)
+            return resp.data_xml if hasattr(resp, 'data_xml') else resp.xml
+        except RPCError as exc:
+            raise Exception(to_xml(exc.xml))
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from ansible.module_utils.network.ne.common_module.checkparams import check_params
+
+# /routing/control-plane-protocols/control-plane-protocol, keys type and name
+LEAF_INFO = {
+    'routing': {
+        'control-plane-protocols': {
+            'control-plane-protocol': {
+                'type': {'type': 'string', 'key': True},
+                'name': {'type': 'string', 'key': True},
+                'description': {'type': 'string', 'mandatory': True},
+                'bgp': {
+                    'global': {
+                        'as': {'type': 'int', 'range': [[0, 4294967295]]},
+                    },
+                },
+            },
+        },
+    },
+}
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeModule(object):
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs['errors'])
+
+
+def protocols(*entries):
+    """The list params of the generated modules, every entry wrapped under the name of the entry"""
+    return {'routing': {'control-plane-protocols': [{'control-plane-protocol': entry} for entry in entries]}}
+
+
+def errors_of(params):
+    try:
+        check_params(LEAF_INFO, params, FakeModule())
+    except FailJson as exc:
+        return exc.args[0]
+    return []
+
+
+@pytest.mark.parametrize('operation_type', ['config', 'rpc'])
+def test_missing_key_of_list_entry(operation_type):
+    params = protocols({'type': None, 'name': None, 'bgp': {'global': {'as': 100}}})
+    params['operation_type'] = operation_type
+    errors = errors_of(params)
+    assert 'Error: /routing/control-plane-protocols/control-plane-protocol/type: the key is missing.' in errors
+    assert 'Error: /routing/control-plane-protocols/control-plane-protocol/name: the key is missing.' in errors
+
+
+def test_missing_key_of_unwrapped_list_entry():
+    params = {'operation_type': 'config',
+              'routing': {'control-plane-protocols': {'control-plane-protocol': [{'type': 'bgp'}]}}}
+    assert errors_of(params) == ['Error: /routing/control-plane-protocols/control-plane-protocol/name: '
+                                 'the key is missing.']
+
+
+def test_filter_needs_no_key():
+    params = protocols({'type': None, 'name': None})
+    params['operation_type'] = 'get'
+    assert errors_of(params) == []
+
+
+def test_merge_needs_no_mandatory_leaf():
+    params = protocols({'type': 'bgp', 'name': '1', 'bgp': {'global': {'as': 100}}})
+    params['operation_type'] = 'config'
+    assert errors_of(params) == []
+
+
+def test_create_needs_mandatory_leaf():
+    params = protocols({'type': 'bgp', 'name': '1'}, {'type': 'bgp', 'name': '2'})
+    params['operation_type'] = 'config'
+    params['operation_specs'] = [{'path': "/config/routing/control-plane-protocols/control-plane-protocol[name='2']",
+                                  'operation': 'create'}]
+    assert errors_of(params) == ['Error: /routing/control-plane-protocols/control-plane-protocol/description: '
+                                 'the mandatory leaf is missing.']
+
+
+def test_range():
+    params = protocols({'type': 'bgp', 'name': '1', 'bgp': {'global': {'as': -1}}})
+    params['operation_type'] = 'config'
+    assert len(errors_of(params)) == 1
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Convert generated modules which embed their schema as python literals into
+thin modules plus schema artifacts in module_utils/network/ne/schemas.
+
+    python tools/schema/convert_module.py modules/network/ne/ietf-105/ietf_srv6.py ...
+
+Existing artifacts are rewritten in the current format with --upgrade:
+
+    python tools/schema/convert_module.py --upgrade module_utils/network/ne/schemas/ietf_srv6.py ...
+"""
+import os
+import re
+import sys
+import ast
+import argparse
+import importlib.util
+from collections import OrderedDict
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+COMMON_MODULE_DIR = os.path.join(REPO_DIR, 'module_utils', 'network', 'ne', 'common_module')
+SCHEMAS_DIR = os.path.join(REPO_DIR, 'module_utils', 'network', 'ne', 'schemas')
+COMMON_MODULE_PACKAGE = 'ansible.module_utils.network.ne.common_module'
+
+# The module level names replaced by the schema artifact
+REMOVED_NAMES = {'operation_dict'}
+
+MODULE_IMPORTS = """from ansible.module_utils.network.ne.common_module.ne_base import run_module
+from ansible.module_utils.network.ne.common_module.schema import load_schema
+from ansible.module_utils.network.ne.schemas import {name} as schema_artifact
+"""
+
+MODULE_MAIN = '''def main():
+    """Module main"""
+    run_module(load_schema(schema_artifact).args(), UserCheck)
+
+
+if __name__ == '__main__':
+    main()
+'''
+
+
+def load_module_utils(name):
+    """Load a module of common_module which only needs the standard library, under its ansible name"""
+    full_name = COMMON_MODULE_PACKAGE + '.' + name
+    if full_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(full_name, os.path.join(COMMON_MODULE_DIR, name + '.py'))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[full_name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[full_name]
+
+
+def load_schema_module():
+    """schema.py and the two modules it imports"""
+    load_module_utils('checkparams')
+    load_module_utils('xml_build_with_xmlns')
+    return load_module_utils('schema')
+
+
+def schema_name(module_path):
+    """ietf-l3vpn-ntw_config.py ---> ietf_l3vpn_ntw_config"""
+    name = os.path.basename(module_path)[:-len('.py')]
+    return re.sub(r'\W', '_', name).lower()
+
+
+def node_names(node):
+    """The module level names assigned by the node"""
+    if isinstance(node, ast.Assign):
+        return {target.id for target in node.targets if isinstance(target, ast.Name)}
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return {node.name}
+    return set()
+
+
+def convert(module_path, schema_module):
+    """
+    :param module_path: the generated module which embeds its schema
+    :param schema_module: the loaded schema.py
+    :return: (thin module source, artifact source)
+    """
+    with open(module_path) as f:
+        source = f.read()
+    lines = source.splitlines(True)
+    tree = ast.parse(source)
+
+    data = OrderedDict()
+    kept = []
+    # the comments before the first statement (license) are always kept
+    previous_end = 0
+    header = ''.join(lines[:tree.body[0].lineno - 1])
+    for node in tree.body:
+        names = node_names(node)
+        # the comment lines just before a statement belong to it
+        start = node.lineno - 1
+        while start > previous_end and lines[start - 1].lstrip().startswith('#'):
+            start -= 1
+        segment = ''.join(lines[start:node.end_lineno])
+        previous_end = node.end_lineno
+        if names & set(schema_module.SCHEMA_FIELDS):
+            data[names.pop()] = eval(compile(ast.Expression(node.value), module_path, 'eval'),
+                                     {'OrderedDict': OrderedDict})
+        elif isinstance(node, (ast.Import, ast.ImportFrom)) or names & REMOVED_NAMES or 'main' in names:
+            continue
+        elif isinstance(node, ast.If) and 'main()' in segment:
+            continue
+        else:
+            kept.append(segment.strip('\n'))
+
+    missing = set(schema_module.SCHEMA_FIELDS) - set(data)
+    if missing:
+        raise ValueError('%s does not define %s' % (module_path, ', '.join(sorted(missing))))
+    name = schema_name(module_path)
+    module_source = header.rstrip('\n') + '\n\n' + MODULE_IMPORTS.format(name=name) + '\n' + \
+        '\n\n\n'.join(kept) + '\n\n\n' + MODULE_MAIN
+    artifact_source = schema_module.dump_schema(name, OrderedDict((field, data[field])
+                                                                  for field in schema_module.SCHEMA_FIELDS))
+    return module_source, artifact_source
+
+
+def upgrade(artifact_path, schema_module):
+    """
+    :param artifact_path: a schema artifact of any supported format
+    :return: the artifact source in the current format, the indexes are precomputed again
+    """
+    artifact = {}
+    with open(artifact_path) as f:
+        exec(compile(f.read(), artifact_path, 'exec'), artifact)
+    if artifact['SCHEMA_FORMAT'] not in schema_module.SUPPORTED_FORMATS:
+        raise ValueError('%s has the unsupported format %s' % (artifact_path, artifact['SCHEMA_FORMAT']))
+    return schema_module.dump_schema(artifact['SCHEMA_NAME'], schema_module.decode_schema(artifact['SCHEMA_DATA']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='+', help='the generated modules to convert')
+    parser.add_argument('--schemas-dir', default=SCHEMAS_DIR, help='where the schema artifacts are written')
+    parser.add_argument('--upgrade', action='store_true', help='the arguments are schema artifacts to upgrade')
+    args = parser.parse_args()
+
+    schema_module = load_schema_module()
+    if args.upgrade:
+        for artifact_path in args.modules:
+            artifact_source = upgrade(artifact_path, schema_module)
+            with open(artifact_path, 'w') as f:
+                f.write(artifact_source)
+            print('%s upgraded' % artifact_path)
+        return
+    for module_path in args.modules:
+        module_source, artifact_source = convert(module_path, schema_module)
+        artifact_path = os.path.join(args.schemas_dir, schema_name(module_path) + '.py')
+        with open(artifact_path, 'w') as f:
+            f.write(artifact_source)
+        with open(module_path, 'w') as f:
+            f.write(module_source)
+        print('%s -> %s' % (module_path, artifact_path))
+
+
+if __name__ == '__main__':
+    main()
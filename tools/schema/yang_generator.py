@@ -0,0 +1,621 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Generate a module and its schema artifact from YANG modules.
+
+    python tools/schema/yang_generator.py --name ietf_srv6 --top ietf-routing:routing \\
+        --include /routing/srv6 --output-dir modules/network/ne/ietf-105 \\
+        ietf-routing.yang ietf-srv6-base.yang ...
+
+Every YANG module the selected nodes use (imports, groupings, typedefs and
+augments) has to be given. The module is written to the output dir, its schema
+artifact to module_utils/network/ne/schemas, with the key, namespace, validation
+and child order indexes precomputed, so no module has to compile them at run time.
+"""
+import os
+import sys
+import argparse
+import datetime
+from collections import OrderedDict
+
+from yang_parser import parse_file
+from convert_module import MODULE_IMPORTS, MODULE_MAIN, SCHEMAS_DIR, load_schema_module, schema_name
+
+# The value bounds of the yang integer types
+INT_RANGES = OrderedDict([
+    ('int8', (-2 ** 7, 2 ** 7 - 1)),
+    ('int16', (-2 ** 15, 2 ** 15 - 1)),
+    ('int32', (-2 ** 31, 2 ** 31 - 1)),
+    ('int64', (-2 ** 63, 2 ** 63 - 1)),
+    ('uint8', (0, 2 ** 8 - 1)),
+    ('uint16', (0, 2 ** 16 - 1)),
+    ('uint32', (0, 2 ** 32 - 1)),
+    ('uint64', (0, 2 ** 64 - 1)),
+])
+LENGTH_RANGE = (0, 2 ** 64 - 1)
+
+# The built-in types which are passed to the device as strings without restriction
+STRING_TYPES = frozenset(['string', 'binary', 'bits', 'decimal64', 'empty', 'identityref',
+                          'instance-identifier', 'leafref', 'union'])
+
+# The yang types of leaf_info and the matching types of argument_spec
+ARGUMENT_TYPES = {'int': 'int', 'string': 'str', 'boolean': 'bool'}
+
+DATA_KEYWORDS = frozenset(['container', 'list', 'leaf', 'leaf-list'])
+
+LICENSE_HEADER = """#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+
+ANSIBLE_METADATA = """ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+"""
+
+EXAMPLE_HEAD = """---
+- name: {name}
+  hosts: ne_test
+  connection: netconf
+  gather_facts: no
+  vars:
+    netconf:
+      host: "{{{{ inventory_hostname }}}}"
+      port: "{{{{ ansible_ssh_port }}}}"
+      username: "{{{{ ansible_user }}}}"
+      password: "{{{{ ansible_ssh_pass }}}}"
+      transport: netconf
+
+  tasks:
+
+  - name: {name}_config
+    {name}:
+      operation_type: config
+"""
+
+EXAMPLE_TAIL = """      provider: "{{ netconf }}"
+"""
+
+OPERATION_TYPE_DOCUMENTATION = """    operation_type:
+        description:
+            - This is a helper node, choose from config, get, get-config
+        type: str
+        required:True
+        choices: ["config","get","get-config"]
+"""
+
+WHEN_DOCUMENTATION = ('The configuration of this object takes effect only when certain conditions are met. '
+                      'For details, check the definition in the YANG model.')
+
+USER_CHECK = '''# User check params
+class UserCheck(object):
+    def __init__(self, params, infos):
+        #  user configuration get from AnsibleModule().params
+        self.params = params
+        # leaf infos from yang files
+        self.infos = infos
+
+    # user defined check method need startswith "check_"
+    # return 0 if not pass check logic, else 1
+    def check_leaf_restrict(self):
+        """
+            if leaf_1 configured, leaf2 shouble be configured
+            and range shouble be in [10, 20]
+        """
+        return 1
+'''
+
+
+class YangError(Exception):
+    pass
+
+
+def warn(stmt, msg):
+    sys.stderr.write('%s:%d: warning: %s\n' % (stmt.filename, stmt.lineno, msg))
+
+
+def split_name(qname):
+    """'prefix:name' ---> ('prefix', 'name'), 'name' ---> (None, 'name')"""
+    prefix, _, name = qname.rpartition(':')
+    return prefix or None, name
+
+
+def parse_ranges(text, bounds):
+    """'1..10 | 20..max' ---> [(1, 10), (20, max)], min and max are taken from bounds"""
+    ranges = []
+    for part in text.split('|'):
+        low, _, high = part.strip().partition('..')
+        values = []
+        for value in (low, high or low):
+            value = value.strip()
+            values.append(bounds[0] if value == 'min' else bounds[1] if value == 'max' else int(value))
+        ranges.append(tuple(values))
+    return ranges
+
+
+class LeafType(object):
+    """The resolved type of a leaf, with the restrictions of its whole typedef chain"""
+
+    def __init__(self, base, ranges=None, choices=None):
+        self.base = base
+        self.range = ranges or []
+        self.length = []
+        self.patterns = []
+        self.choices = choices or []
+        self.default = None
+
+    def copy(self):
+        leaf_type = LeafType(self.base, list(self.range), list(self.choices))
+        leaf_type.length = list(self.length)
+        leaf_type.patterns = list(self.patterns)
+        leaf_type.default = self.default
+        return leaf_type
+
+
+class SchemaNode(object):
+    """A data node of the resolved schema tree, choices and cases are flattened"""
+
+    def __init__(self, keyword, name, module_name, stmt):
+        self.keyword = keyword
+        self.name = name
+        self.module_name = module_name
+        self.stmt = stmt
+        self.parent = None
+        self.path = ''
+        self.children = OrderedDict()
+        # the names of the flattened choices and cases, which augment paths may go through
+        self.transparent = set()
+        self.keys = []
+        self.key = False
+        self.type = None
+        self.config = True
+        self.mandatory = False
+        self.when = False
+        self.default = None
+        self.description = ''
+
+    def add(self, node):
+        node.parent = self
+        node.path = self.path + '/' + node.name
+        self.children[node.name] = node
+
+    def child(self, name):
+        if name in self.children:
+            return self.children[name]
+        return self if name in self.transparent else None
+
+    def descendant(self, path):
+        """'a:x/b:y' ---> the node, None if it does not exist (yet)"""
+        node = self
+        for segment in path.strip('/').split('/'):
+            node = node.child(split_name(segment)[1])
+            if node is None:
+                return None
+        return node
+
+    @property
+    def has_list(self):
+        return any(child.keyword == 'list' for child in self.children.values())
+
+
+class YangSchema(object):
+    """The data tree of a set of YANG modules, with groupings, typedefs and augments resolved"""
+
+    def __init__(self, statements, include_state=False):
+        self.include_state = include_state
+        self.modules = OrderedDict()
+        self.submodules = {}
+        for stmt in statements:
+            if stmt.keyword == 'module':
+                self.modules[stmt.arg] = stmt
+            else:
+                self.submodules[stmt.arg] = stmt
+        self.root = SchemaNode('root', '', None, None)
+        augments = []
+        for module_name, module in self.modules.items():
+            for top in self.tops(module_name):
+                self.build_children(self.root, top.substmts, module_name, True)
+                augments.extend((module_name, augment) for augment in top.find_all('augment'))
+        # augments may target the nodes added by other augments
+        while augments:
+            pending = [item for item in augments if not self.apply_augment(*item)]
+            if len(pending) == len(augments):
+                for module_name, augment in pending:
+                    warn(augment, 'the augment target %s is not found, it is ignored' % augment.arg)
+                break
+            augments = pending
+
+    def module_name(self, stmt):
+        """The name of the module the statement belongs to"""
+        top = stmt.top
+        if top.keyword == 'submodule':
+            return top.find_arg('belongs-to')
+        return top.arg
+
+    def tops(self, module_name):
+        """The module statement and the submodule statements of the module"""
+        tops = [self.modules[module_name]]
+        for submodule in self.submodules.values():
+            if submodule.find_arg('belongs-to') == module_name:
+                tops.append(submodule)
+        return tops
+
+    def prefix_module(self, stmt, prefix):
+        """The name of the module the prefix refers to, in the scope of the statement"""
+        top = stmt.top
+        own = top.find('belongs-to') if top.keyword == 'submodule' else top
+        if prefix is None or own.find_arg('prefix') == prefix:
+            return self.module_name(stmt)
+        for imported in top.find_all('import'):
+            if imported.find_arg('prefix') == prefix:
+                return imported.arg
+        raise YangError('%s:%d: unknown prefix %s' % (stmt.filename, stmt.lineno, prefix))
+
+    def find_definition(self, stmt, keyword, qname):
+        """Find the grouping or typedef, in the lexical scope first, then at the top of its module"""
+        prefix, name = split_name(qname)
+        module_name = self.prefix_module(stmt, prefix)
+        if module_name == self.module_name(stmt):
+            scope = stmt.parent
+            while scope is not None:
+                for definition in scope.find_all(keyword):
+                    if definition.arg == name:
+                        return definition
+                scope = scope.parent
+        if module_name not in self.modules:
+            raise YangError('%s:%d: the module %s of %s is not given' % (stmt.filename, stmt.lineno, module_name, qname))
+        for top in self.tops(module_name):
+            for definition in top.find_all(keyword):
+                if definition.arg == name:
+                    return definition
+        return None
+
+    def build_children(self, parent, stmts, module_name, config):
+        for stmt in stmts:
+            keyword = stmt.keyword
+            if keyword in DATA_KEYWORDS:
+                self.build_node(parent, stmt, module_name, config)
+            elif keyword in ('choice', 'case'):
+                parent.transparent.add(stmt.arg)
+                self.build_children(parent, stmt.substmts, module_name, config)
+            elif keyword == 'uses':
+                grouping = self.find_definition(stmt, 'grouping', stmt.arg)
+                if grouping is None:
+                    raise YangError('%s:%d: grouping %s is not found' % (stmt.filename, stmt.lineno, stmt.arg))
+                self.build_children(parent, grouping.substmts, module_name, config)
+                for augment in stmt.find_all('augment'):
+                    target = parent.descendant(augment.arg)
+                    if target is None:
+                        warn(augment, 'the augment target %s is not found, it is ignored' % augment.arg)
+                        continue
+                    self.build_children(target, augment.substmts, module_name, target.config)
+
+    def build_node(self, parent, stmt, module_name, config):
+        if stmt.keyword == 'leaf-list':
+            warn(stmt, 'leaf-list %s is not supported by the base classes, it is ignored' % stmt.arg)
+            return
+        config = config and stmt.find_arg('config', 'true') != 'false'
+        if not config and not self.include_state:
+            return
+        node = SchemaNode(stmt.keyword, stmt.arg, module_name, stmt)
+        node.config = config
+        node.description = stmt.find_arg('description', '')
+        node.when = stmt.find('when') is not None or stmt.parent.keyword in ('augment', 'case') and \
+            stmt.parent.find('when') is not None
+        parent.add(node)
+        if stmt.keyword == 'leaf':
+            node.type = self.resolve_type(stmt.find('type'))
+            node.mandatory = stmt.find_arg('mandatory') == 'true'
+            node.default = stmt.find_arg('default', node.type.default)
+            return
+        self.build_children(node, stmt.substmts, module_name, config)
+        if stmt.keyword == 'list':
+            node.keys = (stmt.find_arg('key') or '').split()
+            for key in node.keys:
+                if key in node.children:
+                    node.children[key].key = True
+
+    def apply_augment(self, module_name, augment):
+        """Add the augment nodes to its target, False if the target does not exist yet"""
+        target = self.root.descendant(augment.arg)
+        if target is None:
+            return False
+        self.build_children(target, augment.substmts, module_name, target.config)
+        return True
+
+    def resolve_type(self, type_stmt):
+        """
+        :param type_stmt: the type statement of a leaf or typedef
+        :return: the LeafType, the restrictions of the derived types narrow the ones of their base
+        """
+        prefix, name = split_name(type_stmt.arg)
+        if prefix is None and name in INT_RANGES:
+            leaf_type = LeafType('int', [INT_RANGES[name]])
+        elif prefix is None and name == 'boolean':
+            leaf_type = LeafType('boolean')
+        elif prefix is None and name == 'enumeration':
+            leaf_type = LeafType('enumeration', choices=[enum.arg for enum in type_stmt.find_all('enum')])
+        elif prefix is None and name in STRING_TYPES:
+            leaf_type = LeafType('string')
+            if name != 'string':
+                return leaf_type
+        else:
+            typedef = self.find_definition(type_stmt, 'typedef', type_stmt.arg)
+            if typedef is None:
+                warn(type_stmt, 'typedef %s is not found, it is handled as string' % type_stmt.arg)
+                return LeafType('string')
+            leaf_type = self.resolve_type(typedef.find('type')).copy()
+            leaf_type.default = typedef.find_arg('default', leaf_type.default)
+        if leaf_type.base == 'int' and type_stmt.find('range') is not None:
+            bounds = (min(low for low, _ in leaf_type.range), max(high for _, high in leaf_type.range))
+            leaf_type.range = parse_ranges(type_stmt.find_arg('range'), bounds)
+        if leaf_type.base == 'string':
+            if type_stmt.find('length') is not None:
+                leaf_type.length = parse_ranges(type_stmt.find_arg('length'), LENGTH_RANGE)
+            for pattern in type_stmt.find_all('pattern'):
+                if pattern.find_arg('modifier') == 'invert-match':
+                    warn(pattern, 'the invert-match pattern is not checked')
+                    continue
+                leaf_type.patterns.append(pattern.arg)
+        return leaf_type
+
+    def select(self, tops, includes):
+        """
+        :param tops: the [module:]name of the top nodes of the generated module
+        :param includes: the paths of the subtrees to keep, every subtree if empty
+        :return: the top SchemaNodes, the nodes out of the included subtrees are removed
+        """
+        nodes = []
+        for top in tops:
+            module_name, name = split_name(top)
+            node = self.root.children.get(name)
+            if node is None or module_name not in (None, node.module_name):
+                raise YangError('the top node %s is not found' % top)
+            nodes.append(node)
+        if includes:
+            includes = [include.rstrip('/') for include in includes]
+            for node in nodes:
+                prune(node, includes)
+        return nodes
+
+
+def prune(node, includes):
+    for name, child in list(node.children.items()):
+        if any(include == child.path or include.startswith(child.path + '/') for include in includes):
+            prune(child, includes)
+        elif not any(child.path.startswith(include + '/') for include in includes):
+            del node.children[name]
+
+
+def walk(nodes):
+    """The nodes and their descendants, depth first"""
+    for node in nodes:
+        yield node
+        for descendant in walk(node.children.values()):
+            yield descendant
+
+
+def sample_value(node):
+    """The example value of a leaf"""
+    leaf_type = node.type
+    if leaf_type.base == 'boolean':
+        return 'true'
+    if leaf_type.base == 'int':
+        return str(leaf_type.range[0][0])
+    if leaf_type.base == 'enumeration' and leaf_type.choices:
+        return leaf_type.choices[0]
+    return node.default or node.name
+
+
+class ModuleGenerator(object):
+    """Build the schema fields and the module source of the selected nodes"""
+
+    def __init__(self, schema, name, tops):
+        self.schema = schema
+        self.name = name
+        self.tops = tops
+
+    def argument_spec(self, nodes):
+        spec = OrderedDict()
+        for node in nodes:
+            if node.keyword == 'leaf':
+                if node.type.base == 'enumeration':
+                    spec[node.name] = OrderedDict([('choices', node.type.choices), ('required', False)])
+                else:
+                    spec[node.name] = OrderedDict([('type', ARGUMENT_TYPES.get(node.type.base, 'str')),
+                                                   ('required', False)])
+            elif node.has_list:
+                # the entries of the lists are given as [ { entry_name: { ... } } ]
+                spec[node.name] = OrderedDict([('type', 'list'),
+                                               ('options', self.argument_spec(node.children.values())),
+                                               ('elements', 'dict')])
+            else:
+                spec[node.name] = OrderedDict([('type', 'dict'),
+                                               ('options', self.argument_spec(node.children.values()))])
+        return spec
+
+    def leaf_info(self, nodes):
+        infos = OrderedDict()
+        for node in nodes:
+            if node.keyword != 'leaf':
+                infos[node.name] = self.leaf_info(node.children.values())
+                continue
+            leaf_type = node.type
+            info = OrderedDict([('default', node.default), ('pattern', leaf_type.patterns),
+                                ('type', leaf_type.base)])
+            if leaf_type.base == 'int':
+                info['range'] = leaf_type.range
+            elif leaf_type.base == 'string':
+                info['length'] = leaf_type.length
+            elif leaf_type.base == 'enumeration':
+                info['choices'] = leaf_type.choices
+            info['required'] = False
+            info['key'] = node.key
+            if node.mandatory:
+                info['mandatory'] = True
+            infos[node.name] = info
+        return infos
+
+    def namespaces(self):
+        """The xmlns info list, parents first"""
+        namespaces = []
+        level = list(self.tops)
+        while level:
+            for node in level:
+                parent_module = node.parent.module_name if node.parent is not self.schema.root else None
+                xmlns = ''
+                if node.module_name != parent_module:
+                    xmlns = '@xmlns="%s"' % self.schema.modules[node.module_name].find_arg('namespace')
+                value = sample_value(node) if node.keyword == 'leaf' else ''
+                namespaces.append(OrderedDict([(node.path, [value, xmlns, node.path])]))
+            level = [child for node in level for child in node.children.values()]
+        return namespaces
+
+    def schema_data(self):
+        return OrderedDict([
+            ('argument_spec', self.argument_spec(self.tops)),
+            ('leaf_info', self.leaf_info(self.tops)),
+            ('namespaces', self.namespaces()),
+            ('business_tag', [node.name for node in self.tops]),
+            ('xml_head', '<config>'),
+            ('xml_tail', '</config>'),
+            ('key_list', [node.path for node in walk(self.tops) if node.key]),
+        ])
+
+    def example(self):
+        lines = [EXAMPLE_HEAD.format(name=self.name).rstrip('\n')]
+
+        def add_nodes(nodes, indent, first_prefix=None):
+            for index, node in enumerate(nodes):
+                prefix = first_prefix if index == 0 and first_prefix else ' ' * indent
+                if node.keyword == 'leaf':
+                    value = sample_value(node)
+                    if node.type.base == 'string':
+                        value = '"%s"' % value
+                    lines.append('%s%s: %s' % (prefix, node.name, value))
+                    continue
+                lines.append('%s%s: ' % (prefix, node.name))
+                children = list(node.children.values())
+                if node.has_list:
+                    # every child of a list holder is written as an item of the list
+                    for child in children:
+                        add_nodes([child], indent + 4, ' ' * (indent + 2) + '- ')
+                else:
+                    add_nodes(children, indent + 2)
+
+        add_nodes(self.tops, 6)
+        return '\n'.join(lines) + '\n' + EXAMPLE_TAIL
+
+    def documentation(self):
+        module = self.schema.modules[self.tops[0].module_name]
+        description = module.find_arg('description', self.name).strip().split('\n')
+        lines = [
+            '---',
+            'module:%s' % self.name,
+            'version_added: "2.6"',
+            'short_description: ' + ('\n' + ' ' * 19).join(description),
+            'description:',
+            '    - ' + ('\n' + ' ' * 6).join(description),
+            'author:ansible_team@huawei',
+            'time:%s' % datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'options:',
+            OPERATION_TYPE_DOCUMENTATION.rstrip('\n'),
+        ]
+
+        def add_node(node, indent):
+            pad = ' ' * indent
+            lines.append('%s%s:' % (pad, node.name))
+            lines.append('%s    description:' % pad)
+            description = (node.description or node.name).strip().split('\n')
+            lines.append('%s        - ' % pad + ('\n%s          ' % pad).join(description))
+            if node.when:
+                lines.append('%s    when: %s' % (pad, WHEN_DOCUMENTATION))
+            lines.append('%s    required:%s' % (pad, node.key or node.mandatory))
+            if node.keyword != 'leaf':
+                for child in node.children.values():
+                    add_node(child, indent + 4)
+                return
+            if node.key:
+                lines.append('%s    key:True' % pad)
+            if node.mandatory:
+                lines.append('%s    mandatory:True' % pad)
+            if node.default is not None:
+                lines.append('%s    default:%s' % (pad, node.default))
+            if node.type.patterns:
+                lines.append('%s    pattern:%s' % (pad, node.type.patterns))
+            lines.append('%s    type:%s' % (pad, ARGUMENT_TYPES.get(node.type.base, 'str')))
+            if node.type.range:
+                lines.append('%s    range:%s' % (pad, node.type.range))
+            if node.type.length:
+                lines.append('%s    length:%s' % (pad, node.type.length))
+            if node.type.base == 'boolean':
+                lines.append("%s    choices:['true', 'false']" % pad)
+            elif node.type.choices:
+                lines.append('%s    choices:%s' % (pad, node.type.choices))
+
+        for node in self.tops:
+            add_node(node, 4)
+        return '\n'.join(lines) + '\n'
+
+    def module_source(self):
+        return '\n'.join([
+            LICENSE_HEADER,
+            MODULE_IMPORTS.format(name=schema_name(self.name + '.py')),
+            ANSIBLE_METADATA,
+            '',
+            'EXAMPLE = """\n%s\n\n"""\n\n' % self.example(),
+            'DOCUMENTATION = """\n%s\n"""\n\n' % self.documentation(),
+            USER_CHECK,
+            '',
+            MODULE_MAIN,
+        ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('yang_files', nargs='+', help='the YANG modules and submodules')
+    parser.add_argument('--name', required=True, help='the name of the generated module')
+    parser.add_argument('--top', action='append', default=[],
+                        help='[module:]name of a top node of the module, the top nodes of the first file by default')
+    parser.add_argument('--include', action='append', default=[],
+                        help='the path of a subtree to keep, e.g. /routing/srv6, every subtree by default')
+    parser.add_argument('--state', action='store_true', help='keep the config false nodes')
+    parser.add_argument('--output-dir', default='.', help='where the module is written')
+    parser.add_argument('--schemas-dir', default=SCHEMAS_DIR, help='where the schema artifact is written')
+    args = parser.parse_args()
+
+    statements = [parse_file(path) for path in args.yang_files]
+    schema = YangSchema(statements, include_state=args.state)
+    tops = args.top
+    if not tops:
+        first = statements[0]
+        tops = [child.name for child in schema.root.children.values() if child.stmt.top is first]
+    generator = ModuleGenerator(schema, args.name, schema.select(tops, args.include))
+
+    schema_module = load_schema_module()
+    module_path = os.path.join(args.output_dir, args.name + '.py')
+    artifact_path = os.path.join(args.schemas_dir, schema_name(module_path) + '.py')
+    with open(artifact_path, 'w') as f:
+        f.write(schema_module.dump_schema(schema_name(module_path), generator.schema_data()))
+    with open(module_path, 'w') as f:
+        f.write(generator.module_source())
+    print('%s -> %s' % (module_path, artifact_path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Parse YANG (RFC 7950) files into statement trees.
+
+Only the generic statement grammar is parsed here:
+
+    keyword [argument] ( ";" / "{" *statement "}" )
+
+the meaning of the statements is left to yang_generator.py.
+"""
+import re
+
+_ESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\'}
+_UNQUOTED_END = re.compile(r'[\s;{}]|//|/\*')
+
+
+class YangSyntaxError(Exception):
+    def __init__(self, filename, lineno, msg):
+        super(YangSyntaxError, self).__init__('%s:%d: %s' % (filename, lineno, msg))
+
+
+class Statement(object):
+    """A YANG statement and its substatements"""
+
+    def __init__(self, keyword, arg, parent, filename, lineno):
+        self.keyword = keyword
+        self.arg = arg
+        self.parent = parent
+        self.filename = filename
+        self.lineno = lineno
+        self.substmts = []
+
+    def __repr__(self):
+        return '<Statement %s %s %s:%d>' % (self.keyword, self.arg, self.filename, self.lineno)
+
+    @property
+    def top(self):
+        """The module or submodule statement"""
+        stmt = self
+        while stmt.parent is not None:
+            stmt = stmt.parent
+        return stmt
+
+    def find(self, keyword):
+        for stmt in self.substmts:
+            if stmt.keyword == keyword:
+                return stmt
+        return None
+
+    def find_all(self, keyword):
+        return [stmt for stmt in self.substmts if stmt.keyword == keyword]
+
+    def find_arg(self, keyword, default=None):
+        stmt = self.find(keyword)
+        return stmt.arg if stmt is not None else default
+
+
+class Tokenizer(object):
+    """Split the YANG text into (token, lineno), quoted strings are already unquoted"""
+
+    def __init__(self, text, filename):
+        self.text = text
+        self.filename = filename
+        self.pos = 0
+        self.lineno = 1
+
+    def error(self, msg):
+        raise YangSyntaxError(self.filename, self.lineno, msg)
+
+    def advance(self, end):
+        self.lineno += self.text.count('\n', self.pos, end)
+        self.pos = end
+
+    def skip_blanks(self):
+        text = self.text
+        while self.pos < len(text):
+            if text[self.pos].isspace():
+                self.advance(self.pos + 1)
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.advance(len(text) if end == -1 else end)
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos)
+                if end == -1:
+                    self.error('unterminated comment')
+                self.advance(end + 2)
+            else:
+                return
+
+    def quoted_string(self):
+        text = self.text
+        quote = text[self.pos]
+        # the column of the opening quote, used to trim the continuation lines
+        column = self.pos - text.rfind('\n', 0, self.pos) - 1
+        start = self.pos + 1
+        if quote == "'":
+            end = text.find("'", start)
+            if end == -1:
+                self.error('unterminated string')
+            self.advance(end + 1)
+            return text[start:end]
+        chars = []
+        i = start
+        while i < len(text):
+            char = text[i]
+            if char == '\\' and i + 1 < len(text):
+                chars.append(_ESCAPES.get(text[i + 1], '\\' + text[i + 1]))
+                i += 2
+                continue
+            if char == '"':
+                self.advance(i + 1)
+                return self.trim_lines(''.join(chars), column)
+            chars.append(char)
+            i += 1
+        self.error('unterminated string')
+
+    @staticmethod
+    def trim_lines(value, column):
+        """Remove the indentation of the continuation lines of a double quoted string"""
+        lines = value.split('\n')
+        trimmed = [lines[0].rstrip()]
+        for line in lines[1:]:
+            indent = len(line) - len(line.lstrip(' \t'))
+            trimmed.append(line[min(indent, column + 1):].rstrip())
+        return '\n'.join(trimmed)
+
+    def tokens(self):
+        text = self.text
+        while True:
+            self.skip_blanks()
+            if self.pos >= len(text):
+                return
+            lineno = self.lineno
+            char = text[self.pos]
+            if char in '{};':
+                self.advance(self.pos + 1)
+                yield char, lineno
+            elif char in '"\'':
+                value = self.quoted_string()
+                # "abc" + "def"
+                while True:
+                    self.skip_blanks()
+                    if not text.startswith('+', self.pos):
+                        break
+                    self.advance(self.pos + 1)
+                    self.skip_blanks()
+                    if self.pos >= len(text) or text[self.pos] not in '"\'':
+                        self.error('a quoted string is expected after +')
+                    value += self.quoted_string()
+                yield ('"', value), lineno
+            else:
+                match = _UNQUOTED_END.search(text, self.pos)
+                end = match.start() if match else len(text)
+                value = text[self.pos:end]
+                self.advance(end)
+                yield ('"', value), lineno
+
+
+def parse_text(text, filename='<string>'):
+    """
+    :param text: the content of a YANG file
+    :return: the module or submodule Statement
+    """
+    tokenizer = Tokenizer(text, filename)
+    tokens = tokenizer.tokens()
+    top = None
+    stack = []
+    for token, lineno in tokens:
+        if token == '}':
+            if not stack:
+                raise YangSyntaxError(filename, lineno, 'unexpected }')
+            stack.pop()
+            continue
+        if not isinstance(token, tuple):
+            raise YangSyntaxError(filename, lineno, 'a keyword is expected, got %s' % token)
+        keyword = token[1]
+        arg = None
+        token, next_lineno = next(tokens, (None, lineno))
+        if isinstance(token, tuple):
+            arg = token[1]
+            token, next_lineno = next(tokens, (None, lineno))
+        parent = stack[-1] if stack else None
+        stmt = Statement(keyword, arg, parent, filename, lineno)
+        if parent is not None:
+            parent.substmts.append(stmt)
+        elif top is None:
+            top = stmt
+        else:
+            raise YangSyntaxError(filename, lineno, 'only one module is allowed in a file')
+        if token == '{':
+            stack.append(stmt)
+        elif token != ';':
+            raise YangSyntaxError(filename, next_lineno, '; or { is expected after %s' % keyword)
+    if stack:
+        raise YangSyntaxError(filename, tokenizer.lineno, 'unterminated %s' % stack[-1].keyword)
+    if top is None or top.keyword not in ('module', 'submodule'):
+        raise YangSyntaxError(filename, 1, 'module or submodule is expected')
+    return top
+
+
+def parse_file(filename):
+    with open(filename) as f:
+        return parse_text(f.read(), filename)